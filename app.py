@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tour Auto Publisher v10.0 - API 기반 캠핑장 시스템"""
 
+import os
 import logging
 from pathlib import Path
 from dotenv import load_dotenv
@@ -22,95 +23,129 @@ logger = logging.getLogger(__name__)
 
 
 def run_publish():
-    """메인 발행 함수 v10.0"""
+    """메인 발행 함수 v10.0 - 중단된 작업이 있으면 마지막 단계부터 재개"""
     logger.info("=" * 50)
     logger.info("TAP v10.0 시작")
     logger.info("=" * 50)
     
-    from core.blogger_publisher import load_publisher
-    from core.ai_writer import load_ai_writer
-    from core.title_generator import load_title_generator
-    from core.camping_data import get_camping_data, get_random_theme
-    from core.content_processor import process_content
-    from core.config import ANGLE_MAP, DEFAULT_LABEL
+    from core.pipeline import run_once
+    from core.metrics import registry, summarize, write_run_summary
     
-    publisher = load_publisher()
-    writer = load_ai_writer()
-    title_gen = load_title_generator()
-    
-    if not writer:
+    if not os.getenv('OPENAI_API_KEY'):
         logger.error("OPENAI_API_KEY 없음")
         return
     
-    # 1. 테마 + 데이터
-    theme = get_random_theme()
-    logger.info(f"[1] 테마: {theme}")
+    before = registry.snapshot()
+    ok = run_once()
     
-    data = get_camping_data(theme)
-    if not data:
-        logger.warning(f"'{theme}' 데이터 없음, 글램핑 폴백")
-        data = get_camping_data('글램핑')
+    summary = summarize(before)
+    path = write_run_summary(summary, log_dir)
+    logger.info(f"단계별 소요: {summary['stages']} (요약: {path})")
+    if summary['circuits']:
+        logger.warning(f"서킷 상태 변화: {summary['circuits']}")
     
-    if not data:
-        logger.error("데이터 없음")
+    if not ok:
         return
     
-    items = data['items']
-    display_region = data['display_region']
-    sigungu = data['sigungu']
+    logger.info("=" * 50)
+    logger.info("작업 완료!")
+    logger.info("=" * 50)
+
+
+def run_worker(workers: int = 1):
+    """대기 중인 작업을 병렬 워커로 모두 처리"""
+    from core.pipeline import drain
+    
+    done = drain(workers)
+    logger.info(f"워커 종료: {done}건 발행")
+
+
+def run_daemon():
+    """데몬 모드 - 설정된 시간마다 발행 + /metrics 엔드포인트 노출"""
+    import time
+    import yaml
+    import schedule
+    from core.metrics import start_http_server
     
-    logger.info(f"[2] 지역: {display_region} {sigungu}")
-    logger.info(f"[3] 장소: {len(items)}개")
-    for item in items:
-        logger.info(f"    - {item['title']}")
+    with open(Path(__file__).parent / 'config' / 'settings.yaml', 'r', encoding='utf-8') as f:
+        settings = yaml.safe_load(f) or {}
+    times = settings.get('schedule', {}).get('times', ['07:00', '14:00', '20:00'])
     
-    # 2. 제목
-    title = title_gen.generate(display_region, theme, len(items), sigungu=sigungu)
-    logger.info(f"[4] 제목: {title}")
+    start_http_server(int(os.getenv('METRICS_PORT', '9108')))
+    for at in times:
+        schedule.every().day.at(at).do(run_publish)
+    logger.info(f"데몬 시작 - 발행 시간: {', '.join(times)}")
     
-    # 3. AI 글 생성
-    angle = ANGLE_MAP.get(theme, theme)
-    logger.info(f"[5] AI 생성 중... (앵글: {angle})")
+    while True:
+        schedule.run_pending()
+        time.sleep(30)
+
+
+def enqueue_jobs(count: int = 1):
+    """발행 작업 등록 (실행은 worker가 담당)"""
+    from core.job_queue import load_job_queue
     
-    try:
-        raw_content = writer.generate_full_content(
-            items=items,
-            theme=theme,
-            region=f"{display_region} {sigungu}",
-            angle=angle
-        )
-    except Exception as e:
-        logger.error(f"AI 생성 실패: {e}")
-        return
+    queue = load_job_queue()
+    for _ in range(count):
+        queue.enqueue()
+
+
+def sync_courses():
+    """두루누비 걷기/자전거 코스 전체를 로컬 저장소로 강제 동기화"""
+    from core.course_store import load_course_store, COURSE_TYPES
     
-    # 4. 후처리
-    final_content = process_content(raw_content, items, display_region, theme)
-    logger.info(f"[6] 후처리 완료 ({len(final_content)}자)")
+    store = load_course_store()
+    for course_type in COURSE_TYPES:
+        store.sync(course_type, force=True)
+
+
+def build_catalogue():
+    """data/의 CSV를 합쳐 오프라인 장소 카탈로그 재생성"""
+    from core.catalogue import build_catalogue as build
     
-    # 5. 발행
-    labels = [DEFAULT_LABEL, theme, display_region]
-    logger.info(f"[7] 발행 중... (라벨: {labels})")
+    for dataset, stats in build().items():
+        logger.info(f"{dataset}: {stats['rows']}건 (연결 {stats['matched']}건)")
+
+
+def refresh_data():
+    """data/에 새로 들어온 날짜별 CSV의 변경분만 카탈로그에 반영"""
+    from core.catalogue import load_catalogue
     
-    try:
-        result = publisher.create_post(
-            title=title,
-            content=final_content,
-            labels=labels,
-            is_draft=False
-        )
-        logger.info(f"[8] 발행 완료: {result.get('url', 'URL 없음')}")
-    except Exception as e:
-        logger.error(f"발행 실패: {e}")
-        return
+    stats = load_catalogue().refresh()
+    if not stats:
+        logger.info("바뀐 데이터셋 없음")
+    for dataset, s in stats.items():
+        logger.info(f"{dataset}: {s['rows']}행 (추가 {s['added']}, 변경 {s['changed']}, 삭제 {s['removed']})")
+
+
+def plan_calendar(days: int = 3):
+    """며칠치 콘텐츠 캘린더(소스/테마/지역/시리즈 배정) 생성"""
+    from core.content_planner import load_content_planner
     
-    logger.info("=" * 50)
-    logger.info("작업 완료!")
-    logger.info("=" * 50)
+    planner = load_content_planner()
+    planner.plan(days)
+    logger.info(f"남은 슬롯: {planner.remaining()}개")
 
 
 if __name__ == "__main__":
     import sys
-    if len(sys.argv) > 1 and sys.argv[1] == "run":
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    if command == "run":
         run_publish()
+    elif command == "worker":
+        run_worker(count)
+    elif command == "enqueue":
+        enqueue_jobs(count)
+    elif command == "daemon":
+        run_daemon()
+    elif command == "sync-courses":
+        sync_courses()
+    elif command == "build-catalogue":
+        build_catalogue()
+    elif command == "refresh-data":
+        refresh_data()
+    elif command == "plan":
+        plan_calendar(int(sys.argv[2]) if len(sys.argv) > 2 else int(os.getenv('PLAN_DAYS', '3')))
     else:
-        print("사용법: python app.py run")
+        print("사용법: python app.py run | worker [워커 수] | enqueue [작업 수] | daemon | sync-courses | build-catalogue | refresh-data | plan [일수]")
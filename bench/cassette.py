@@ -0,0 +1,154 @@
+"""녹화된 API 응답(카세트) 재생 - core.http_client._send 대체
+
+카세트 형식 (bench/cassettes/<service>.json):
+    {
+      "service": "photo_gallery",
+      "interactions": [
+        {"method": "GET", "match": {"keyword": "가평군 캠핑"},
+         "status": 200, "headers": {...}, "json": {...}}
+      ]
+    }
+
+match의 모든 키가 요청 파라미터와 같으면 해당 응답을 재생하고,
+match가 비어 있는 항목은 기본 응답으로 쓰입니다.
+"""
+
+import json
+import time
+import base64
+import threading
+from pathlib import Path
+import requests
+from core import http_client
+from core.metrics import record_api_call
+
+CASSETTE_DIR = Path(__file__).parent / 'cassettes'
+
+
+class Cassette:
+
+    def __init__(self, data: dict):
+        self.service = data['service']
+        self.interactions = data.get('interactions', [])
+
+    @classmethod
+    def load(cls, service: str, cassette_dir: Path = CASSETTE_DIR):
+        with open(cassette_dir / f'{service}.json', 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def find(self, method: str, params: dict) -> dict:
+        params = {k: str(v) for k, v in (params or {}).items()}
+        default = None
+        for it in self.interactions:
+            if it.get('method', 'GET') != method:
+                continue
+            match = it.get('match') or {}
+            if not match:
+                default = default or it
+            elif all(params.get(k) == str(v) for k, v in match.items()):
+                return it
+        return default
+
+
+def _build_response(url: str, interaction: dict) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = interaction.get('status', 200)
+    resp.url = url
+    resp.headers.update(interaction.get('headers', {}))
+    if 'json' in interaction:
+        resp._content = json.dumps(interaction['json'], ensure_ascii=False).encode('utf-8')
+        resp.headers.setdefault('Content-Type', 'application/json')
+    elif 'body_file' in interaction:
+        resp._content = (CASSETTE_DIR / interaction['body_file']).read_bytes()
+    elif 'body_b64' in interaction:
+        resp._content = base64.b64decode(interaction['body_b64'])
+    else:
+        resp._content = b''
+    return resp
+
+
+class ReplayTransport:
+    """서비스별 카세트를 지연 시간과 함께 재생"""
+
+    def __init__(self, services: list, latency: float = 0.0, latencies: dict = None,
+                 cassette_dir: Path = CASSETTE_DIR):
+        """
+        Args:
+            latency: 모든 호출에 적용할 기본 지연(초)
+            latencies: 서비스별 지연(초) - 기본값보다 우선
+        """
+        self.cassettes = {s: Cassette.load(s, cassette_dir) for s in services}
+        self.latency = latency
+        self.latencies = latencies or {}
+        self.calls = {}
+        self._lock = threading.Lock()
+        self._original = None
+
+    def request(self, service, method, url, session=None, **kwargs):
+        with self._lock:
+            self.calls[service] = self.calls.get(service, 0) + 1
+
+        start = time.monotonic()
+        delay = self.latencies.get(service, self.latency)
+        if delay:
+            time.sleep(delay)
+
+        cassette = self.cassettes.get(service)
+        interaction = cassette.find(method, kwargs.get('params')) if cassette else None
+        if interaction is None:
+            record_api_call(service, 'error', time.monotonic() - start)
+            raise requests.ConnectionError(f"카세트에 없는 요청: {service} {method} {url}")
+
+        resp = _build_response(url, interaction)
+        record_api_call(service, resp.status_code, time.monotonic() - start)
+        return resp
+
+    def install(self):
+        self._original = http_client._send
+        http_client._send = self.request
+        return self
+
+    def uninstall(self):
+        if self._original:
+            http_client._send = self._original
+            self._original = None
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc):
+        self.uninstall()
+
+
+class Recorder:
+    """실제 API 응답을 카세트로 녹화 (라이브 키가 있을 때 record.py에서 사용)"""
+
+    def __init__(self, cassette_dir: Path = CASSETTE_DIR):
+        self.cassette_dir = cassette_dir
+        self.interactions = {}
+        self._original = None
+
+    def request(self, service, method, url, session=None, **kwargs):
+        resp = self._original(service, method, url, session=session, **kwargs)
+        params = {k: v for k, v in (kwargs.get('params') or {}).items() if k != 'serviceKey'}
+        entry = {'method': method, 'match': params, 'status': resp.status_code}
+        if 'json' in resp.headers.get('Content-Type', ''):
+            entry['json'] = resp.json()
+        else:
+            entry['body_b64'] = base64.b64encode(resp.content).decode('ascii')
+        self.interactions.setdefault(service, []).append(entry)
+        return resp
+
+    def install(self):
+        self._original = http_client._send
+        http_client._send = self.request
+        return self
+
+    def save(self):
+        self.cassette_dir.mkdir(parents=True, exist_ok=True)
+        for service, interactions in self.interactions.items():
+            path = self.cassette_dir / f'{service}.json'
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'service': service, 'interactions': interactions}, f, ensure_ascii=False)
+        if self._original:
+            http_client._send = self._original
@@ -0,0 +1,98 @@
+"""CSV 적재 벤치마크 - 전체 read_csv와 청크(usecols/dtype/조건) 적재의 최대 메모리와 처리량 비교
+
+    python -m bench.ingest                 # 야영장 등록 현황을 200,000행으로 늘려 측정
+    python -m bench.ingest --rows 1000000
+
+측정마다 새 프로세스에서 적재하고, 적재 전 RSS 대비 최대 RSS 증가분을 잽니다
+(pandas 파서는 tracemalloc에 잡히지 않는 메모리를 씀).
+"""
+
+import os
+import sys
+import csv
+import time
+import json
+import argparse
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+FAMILY_STEM = '한국관광공사 전국 야영장 등록 현황'
+MODES = ('full', 'chunked', 'glamping')  # glamping: 청크 적재 + 글램핑 테마 조건
+
+
+def _rss_kb() -> int:
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def _make_csv(data_dir: Path, rows: int) -> Path:
+    """원본 행을 반복해 rows행짜리 파일 생성 (인코딩은 원본과 같게)"""
+    from core.datasets import DatasetRegistry, detect_encoding
+
+    source = DatasetRegistry(ROOT / 'data').latest('camping')
+    encoding = detect_encoding(source)
+    with open(source, 'r', encoding=encoding, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        records = list(reader)
+    path = data_dir / f'{FAMILY_STEM}_20991231.csv'
+    with open(path, 'w', encoding=encoding, newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for i in range(rows):
+            writer.writerow(records[i % len(records)])
+    return path
+
+
+def _child(mode: str, data_dir: str):
+    import pandas as pd
+    from core.datasets import DatasetRegistry
+    from core.data_loader.camping import CAMPING_COLUMNS, CAMPING_DTYPE, CAMPING_NUMERIC, camping_predicate
+
+    registry = DatasetRegistry(data_dir)
+    path, encoding = registry.locate('camping')
+    before = _rss_kb()
+    started = time.perf_counter()
+    if mode == 'full':
+        frame = pd.read_csv(path, encoding=encoding, on_bad_lines='skip')
+        frame = frame[frame['야영장명'].notna() & frame['도'].notna()]
+    else:
+        themes = ['글램핑'] if mode == 'glamping' else None
+        frame = registry.load_frame('camping', CAMPING_COLUMNS, dtype=CAMPING_DTYPE, numeric=CAMPING_NUMERIC,
+                                    predicate=camping_predicate(themes))
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'seconds': elapsed, 'kept': len(frame), 'columns': len(frame.columns),
+                      'peak_kb': peak - before, 'frame_kb': int(frame.memory_usage(deep=True).sum() // 1024)}))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='CSV 적재 메모리/처리량 벤치마크')
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'DATA_DIR'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(*args.child)
+        return 0
+
+    data_dir = Path(tempfile.mkdtemp(prefix='tap-ingest-'))
+    env = dict(os.environ, BASE_PATH=str(data_dir))
+    os.environ['BASE_PATH'] = str(data_dir)  # core.database가 벤치용 임시 DB를 쓰도록
+    path = _make_csv(data_dir, args.rows)
+    print(f"{path.name}: {args.rows:,}행, {path.stat().st_size / 1024 / 1024:.1f} MB")
+
+    for mode in MODES:
+        out = subprocess.run([sys.executable, '-m', 'bench.ingest', '--child', mode, str(data_dir)],
+                             cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        print(f"{mode:<8} 최대 +{result['peak_kb'] / 1024:>7.1f} MB   결과 {result['frame_kb'] / 1024:>6.1f} MB "
+              f"({result['kept']:,}행 x {result['columns']}열)   {args.rows / result['seconds']:>10,.0f}행/초")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
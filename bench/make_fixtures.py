@@ -0,0 +1,202 @@
+"""오프라인 카세트 생성 - data/의 CSV로 API 응답 형태의 픽스처를 만듭니다.
+
+라이브 키로 녹화한 카세트(record.py)가 있으면 그쪽을 우선 사용하세요.
+이 스크립트는 키 없이도 벤치마크를 돌릴 수 있도록 같은 모양의 응답을 합성합니다.
+
+    python -m bench.make_fixtures
+"""
+
+import csv
+import json
+import random
+from pathlib import Path
+import yaml
+from bench.cassette import CASSETTE_DIR
+
+ROOT = Path(__file__).parent.parent
+CAMPING_CSV = ROOT / 'data' / '한국관광공사 전국 야영장 등록 현황_20260106.csv'
+SAMPLE_IMAGE = '../../cache/images/127bf68cbb28d8b9bb9d7088de82ce46.webp'
+
+INTROS = [
+    '계곡 옆에 자리한 조용한 캠핑장으로 가족 단위 방문객에게 인기가 많습니다.',
+    '바다가 내려다보이는 전망과 넓은 사이트가 특징인 오토캠핑장입니다.',
+    '산속 깊은 곳에 위치해 별 보기 좋은 힐링 캠핑장입니다.',
+    '사계절 운영하며 개별 화장실과 샤워실을 갖춘 글램핑장입니다.',
+]
+
+TRAIL_SERIES = ['남파랑길', '서해랑길', '해파랑길', '동해랑길', 'DMZ평화의길', '지리산둘레길', '제주올레']
+BIKE_SERIES = ['국토종주 자전거길', '동해안 자전거길', '섬진강 자전거길', '영산강 자전거길', '북한강 자전거길']
+
+
+def _envelope(items: list, total: int = None) -> dict:
+    return {
+        'response': {
+            'header': {'resultCode': '0000', 'resultMsg': 'OK'},
+            'body': {
+                'items': {'item': items} if items else '',
+                'numOfRows': len(items),
+                'pageNo': 1,
+                'totalCount': total if total is not None else len(items),
+            }
+        }
+    }
+
+
+def _write(service: str, interactions: list):
+    CASSETTE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CASSETTE_DIR / f'{service}.json'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'service': service, 'interactions': interactions}, f, ensure_ascii=False)
+    print(f"{path.name}: {path.stat().st_size:,} bytes")
+
+
+def _fake_coord(do_name: str, sigungu: str, i: int) -> tuple:
+    """(mapX, mapY) - 시군구마다 고정된 임의 중심 주변에 흩뿌림 (실제 위치 아님, 본 rng와 별개)"""
+    anchor = random.Random(f'{do_name} {sigungu}')
+    lat, lon = anchor.uniform(34.5, 38.0), anchor.uniform(126.5, 129.3)
+    jitter = random.Random(i)
+    return f'{lon + jitter.uniform(-0.1, 0.1):.7f}', f'{lat + jitter.uniform(-0.08, 0.08):.7f}'
+
+
+def make_gocamping(rng: random.Random, rows: int = 500):
+    with open(CAMPING_CSV, 'r', encoding='cp949', newline='') as f:
+        records = [r for r in csv.DictReader(f) if r.get('도') and r.get('시군구')]
+
+    step = max(1, len(records) // rows)
+    items = []
+    for i, r in enumerate(records[::step][:rows]):
+        items.append({
+            'contentId': str(100000 + i),
+            'facltNm': r['야영장명'].strip(),
+            'lineIntro': '',
+            'intro': rng.choice(INTROS),
+            'addr1': r['주소'].strip(),
+            'doNm': r['도'],
+            'sigunguNm': r['시군구'],
+            'tel': f"0{rng.randint(31, 64)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            'homepage': '',
+            'induty': '글램핑' if r['주요시설 글램핑'] not in ('', '0') else '일반야영장',
+            'glampInnerFclty': '침대,TV,에어컨' if r['주요시설 글램핑'] not in ('', '0') else '',
+            'caravInnerFclty': '침대,냉장고' if r['주요시설 카라반'] not in ('', '0') else '',
+            'animalCmgCl': '가능' if r['반려동물출입'].startswith('가능') else '불가능',
+            'sbrsCl': r['부대시설'],
+            'themaEnvrnCl': r['테마환경'],
+            'firstImageUrl': f"https://gocamping.or.kr/upload/camp/{100000 + i}/thumb/thumb_720_{i:04d}.jpg"
+                             if rng.random() < 0.8 else '',
+            'createdtime': '2024-01-01 00:00:00',
+            'modifiedtime': '2025-12-01 00:00:00',
+        })
+        items[-1]['mapX'], items[-1]['mapY'] = _fake_coord(r['도'], r['시군구'], i)
+    _write('gocamping', [{'method': 'GET', 'match': {}, 'status': 200, 'json': _envelope(items, len(records))}])
+
+
+def make_photo_gallery(rng: random.Random):
+    items = []
+    for i in range(10):
+        items.append({
+            'galContentId': str(2900000 + i),
+            'galTitle': f'캠핑 풍경 {i + 1}',
+            'galWebImageUrl': f'http://tong.visitkorea.or.kr/cms2/website/{i:02d}/{2900000 + i}.jpg',
+            'galPhotographyMonth': f'20{rng.randint(15, 25)}{rng.randint(1, 12):02d}',
+            'galPhotographyLocation': '',
+            'galPhotographer': '한국관광공사',
+        })
+    _write('photo_gallery', [{'method': 'GET', 'match': {}, 'status': 200, 'json': _envelope(items)}])
+
+
+def make_naver_image(rng: random.Random):
+    items = [{
+        'title': f'<b>캠핑장</b> 사진 {i + 1}',
+        'link': f'http://blogthumb.pstatic.net/sample/{i:03d}.jpg',
+        'thumbnail': f'https://search.pstatic.net/thumb/{i:03d}',
+        'sizeheight': str(rng.choice([300, 480, 720, 1080])),
+        'sizewidth': str(rng.choice([400, 640, 1024, 1920])),
+    } for i in range(5)]
+    _write('naver_image', [{
+        'method': 'GET', 'match': {}, 'status': 200,
+        'json': {'total': len(items), 'start': 1, 'display': len(items), 'items': items}
+    }])
+
+
+def make_durunubi(rng: random.Random, rows: int = 600, page_size: int = 200):
+    with open(ROOT / 'config' / 'regions.yaml', 'r', encoding='utf-8') as f:
+        cities = [c for cs in yaml.safe_load(f).values() for c in cs]
+
+    interactions = []
+    for brd_div, series in (('1', TRAIL_SERIES), ('2', BIKE_SERIES)):
+        items = []
+        for i in range(rows):
+            name = rng.choice(series)
+            items.append({
+                'crsIdx': f'T_CRS_{brd_div}{i:05d}',
+                'routeIdx': f'T_ROUTE_{rng.randint(1, 40)}',
+                'crsKorNm': f'{name} {i % 90 + 1}코스',
+                'crsDstnc': str(rng.randint(5, 30)),
+                'crsLevel': str(rng.randint(1, 3)),
+                'crsSummary': f'{name} 구간의 대표 코스입니다.',
+                'crsContents': f'{name}을 따라 걷는 {i % 90 + 1}번째 코스로 해안과 마을을 지납니다.',
+                'sigun': rng.choice(cities),
+                'brdDiv': 'DNWW' if brd_div == '1' else 'DNBW',
+                'createdtime': '2023-01-01 00:00:00',
+                'modifiedtime': '2025-06-01 00:00:00',
+            })
+        for page in range(0, rows, page_size):
+            envelope = _envelope(items[page:page + page_size], rows)
+            envelope['response']['body']['pageNo'] = page // page_size + 1
+            interactions.append({'method': 'GET', 'status': 200, 'json': envelope,
+                                 'match': {'brdDiv': brd_div, 'pageNo': page // page_size + 1}})
+    _write('durunubi', interactions)
+
+
+def make_kor_service(rng: random.Random, rows: int = 250, page_size: int = 100):
+    """KorService1 - 경기(areaCode 31) 관광지 목록(페이지별) + 항목별 detailCommon1"""
+    with open(CAMPING_CSV, 'r', encoding='cp949', newline='') as f:
+        records = [r for r in csv.DictReader(f) if r.get('도', '').startswith('경기')][:rows]
+
+    items = [{
+        'contentid': str(200000 + i),
+        'contenttypeid': '12',
+        'title': r['야영장명'].strip(),
+        'addr1': r['주소'].strip(),
+        'areacode': '31',
+        'firstimage': f'http://tong.visitkorea.or.kr/cms/resource/{i:02d}/{200000 + i}_image2_1.jpg'
+                      if rng.random() < 0.7 else '',
+        'modifiedtime': '20251201000000',
+    } for i, r in enumerate(records)]
+
+    interactions = []
+    for page in range(0, len(items), page_size):
+        envelope = _envelope(items[page:page + page_size], len(items))
+        envelope['response']['body']['pageNo'] = page // page_size + 1
+        interactions.append({'method': 'GET', 'status': 200, 'json': envelope,
+                             'match': {'areaCode': 31, 'pageNo': page // page_size + 1}})
+    for item in items:
+        detail = dict(item, overview=rng.choice(INTROS), homepage='')
+        interactions.append({'method': 'GET', 'status': 200, 'json': _envelope([detail]),
+                             'match': {'contentId': item['contentid']}})
+    _write('kor_service', interactions)
+
+
+def make_images():
+    _write('image_head', [{
+        'method': 'HEAD', 'match': {}, 'status': 200,
+        'headers': {'Content-Type': 'image/jpeg', 'Content-Length': '183204', 'ETag': '"bench"'}
+    }])
+    _write('image_download', [{
+        'method': 'GET', 'match': {}, 'status': 200,
+        'headers': {'Content-Type': 'image/webp'}, 'body_file': SAMPLE_IMAGE
+    }])
+
+
+def main(seed: int = 42):
+    rng = random.Random(seed)
+    make_gocamping(rng)
+    make_photo_gallery(rng)
+    make_naver_image(rng)
+    make_durunubi(rng)
+    make_kor_service(rng)
+    make_images()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""메모리 벤치마크 - 후보 장소를 dict로 보관할 때와 Place로 보관할 때의 보유 메모리 비교
+
+    python -m bench.memory                 # 기본 20,000개
+    python -m bench.memory --count 50000
+
+고캠핑 카세트 항목을 JSON으로 다시 읽어(값마다 새 문자열 객체) count개를 만들고,
+원본 응답을 버린 뒤 남아 있는 레코드의 메모리를 tracemalloc으로 잽니다.
+"""
+
+import gc
+import json
+import argparse
+import tracemalloc
+from pathlib import Path
+
+# bench.cassette는 core.database를 임포트하므로 경로만 직접 지정
+CASSETTE_DIR = Path(__file__).parent / 'cassettes'
+
+
+def _payload(count: int) -> str:
+    with open(CASSETTE_DIR / 'gocamping.json', 'r', encoding='utf-8') as f:
+        cassette = json.load(f)
+    items = cassette['interactions'][0]['json']['response']['body']['items']['item']
+    return json.dumps([items[i % len(items)] for i in range(count)], ensure_ascii=False)
+
+
+def _as_dicts(raw: list) -> list:
+    """기존 방식 - camping_data의 결과 dict 모양"""
+    return [{
+        'title': item.get('facltNm', ''),
+        'addr': item.get('addr1', ''),
+        'do': item.get('doNm', ''),
+        'sigungu': item.get('sigunguNm', ''),
+        'overview': item.get('intro', '') or item.get('lineIntro', ''),
+        'image': item.get('firstImageUrl', ''),
+        'map_url': '',
+        'tel': item.get('tel', ''),
+        'homepage': item.get('homepage', ''),
+        'source': 'api_camping',
+    } for item in raw]
+
+
+def _as_places(raw: list) -> list:
+    from core.place import Place
+    return [Place.from_camping(item, source='api_camping') for item in raw]
+
+
+def measure(build, payload: str) -> int:
+    """원본을 버린 뒤 build 결과가 붙잡고 있는 바이트 수"""
+    gc.collect()
+    tracemalloc.start()
+    records = build(json.loads(payload))
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return retained
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='장소 레코드 메모리 벤치마크')
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    import core.place  # noqa: F401 - 임포트 비용은 측정에서 제외
+    payload = _payload(args.count)
+    results = {name: measure(build, payload) for name, build in (('dict', _as_dicts), ('place', _as_places))}
+    for name, size in results.items():
+        print(f"{name:<6} {size / 1024 / 1024:>8.2f} MB   {size / args.count:>8.1f} B/건")
+    print(f"절감: {1 - results['place'] / results['dict']:.1%}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
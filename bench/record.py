@@ -0,0 +1,30 @@
+"""라이브 API 응답을 카세트로 녹화 (TOUR_API_KEY, NAVER_CLIENT_ID/SECRET 필요)
+
+    python -m bench.record
+"""
+
+from dotenv import load_dotenv
+from bench.cassette import Recorder
+
+
+def main():
+    load_dotenv()
+    from core.camping_api import load_camping_client
+    from core.photo_api import load_photo_client
+    from core.naver_image_api import load_naver_image_api
+    from core.durunubi_api import load_durunubi_client
+
+    recorder = Recorder().install()
+    try:
+        load_camping_client().get_campsite_list(num_of_rows=500)
+        load_photo_client().search_photos('가평군 캠핑', num_of_rows=10)
+        load_naver_image_api().search('가평 글램핑', display=5)
+        durunubi = load_durunubi_client()
+        durunubi.get_course_list(course_type='1', num_of_rows=200)
+        durunubi.get_course_list(course_type='2', num_of_rows=200)
+    finally:
+        recorder.save()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,509 @@
+"""오프라인 벤치마크 - 녹화된 응답(카세트)을 재생하며 단계별 소요 시간을 측정
+
+    python -m bench.run                      # 전체 실행
+    python -m bench.run --latency 0.05       # 모든 API 호출에 50ms 지연
+    python -m bench.run --only is_duplicate  # 이름에 포함된 항목만
+
+결과는 bench/history.json에 누적되며, 직전 실행보다 느려진 항목은 경고합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+# core.database가 임포트 시점에 DB 경로를 정하므로 임시 DB를 먼저 지정
+os.environ['BASE_PATH'] = tempfile.mkdtemp(prefix='tap-bench-')
+os.environ.setdefault('TOUR_API_KEY', 'bench')
+os.environ.setdefault('NAVER_CLIENT_ID', 'bench')
+os.environ.setdefault('NAVER_CLIENT_SECRET', 'bench')
+# 호출 예산은 재생 중에도 적용되므로 측정을 방해하지 않도록 넉넉하게
+os.environ.setdefault('DATA_GO_KR_RATE', '10000')
+os.environ.setdefault('DATA_GO_KR_DAILY_QUOTA', '10000000')
+os.environ.setdefault('NAVER_SEARCH_RATE', '10000')
+
+from bench.cassette import ReplayTransport  # noqa: E402
+from bench.standins import FakeAIWriter, FakePublisher  # noqa: E402
+
+HISTORY_FILE = Path(__file__).parent / 'history.json'
+SERVICES = ['gocamping', 'photo_gallery', 'naver_image', 'durunubi', 'kor_service', 'image_head', 'image_download']
+
+BENCHMARKS = {}
+
+
+def bench(name: str, repeat: int = None):
+    """벤치마크 등록 - 함수는 준비 작업 후 측정할 callable을 반환"""
+    def decorator(setup):
+        BENCHMARKS[name] = (setup, repeat)
+        return setup
+    return decorator
+
+
+# ===== 공용 준비 =====
+
+def _sample_items(count: int = 6, attempts: int = 20) -> list:
+    """지역을 무작위로 고르므로 항목이 모자라면 몇 번 다시 뽑음"""
+    from core.camping_data import get_camping_data
+    for _ in range(attempts):
+        data = get_camping_data('글램핑', min_items=count, max_items=count)
+        if data:
+            return data['items']
+    raise RuntimeError(f"글램핑 항목 {count}개를 {attempts}번 시도해도 얻지 못함 - 카세트(bench/cassettes)를 확인하세요")
+
+
+def _seed_image_log(size: int):
+    import imagehash
+    import numpy as np
+    from core.database import Session, ImageLog
+    rng = np.random.default_rng(size)
+    with Session() as session:
+        session.query(ImageLog).delete()
+        session.add_all(
+            ImageLog(url=f'https://bench.invalid/{i}.jpg',
+                     phash=str(imagehash.ImageHash(rng.integers(0, 2, (8, 8)).astype(bool))))
+            for i in range(size)
+        )
+        session.commit()
+
+
+# ===== 벤치마크 =====
+
+@bench('get_camping_data')
+def bench_get_camping_data():
+    from core.camping_data import get_camping_data
+    return lambda: get_camping_data('글램핑')
+
+
+@bench('images_resolved')
+def bench_images_resolved():
+    from core.pipeline import PublishPipeline
+    pipeline = PublishPipeline()
+    items = _sample_items()
+
+    def run():
+        pipeline.images_resolved({'items': [dict(i) for i in items]})
+    return run
+
+
+@bench('process_content')
+def bench_process_content():
+    from core.content_processor import process_content
+    items = _sample_items()
+    raw = FakeAIWriter(paragraphs=4).generate_full_content(items, '글램핑', '경기 가평군', '럭셔리 캠핑')
+    return lambda: process_content(raw, items, '경기', '글램핑')
+
+
+def _long_article(count: int = 40, paragraphs: int = 30):
+    items = [{'title': f'장소{i:02d} 캠핑장', 'addr': f'경기 가평군 {i}', 'map_url': 'https://map.invalid',
+              'image': f'https://img.invalid/{i}.jpg'} for i in range(count)]
+    raw = FakeAIWriter(paragraphs=paragraphs).generate_full_content(items, '글램핑', '경기 가평군', '럭셔리 캠핑')
+    return items, raw
+
+
+@bench('postprocess_long[legacy]')
+def bench_postprocess_legacy():
+    from bench import legacy
+    items, raw = _long_article()
+    return lambda: legacy.clean_content(legacy.insert_images_and_links(raw, items, '경기', '글램핑'))
+
+
+@bench('postprocess_long[single_pass]')
+def bench_postprocess_single_pass():
+    from core.content_processor import insert_images_and_links, clean_content
+    items, raw = _long_article()
+    return lambda: clean_content(insert_images_and_links(raw, items, '경기', '글램핑'))
+
+
+class _StaticImageHandler:
+    def get_image(self, item, region='', theme=''):
+        return item.get('image', '')
+
+
+@bench('process_html_long[legacy]', repeat=3)
+def bench_process_html_legacy():
+    from bench import legacy
+    items, raw = _long_article()
+    return lambda: legacy.process_html(_StaticImageHandler(), raw, items, '글램핑', '경기')
+
+
+@bench('process_html_long[single_pass]', repeat=3)
+def bench_process_html_single_pass():
+    from core.content_generator import ContentGenerator
+    gen = ContentGenerator()
+    gen._image_handler = _StaticImageHandler()
+    items, raw = _long_article()
+    return lambda: gen.process_html(raw, items, '글램핑', '경기')
+
+
+def _article_titles() -> list:
+    import csv
+    path = Path(__file__).parent.parent / 'data' / '한국관광공사_여행기사목록_20251107.csv'
+    with open(path, 'r', encoding='cp949', newline='') as f:
+        return [row['콘텐츠명'] for row in csv.DictReader(f)]
+
+
+@bench('extract_place_name[legacy]', repeat=3)
+def bench_extract_place_name_legacy():
+    from bench import legacy
+    titles = _article_titles()
+    return lambda: [legacy.extract_place_name(t) for t in titles]
+
+
+@bench('extract_place_name[compiled]', repeat=3)
+def bench_extract_place_name_compiled():
+    from core.data_loader.utils import extract_place_name
+    titles = _article_titles()
+
+    def run():
+        extract_place_name.cache_clear()
+        return [extract_place_name(t) for t in titles]
+    return run
+
+
+def _regions_and_addrs():
+    import yaml
+    from bench.cassette import Cassette
+    with open(Path(__file__).parent.parent / 'config' / 'regions.yaml', 'r', encoding='utf-8') as f:
+        regions = yaml.safe_load(f)
+    body = Cassette.load('gocamping').interactions[0]['json']['response']['body']
+    return regions, [item['addr1'] for item in body['items']['item']]
+
+
+@bench('region_group_x500[legacy]')
+def bench_region_group_legacy():
+    from bench import legacy
+    regions, addrs = _regions_and_addrs()
+    return lambda: [legacy.get_region_group(regions, a) for a in addrs]
+
+
+@bench('region_group_x500[index]')
+def bench_region_group_index():
+    from core.region_index import RegionIndex
+    regions, addrs = _regions_and_addrs()
+    # 실행마다 새 인덱스 (캐시 없이 컴파일 + 일괄 해석 비용)
+    return lambda: RegionIndex(regions).resolve_many(addrs)
+
+
+@bench('region_group_x500[index_prebuilt]')
+def bench_region_group_index_prebuilt():
+    from core.region_index import RegionIndex
+    regions, addrs = _regions_and_addrs()
+    index = RegionIndex(regions)
+
+    def run():
+        index._cache.clear()
+        return index.resolve_many(addrs)
+    return run
+
+
+# 카세트는 사용하는 필드 위주로 만들었으므로 실제 GoCamping 응답 폭(80여 필드)에 맞춰 채울 나머지 필드
+GOCAMPING_EXTRA_FIELDS = (
+    'allar', 'insrncAt', 'trsagntNo', 'bizrno', 'facltDivNm', 'mangeDivNm', 'mgcDiv', 'manageSttus', 'hvofBgnde',
+    'hvofEnddle', 'featureNm', 'lctCl', 'zipcode', 'addr2', 'direction', 'resveUrl', 'resveCl', 'manageNmpr',
+    'gnrlSiteCo', 'autoSiteCo', 'glampSiteCo', 'caravSiteCo', 'indvdlCaravSiteCo', 'sitedStnc', 'siteMg1Width',
+    'siteMg2Width', 'siteMg3Width', 'siteMg1Vrticl', 'siteMg2Vrticl', 'siteMg3Vrticl', 'siteMg1Co', 'siteMg2Co',
+    'siteMg3Co', 'siteBottomCl1', 'siteBottomCl2', 'siteBottomCl3', 'siteBottomCl4', 'siteBottomCl5', 'tooltip',
+    'prmisnDe', 'operPdCl', 'operDeCl', 'trlerAcmpnyAt', 'caravAcmpnyAt', 'toiletCo', 'swrmCo', 'wtrplCo',
+    'brazierCl', 'sbrsEtc', 'posblFcltyCl', 'posblFcltyEtc', 'clturEventAt', 'clturEvent', 'exprnProgrmAt',
+    'exprnProgrm', 'extshrCo', 'frprvtWrppCo', 'frprvtSandCo', 'fireSensorCo', 'eqpmnLendCl', 'tourEraCl',
+)
+
+
+def _gocamping_payload(wide: bool) -> bytes:
+    from bench.cassette import Cassette
+    envelope = Cassette.load('gocamping').interactions[0]['json']
+    if wide:
+        for item in envelope['response']['body']['items']['item']:
+            for name in GOCAMPING_EXTRA_FIELDS:
+                if name.endswith(('Co', 'Width', 'Vrticl', 'Nmpr')):
+                    item.setdefault(name, '0')
+                elif name == 'featureNm':
+                    item.setdefault(name, item.get('intro', '') * 3)
+                else:
+                    item.setdefault(name, '해당없음')
+    return json.dumps(envelope, ensure_ascii=False).encode('utf-8')
+
+
+def _decode_gocamping(wide: bool, mode: str):
+    from core import api_response
+    content = _gocamping_payload(wide)
+    if mode == 'dict_chain':
+        # 기존 방식 - 전체 dict 트리를 만든 뒤 키 체인으로 항목 추출
+        return lambda: json.loads(content).get('response', {}).get('body', {}).get('items', {}).get('item', [])
+    if mode == 'orjson':
+        import orjson
+        return lambda: api_response.from_payload(orjson.loads(content), api_response.CampingSite).items
+    return lambda: api_response.decode(content, api_response.CampingSite).items
+
+
+# 녹화된 500행 GoCamping 응답 디코딩 (recorded: 카세트 그대로 / wide: 실제 응답 폭)
+for _width in ('recorded', 'wide'):
+    for _mode in ('dict_chain', 'orjson', 'msgspec'):
+        bench(f'decode_gocamping_500[{_width}/{_mode}]')(
+            lambda wide=_width == 'wide', mode=_mode: _decode_gocamping(wide, mode))
+
+
+@bench('durunubi_sync_x1200', repeat=3)
+def bench_durunubi_sync():
+    from core.course_store import CourseStore
+    from core.durunubi_api import load_durunubi_client
+    store = CourseStore(api=load_durunubi_client())
+    return lambda: [store.sync(t, force=True) for t in ('1', '2')]
+
+
+@bench('durunubi_fetch')
+def bench_durunubi_fetch():
+    from core.content_generator import ContentGenerator
+    gen = ContentGenerator()
+    return lambda: gen.fetch_items({'source': 'durunubi_walk'})
+
+
+def _tour_client():
+    from core.tour_api import load_api_client
+    return load_api_client()
+
+
+@bench('tour_area_all_pages', repeat=5)
+def bench_tour_area_all_pages():
+    client = _tour_client()
+
+    def run():
+        client._cache.clear()
+        return client.get_area_based_all(31)
+    return run
+
+
+@bench('tour_enrich_x6[serial]', repeat=5)
+def bench_tour_enrich_serial():
+    client = _tour_client()
+    items = [{'contentid': str(200000 + i)} for i in range(6)]
+
+    def run():
+        client._cache.clear()
+        return [client.get_detail_common(item['contentid']) for item in items]
+    return run
+
+
+@bench('tour_enrich_x6[pool]', repeat=5)
+def bench_tour_enrich_pool():
+    client = _tour_client()
+
+    def run():
+        client._cache.clear()
+        return client.enrich_overviews([{'contentid': str(200000 + i)} for i in range(6)])
+    return run
+
+
+@bench('tour_enrich_x6[cached]', repeat=5)
+def bench_tour_enrich_cached():
+    client = _tour_client()
+    return lambda: client.enrich_overviews([{'contentid': str(200000 + i)} for i in range(6)])
+
+
+def _url_validity_x50(cached: bool):
+    from core.url_validity import UrlValidityCache
+    from core.database import Session, UrlCheck
+    urls = [f'https://img.invalid/{i}.jpg' for i in range(50)]
+    cache = UrlValidityCache()
+
+    def run():
+        if not cached:
+            cache._memo.clear()
+            with Session() as session:
+                session.query(UrlCheck).delete()
+                session.commit()
+        return [cache.is_valid(u) for u in urls]
+    return run
+
+
+bench('url_validity_x50[uncached]', repeat=5)(lambda: _url_validity_x50(False))
+bench('url_validity_x50[cached]', repeat=5)(lambda: _url_validity_x50(True))
+
+
+def _photo_search_x6(parallel: bool):
+    from concurrent.futures import ThreadPoolExecutor
+    from core.photo_api import load_photo_client
+    client = load_photo_client()
+
+    def search(_):
+        return client.search_photos('가평군 캠핑', num_of_rows=5)
+
+    def run():
+        if parallel:
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                return list(pool.map(search, range(6)))
+        return [search(i) for i in range(6)]
+    return run
+
+
+# 같은 검색어 6건 - 병렬이면 진행 중인 요청 하나에 합쳐짐 (--latency와 함께 보세요)
+bench('photo_search_same_x6[serial]', repeat=5)(lambda: _photo_search_x6(False))
+bench('photo_search_same_x6[coalesced]', repeat=5)(lambda: _photo_search_x6(True))
+
+
+def _spatial_points(count: int = 5000) -> list:
+    rng = random.Random(7)
+    return [(rng.uniform(33.2, 38.6), rng.uniform(126.1, 129.6)) for _ in range(count)]
+
+
+@bench('nearby_20km_x100[scan]', repeat=3)
+def bench_nearby_scan():
+    from core.spatial import haversine
+    points = _spatial_points()
+    queries = points[:100]
+    return lambda: [sorted(d for d in (haversine(lat, lon, *p) for p in points) if d <= 20) for lat, lon in queries]
+
+
+@bench('nearby_20km_x100[grid]')
+def bench_nearby_grid():
+    from core.spatial import GridIndex
+    points = _spatial_points()
+    grid = GridIndex()
+    for i, (lat, lon) in enumerate(points):
+        grid.add(lat, lon, i)
+    queries = points[:100]
+    return lambda: [grid.within(lat, lon, 20) for lat, lon in queries]
+
+
+@bench('nearest_5_x100[grid]')
+def bench_nearest_grid():
+    from core.spatial import GridIndex
+    points = _spatial_points()
+    grid = GridIndex()
+    for i, (lat, lon) in enumerate(points):
+        grid.add(lat, lon, i)
+    queries = points[:100]
+    return lambda: [grid.nearest(lat, lon, 5) for lat, lon in queries]
+
+
+@bench('title_generate_x100')
+def bench_title_generate():
+    from core.title_generator import TitleGenerator
+    gen = TitleGenerator()
+
+    def run():
+        for _ in range(100):
+            gen.generate('경기', '글램핑', 5, sigungu='가평군')
+    return run
+
+
+def _bench_is_duplicate(size: int):
+    from core.image_handler import ImageHandler
+    from core.database import Session, ImageLog
+    _seed_image_log(size)
+    handler = ImageHandler()
+    counter = iter(range(10 ** 9))
+
+    def run():
+        url = f'https://bench.invalid/new-{next(counter)}.webp'
+        handler.is_duplicate(url)
+        with Session() as session:
+            session.query(ImageLog).filter_by(url=url).delete()
+            session.commit()
+    return run
+
+
+for _size in (100, 1000, 5000):
+    bench(f'is_duplicate[{_size}]', repeat=5)(lambda size=_size: _bench_is_duplicate(size))
+
+
+@bench('pipeline_end_to_end', repeat=3)
+def bench_pipeline():
+    from core.pipeline import PublishPipeline
+    from core.job_queue import STAGES
+
+    def run():
+        pipeline = PublishPipeline()
+        pipeline._writer = FakeAIWriter()
+        pipeline._publishers = [FakePublisher()]
+        artifacts = {}
+        for stage in STAGES:
+            getattr(pipeline, stage)(artifacts)
+    return run
+
+
+# ===== 실행 / 기록 =====
+
+def _measure(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'runs': repeat,
+        'min_ms': round(min(samples), 3),
+        'mean_ms': round(statistics.mean(samples), 3),
+        'p50_ms': round(statistics.median(samples), 3),
+    }
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=Path(__file__).parent, text=True).strip()
+    except Exception:
+        return ''
+
+
+def _load_history(path: Path) -> list:
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return []
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='TAP 오프라인 벤치마크')
+    parser.add_argument('--latency', type=float, default=0.0, help='API 호출당 지연(초)')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--only', default='', help='이름에 이 문자열이 포함된 항목만 실행')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--threshold', type=float, default=1.2, help='회귀 판정 배율 (직전 mean 대비)')
+    parser.add_argument('--history', type=Path, default=HISTORY_FILE)
+    parser.add_argument('--no-save', action='store_true')
+    args = parser.parse_args(argv)
+
+    results = {}
+    with ReplayTransport(SERVICES, latency=args.latency):
+        for name, (setup, repeat) in BENCHMARKS.items():
+            if args.only and args.only not in name:
+                continue
+            random.seed(args.seed)
+            fn = setup()
+            fn()  # 워밍업
+            results[name] = _measure(fn, repeat or args.repeat)
+            print(f"{name:<34} mean {results[name]['mean_ms']:>10.3f} ms   p50 {results[name]['p50_ms']:>10.3f} ms")
+
+    history = _load_history(args.history)
+    previous = next((h for h in reversed(history) if h.get('latency') == args.latency), None)
+    regressions = []
+    if previous:
+        for name, result in results.items():
+            before = previous['results'].get(name)
+            if before and result['mean_ms'] > before['mean_ms'] * args.threshold:
+                regressions.append(name)
+                print(f"[회귀] {name}: {before['mean_ms']} ms -> {result['mean_ms']} ms")
+
+    if not args.no_save:
+        history.append({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_rev': _git_rev(),
+            'latency': args.latency,
+            'results': results,
+        })
+        with open(args.history, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""OpenAI / 발행 대상 로컬 대역 - 지연 시간만 흉내 내고 결정적인 결과를 돌려줍니다."""
+
+import time
+from core.publishers import Publisher
+
+PARAGRAPH = (
+    '이곳은 사계절 내내 방문객이 끊이지 않는 곳으로, 잘 정돈된 사이트와 깨끗한 편의시설을 갖추고 있습니다. '
+    '주변 자연환경이 뛰어나 아침저녁으로 산책하기 좋으며, 가족 단위 여행객에게도 추천할 만합니다. '
+    '예약은 성수기에 빠르게 마감되므로 미리 확인하시는 것이 좋습니다. '
+)
+
+
+class FakeAIWriter:
+    """AIWriter.generate_full_content와 같은 모양의 HTML을 생성"""
+
+    def __init__(self, latency: float = 0.0, paragraphs: int = 2):
+        self.latency = latency
+        self.paragraphs = paragraphs
+
+    def generate_full_content(self, items: list, theme: str, region: str, angle: str) -> str:
+        if self.latency:
+            time.sleep(self.latency)
+        parts = [f'<p>{region}의 {theme} 여행을 소개합니다. {PARAGRAPH * self.paragraphs}</p>',
+                 f'<h2>{region} {theme}</h2>']
+        for item in items:
+            parts.append(f"<h3>{item['title']}</h3>")
+            parts.append(f'<p>{PARAGRAPH * self.paragraphs}</p>')
+        parts.append('<h2>마무리</h2>')
+        parts.append(f'<p>{PARAGRAPH * self.paragraphs}</p>')
+        return '\n\n'.join(parts)
+
+
+class FakePublisher(Publisher):
+    """Blogger posts.insert 응답을 흉내 내는 발행기"""
+    name = 'fake'
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.posts = []
+
+    def create_post(self, title, content, labels=None, is_draft=True):
+        if self.latency:
+            time.sleep(self.latency)
+        self.posts.append({'title': title, 'content': content, 'labels': labels})
+        post_id = str(len(self.posts))
+        url = f'https://example.invalid/{post_id}.html'
+        return {'id': post_id, 'url': url, 'link': url, 'title': title,
+                'status': 'draft' if is_draft else 'published'}
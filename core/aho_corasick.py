@@ -0,0 +1,70 @@
+"""Aho-Corasick 다중 문자열 매칭 - 여러 키워드를 텍스트 한 번 스캔으로 찾기"""
+
+from collections import deque
+
+
+class AhoCorasick:
+    """키워드 집합에 대한 오토마톤
+
+    Args:
+        patterns: 찾을 문자열 리스트 (인덱스가 결과의 pattern_id)
+        ignore_case: 대소문자 무시 여부
+    """
+
+    def __init__(self, patterns, ignore_case: bool = False):
+        self.patterns = list(patterns)
+        self.ignore_case = ignore_case
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        self._build()
+
+    def _build(self):
+        outputs = [[]]
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            if self.ignore_case:
+                pattern = pattern.lower()
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(pid)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+
+        self._out = [tuple(o) for o in outputs]
+
+    def iter(self, text: str):
+        """(시작 위치, 끝 위치, pattern_id)를 끝 위치 순서대로 생성"""
+        if self.ignore_case:
+            text = text.lower()
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                yield i + 1 - len(patterns[pid]), i + 1, pid
+
+    def find_ids(self, text: str) -> set:
+        """텍스트에 등장하는 pattern_id 집합"""
+        return {pid for _, _, pid in self.iter(text)}
@@ -3,7 +3,9 @@
 
 import os
 import re
+import time
 from openai import OpenAI
+from core.metrics import record_api_call
 
 
 class AIWriter:
@@ -29,8 +31,13 @@ class AIWriter:
             overview = item.get('overview', '')
             facilities = item.get('facilities', '')
             tel = item.get('tel', '')
+            quality = item.get('quality', '')
             
             info = f"{i}. {title}"
+            if quality:
+                info += f"\n   인증: 한국관광 품질인증 ({quality})"
+            if item.get('accessible'):
+                info += "\n   무장애: 한국관광공사 지정 열린관광지"
             if facilities:
                 info += f"\n   시설: {facilities[:100]}"
             if tel:
@@ -79,12 +86,18 @@ class AIWriter:
 
 <p>로 바로 시작하세요:"""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=3500,
-            temperature=0.7
-        )
+        start = time.monotonic()
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=3500,
+                temperature=0.7
+            )
+        except Exception:
+            record_api_call('openai', 'error', time.monotonic() - start)
+            raise
+        record_api_call('openai', 200, time.monotonic() - start)
         raw = response.choices[0].message.content
         return self._clean_content(raw)
 
@@ -0,0 +1,219 @@
+"""data.go.kr 공통 응답 디코더 - response.header / body.items.item 봉투를 한 곳에서 해석
+
+API마다 쓰는 필드만 정의한 레코드 타입(TypedDict)으로 디코딩합니다.
+msgspec이 있으면 봉투와 레코드 타입으로 바로 디코딩해 쓰지 않는 필드는 파싱 단계에서 건너뛰고,
+없으면 orjson(없으면 json)으로 읽은 뒤 같은 필드만 골라냅니다. 결과 항목은 어느 쪽이든 plain dict입니다.
+
+item이 하나뿐이면 dict, 결과가 없으면 items가 ""로 오는 응답을 항상 리스트로 맞춥니다.
+"""
+
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Generic, TypeVar, TypedDict, Union
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+Scalar = Union[str, int, float, None]
+
+OK_CODE = '0000'
+
+
+class ResponseError(Exception):
+    """JSON 봉투가 아닌 응답 (인증키 오류 XML 등)"""
+    pass
+
+
+# ===== 레코드 타입 (사용하는 필드만) =====
+
+class CampingSite(TypedDict, total=False):
+    """GoCamping basedList"""
+    contentId: Scalar
+    facltNm: Scalar
+    lineIntro: Scalar
+    intro: Scalar
+    addr1: Scalar
+    doNm: Scalar
+    sigunguNm: Scalar
+    mapX: Scalar
+    mapY: Scalar
+    tel: Scalar
+    homepage: Scalar
+    firstImageUrl: Scalar
+    induty: Scalar
+    lctCl: Scalar
+    sbrsCl: Scalar
+    operPdCl: Scalar
+    themaEnvrnCl: Scalar
+    exprnProgrm: Scalar
+    animalCmgCl: Scalar
+    glampInnerFclty: Scalar
+    caravInnerFclty: Scalar
+    modifiedtime: Scalar
+
+
+class GalleryPhoto(TypedDict, total=False):
+    """PhotoGalleryService gallerySearchList"""
+    galContentId: Scalar
+    galTitle: Scalar
+    galWebImageUrl: Scalar
+    galPhotographyMonth: Scalar
+    galPhotographyLocation: Scalar
+    galSearchKeyword: Scalar
+
+
+class Course(TypedDict, total=False):
+    """Durunubi courseList (course_store에 그대로 저장)"""
+    crsIdx: Scalar
+    routeIdx: Scalar
+    crsKorNm: Scalar
+    crsDstnc: Scalar
+    crsTotlRqrmHour: Scalar
+    crsLevel: Scalar
+    crsCycle: Scalar
+    crsContents: Scalar
+    crsSummary: Scalar
+    crsTourInfo: Scalar
+    crsImg: Scalar
+    sigun: Scalar
+    areaNm: Scalar
+    brdDiv: Scalar
+    createdtime: Scalar
+    modifiedtime: Scalar
+
+
+class TourItem(TypedDict, total=False):
+    """KorService 목록/공통정보"""
+    contentid: Scalar
+    contenttypeid: Scalar
+    title: Scalar
+    addr1: Scalar
+    addr2: Scalar
+    areacode: Scalar
+    sigungucode: Scalar
+    cat1: Scalar
+    cat2: Scalar
+    cat3: Scalar
+    firstimage: Scalar
+    firstimage2: Scalar
+    mapx: Scalar
+    mapy: Scalar
+    tel: Scalar
+    homepage: Scalar
+    overview: Scalar
+    modifiedtime: Scalar
+
+
+@dataclass(slots=True)
+class Page:
+    """응답 한 페이지"""
+    code: str = ''
+    message: str = ''
+    total: int = 0
+    items: list = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.code == OK_CODE
+
+    def payload(self) -> dict:
+        """응답 캐시에 저장할 봉투 (사용하는 필드만 남은 원래 모양)"""
+        return {'response': {
+            'header': {'resultCode': self.code, 'resultMsg': self.message},
+            'body': {'items': {'item': self.items}, 'totalCount': self.total},
+        }}
+
+
+# ===== msgspec 봉투 =====
+
+if msgspec is not None:
+    T = TypeVar('T')
+
+    class _Header(msgspec.Struct):
+        resultCode: Scalar = ''
+        resultMsg: Scalar = ''
+
+    class _Items(msgspec.Struct, Generic[T]):
+        item: Union[list[T], T, None] = None
+
+    class _Body(msgspec.Struct, Generic[T]):
+        items: Union[_Items[T], str, None] = None
+        totalCount: Union[int, str, None] = 0
+
+    class _Response(msgspec.Struct, Generic[T]):
+        header: _Header = msgspec.field(default_factory=_Header)
+        body: Union[_Body[T], None] = None
+
+    class _Envelope(msgspec.Struct, Generic[T]):
+        response: Union[_Response[T], None] = None
+
+    @lru_cache(maxsize=None)
+    def _decoder(record):
+        return msgspec.json.Decoder(_Envelope[record], strict=False)
+
+
+def _as_int(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _as_list(item) -> list:
+    if not item:
+        return []
+    return item if isinstance(item, list) else [item]
+
+
+def _keys(record) -> tuple:
+    return tuple(record.__annotations__)
+
+
+def from_payload(data: dict, record) -> Page:
+    """이미 읽은 봉투 dict(응답 캐시 등)에서 Page - record의 필드만 남김"""
+    response = (data or {}).get('response') or {}
+    header = response.get('header') or {}
+    body = response.get('body') or {}
+    items = body.get('items')
+    keys = _keys(record)
+    return Page(
+        code=str(header.get('resultCode') or ''),
+        message=str(header.get('resultMsg') or ''),
+        total=_as_int(body.get('totalCount')),
+        items=[{k: item[k] for k in keys if k in item}
+               for item in _as_list(items.get('item') if isinstance(items, dict) else None)],
+    )
+
+
+def decode(content: bytes, record) -> Page:
+    """응답 본문 -> Page (항목은 record에 정의된 필드만 가진 dict 리스트)"""
+    if msgspec is None:
+        try:
+            return from_payload(_loads(content), record)
+        except ValueError as e:
+            raise ResponseError(f"JSON 응답이 아님: {content[:80]!r}") from e
+
+    try:
+        envelope = _decoder(record).decode(content)
+    except msgspec.DecodeError as e:
+        raise ResponseError(f"응답 디코딩 실패: {e} ({content[:80]!r})") from e
+    response = envelope.response
+    if response is None:
+        return Page()
+    body = response.body
+    items = body.items if body is not None else None
+    return Page(
+        code=str(response.header.resultCode or ''),
+        message=str(response.header.resultMsg or ''),
+        total=_as_int(body.totalCount) if body is not None else 0,
+        items=_as_list(items.item) if isinstance(items, _Items) else [],
+    )
@@ -2,29 +2,98 @@
 """Google Blogger API v3 - OAuth 방식"""
 
 import os
+import json
+import time
 import logging
 import pickle
+import hashlib
 from pathlib import Path
+from typing import Optional
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
+from core.retry import sleep_backoff, parse_retry_after
+from core.publishers import Publisher
+from core.metrics import record_api_call
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# 재시도 대상 HTTP 상태 / 사유
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+# 일일 할당량 소진 - 재시도해도 소용없으므로 즉시 중단
+QUOTA_REASONS = {'dailyLimitExceeded', 'quotaExceeded'}
 
-class BloggerPublisher:
+
+def _error_reason(error: HttpError) -> str:
+    """HttpError 본문에서 reason 추출"""
+    try:
+        data = json.loads(error.content.decode('utf-8'))
+        errors = data.get('error', {}).get('errors', [])
+        return errors[0].get('reason', '') if errors else ''
+    except Exception:
+        return ''
+
+
+def _is_quota_error(error: Exception) -> bool:
+    return isinstance(error, HttpError) and _error_reason(error) in QUOTA_REASONS
+
+
+def _status(error: Exception):
+    """HTTP 상태 코드 (BatchError 등 응답이 없는 오류는 None)"""
+    return getattr(getattr(error, 'resp', None), 'status', None)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """처리 전에 거절된 요청 - 생성 요청도 그대로 재전송해도 안전"""
+    if not isinstance(error, HttpError):
+        return False
+    status = _status(error)
+    return status == 429 or (status == 403 and _error_reason(error) in RATE_LIMIT_REASONS)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if not isinstance(error, HttpError) or _is_quota_error(error):
+        return False
+    return _status(error) in RETRYABLE_STATUS or _is_rate_limited(error)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    resp = getattr(error, 'resp', None)
+    if isinstance(error, HttpError) and resp is not None:
+        return parse_retry_after(resp.get('retry-after'))
+    return None
+
+
+def _post_marker(title: str, content: str) -> str:
+    """본문 끝에 붙이는 숨은 표식 - 응답을 못 받은 생성 요청이 실제로 반영됐는지 확인용"""
+    key = hashlib.sha256(f"{title}\n{content}".encode('utf-8')).hexdigest()[:16]
+    return f"<!-- tap:{key} -->"
+
+
+class BloggerPublisher(Publisher):
+    name = 'blogger'
     SCOPES = ['https://www.googleapis.com/auth/blogger']
+    BATCH_SIZE = 50
+    # 생성 여부 확인 시 훑어보는 최근 글 수
+    RECONCILE_LOOKBACK = 50
     
-    def __init__(self):
+    def __init__(self, service=None):
+        """
+        Args:
+            service: 이미 생성된 Blogger 서비스 객체 (로컬 가짜 엔드포인트 연결용).
+                     없으면 OAuth 인증 후 생성합니다.
+        """
         self.blog_id = os.getenv('BLOGGER_BLOG_ID')
         self.token_file = Path(os.getenv('BLOGGER_TOKEN_FILE', 'token.pickle'))
         self.client_secret = Path(os.getenv('BLOGGER_CLIENT_SECRET', 'client_secret.json'))
-        self.service = None
-        self._authenticate()
+        self.service = service
+        if self.service is None:
+            self._authenticate()
     
     def _authenticate(self):
         """OAuth 인증"""
@@ -58,57 +127,272 @@ class BloggerPublisher:
         self.service = build('blogger', 'v3', credentials=creds)
         logger.info("Blogger API 인증 성공")
     
-    def create_post(self, title: str, content: str, labels: list = None,
-                    is_draft: bool = True, max_retries: int = 3) -> dict:
-        """블로그 포스트 생성"""
+    def _post_body(self, title: str, content: str, labels: list = None) -> dict:
         post_body = {
             'kind': 'blogger#post',
             'title': title,
-            'content': content
+            'content': f"{content}\n{_post_marker(title, content)}"
         }
         
         if labels:
             post_body['labels'] = labels
+        return post_body
+    
+    def _format_result(self, result: dict, is_draft: bool) -> dict:
+        return {
+            'id': result.get('id'),
+            'url': result.get('url'),
+            'link': result.get('url'),
+            'title': result.get('title'),
+            'status': 'draft' if is_draft else 'published'
+        }
+    
+    def _find_created(self, bodies: dict) -> dict:
+        """응답을 못 받은 생성 요청 중 실제로 만들어진 글 {키: 글}
+        
+        최근 글에서 제목과 본문 표식(_post_marker)이 모두 같은 글만 찾습니다.
+        
+        Args:
+            bodies: {키: _post_body 결과}
+        """
+        if not bodies:
+            return {}
+        listing = self._execute(
+            lambda: self.service.posts().list(
+                blogId=self.blog_id,
+                status=['DRAFT', 'LIVE', 'SCHEDULED'],
+                view='ADMIN',
+                fetchBodies=True,
+                orderBy='UPDATED',
+                maxResults=self.RECONCILE_LOOKBACK
+            ),
+            max_retries=3
+        )
+        found = {}
+        for key, body in bodies.items():
+            marker = body['content'].rsplit('\n', 1)[-1]
+            post = next((p for p in listing.get('items', [])
+                         if p.get('title') == body['title'] and marker in (p.get('content') or '')), None)
+            if post:
+                found[key] = post
+        return found
+    
+    def _execute(self, request_factory, max_retries: int, body: dict = None) -> dict:
+        """단건 요청 실행 (할당량/일시 오류 시 지수 백오프)
         
+        Args:
+            body: 생성 요청의 본문 - 주어지면 429/속도 제한만 그대로 재전송하고, 5xx면 서버가 이미
+                  만들었을 수 있으므로 _find_created로 확인한 뒤 없을 때만 다시 보냄
+        """
         for attempt in range(max_retries):
+            t0 = time.monotonic()
             try:
-                result = self.service.posts().insert(
-                    blogId=self.blog_id,
-                    body=post_body,
-                    isDraft=is_draft
-                ).execute()
-                
-                status = "임시저장" if is_draft else "발행"
-                logger.info(f"Blogger {status} 완료: {result.get('url')}")
-                
-                return {
-                    'id': result.get('id'),
-                    'url': result.get('url'),
-                    'link': result.get('url'),
-                    'title': result.get('title'),
-                    'status': 'draft' if is_draft else 'published'
-                }
-                
+                result = request_factory().execute()
+                record_api_call('blogger', 200, time.monotonic() - t0)
+                return result
             except HttpError as e:
-                logger.warning(f"시도 {attempt + 1}/{max_retries} 실패: {e}")
+                record_api_call('blogger', _status(e), time.monotonic() - t0)
+                if not _is_retryable(e):
+                    raise
+                if body is not None and not _is_rate_limited(e):
+                    existing = self._find_created({'post': body}).get('post')
+                    if existing:
+                        logger.info(f"생성 요청 응답은 실패했지만 이미 생성됨 - 재전송 생략: {existing.get('url')}")
+                        return existing
                 if attempt == max_retries - 1:
                     raise
-            except Exception as e:
-                logger.error(f"포스트 생성 실패: {e}")
-                raise
+                delay = sleep_backoff(attempt, retry_after=_retry_after(e))
+                logger.warning(f"시도 {attempt + 1}/{max_retries} 실패, {delay:.1f}초 후 재시도: {e}")
+    
+    def create_post(self, title: str, content: str, labels: list = None,
+                    is_draft: bool = True, max_retries: int = 3) -> dict:
+        """블로그 포스트 생성"""
+        post_body = self._post_body(title, content, labels)
+        
+        try:
+            result = self._execute(
+                lambda: self.service.posts().insert(
+                    blogId=self.blog_id,
+                    body=post_body,
+                    isDraft=is_draft
+                ),
+                max_retries,
+                body=post_body
+            )
+        except Exception as e:
+            logger.error(f"포스트 생성 실패: {e}")
+            raise
+        
+        status = "임시저장" if is_draft else "발행"
+        logger.info(f"Blogger {status} 완료: {result.get('url')}")
+        return self._format_result(result, is_draft)
     
     def publish_draft(self, post_id: str) -> dict:
         """임시저장 글을 발행"""
         try:
-            result = self.service.posts().publish(
-                blogId=self.blog_id,
-                postId=post_id
-            ).execute()
+            result = self._execute(
+                lambda: self.service.posts().publish(
+                    blogId=self.blog_id,
+                    postId=post_id
+                ),
+                max_retries=3
+            )
             logger.info(f"발행 완료: {result.get('url')}")
             return result
         except HttpError as e:
             logger.error(f"발행 실패: {e}")
             raise
+    
+    def create_posts(self, posts: list, is_draft: bool = True,
+                     batch_size: int = None, max_retries: int = 5) -> list:
+        """여러 포스트를 배치 요청으로 생성 (HTTP 왕복 1회당 최대 batch_size건)
+        
+        Args:
+            posts: [{'title': ..., 'content': ..., 'labels': [...]}, ...]
+        
+        Returns:
+            입력 순서와 같은 포스트별 결과 리스트.
+            실패 항목은 status='failed'와 error 메시지를 가집니다.
+        """
+        bodies = {str(i): self._post_body(p['title'], p['content'], p.get('labels')) for i, p in enumerate(posts)}
+        factories = {
+            rid: (lambda body=body: self.service.posts().insert(
+                blogId=self.blog_id,
+                body=body,
+                isDraft=is_draft
+            ))
+            for rid, body in bodies.items()
+        }
+        results = self._run_batch(
+            factories,
+            lambda r: self._format_result(r, is_draft),
+            batch_size or self.BATCH_SIZE,
+            max_retries,
+            bodies=bodies
+        )
+        ok = sum(1 for r in results if r['status'] != 'failed')
+        logger.info(f"Blogger 배치 생성: {ok}/{len(posts)} 성공")
+        return results
+    
+    def publish_drafts(self, post_ids: list, batch_size: int = None,
+                       max_retries: int = 5) -> list:
+        """여러 임시저장 글을 배치 요청으로 발행"""
+        factories = {
+            str(i): (lambda pid=pid: self.service.posts().publish(
+                blogId=self.blog_id,
+                postId=pid
+            ))
+            for i, pid in enumerate(post_ids)
+        }
+        results = self._run_batch(
+            factories,
+            lambda r: self._format_result(r, is_draft=False),
+            batch_size or self.BATCH_SIZE,
+            max_retries
+        )
+        ok = sum(1 for r in results if r['status'] != 'failed')
+        logger.info(f"Blogger 배치 발행: {ok}/{len(post_ids)} 성공")
+        return results
+    
+    def _run_batch(self, factories: dict, formatter, batch_size: int,
+                   max_retries: int, bodies: dict = None) -> list:
+        """배치 실행 - 일시 오류 항목만 모아 백오프 후 재전송
+        
+        일일 할당량 오류가 나오면 그날은 회복되지 않으므로 남은 항목 전체를 실패로 두고 중단합니다.
+        전송 오류(소켓/연결 등)는 서버가 이미 처리했을 수 있어 재전송하지 않고 해당 묶음을 실패로 둡니다.
+        
+        Args:
+            bodies: 생성 요청이면 {요청 ID: 본문} - 5xx로 실패한 항목은 _find_created로
+                    이미 만들어졌는지 확인한 뒤 없는 항목만 재전송 (429/속도 제한은 그대로 재전송)
+        """
+        results = {}
+        pending = list(factories)
+        quota_error = None
+        
+        for attempt in range(max_retries):
+            retry = []
+            unsure = []  # 서버가 처리했을 수도 있는 생성 요청
+            retry_after = [None]
+            
+            def callback(request_id, response, exception):
+                nonlocal quota_error
+                if exception is None:
+                    results[request_id] = formatter(response)
+                elif _is_retryable(exception):
+                    retry.append(request_id)
+                    if bodies is not None and not _is_rate_limited(exception):
+                        unsure.append(request_id)
+                    retry_after[0] = max(filter(None, [retry_after[0], _retry_after(exception)]), default=None)
+                else:
+                    if _is_quota_error(exception):
+                        quota_error = exception
+                    results[request_id] = self._failure(exception)
+            
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                if quota_error:
+                    for rid in chunk:
+                        results[rid] = self._failure(quota_error)
+                    continue
+                
+                batch = self.service.new_batch_http_request(callback=callback)
+                for rid in chunk:
+                    batch.add(factories[rid](), request_id=rid)
+                t0 = time.monotonic()
+                try:
+                    batch.execute()
+                    record_api_call('blogger_batch', 200, time.monotonic() - t0)
+                except HttpError as e:
+                    record_api_call('blogger_batch', _status(e), time.monotonic() - t0)
+                    # 배치 요청 자체가 실패한 경우 응답받지 못한 항목 전체에 적용
+                    for rid in chunk:
+                        if rid not in results and rid not in retry:
+                            callback(rid, None, e)
+                except Exception as e:
+                    record_api_call('blogger_batch', 'error', time.monotonic() - t0)
+                    logger.error(f"배치 전송 오류: {e}")
+                    for rid in chunk:
+                        if rid not in results and rid not in retry:
+                            results[rid] = self._failure(e)
+            
+            if quota_error:
+                for rid in retry:
+                    results[rid] = self._failure(quota_error)
+                logger.error(f"Blogger 일일 할당량 소진 - 배치 중단: {quota_error}")
+                break
+            if unsure:
+                try:
+                    created = self._find_created({rid: bodies[rid] for rid in unsure})
+                except HttpError as e:
+                    logger.warning(f"생성 여부 확인 실패, 해당 항목은 재전송하지 않음: {e}")
+                    created = {}
+                    for rid in unsure:
+                        results[rid] = self._failure(e)
+                for rid, post in created.items():
+                    results[rid] = formatter(post)
+                retry = [rid for rid in retry if rid not in results]
+            if not retry:
+                break
+            if attempt == max_retries - 1:
+                for rid in retry:
+                    results[rid] = self._failure(f"재시도 {max_retries}회 초과")
+                break
+            
+            pending = retry
+            delay = sleep_backoff(attempt, retry_after=retry_after[0])
+            logger.warning(f"배치 {len(retry)}건 일시 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+        
+        return [results[rid] for rid in factories]
+    
+    def _failure(self, error) -> dict:
+        return {
+            'id': None,
+            'url': None,
+            'link': None,
+            'title': None,
+            'status': 'failed',
+            'error': str(error)
+        }
 
 
 def load_publisher():
@@ -1,5 +1,8 @@
 import os
-import requests
+from datetime import timedelta
+from core import http_client
+from core.api_response import decode, from_payload, CampingSite
+from core.response_cache import ResponseCache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,6 +11,8 @@ class CampingAPI:
     def __init__(self):
         self.service_key = os.getenv('TOUR_API_KEY')
         self.base_url = "https://apis.data.go.kr/B551011/GoCamping"
+        # 할당량 부족/서킷 열림/오류 응답 시에만 쓰는 마지막 정상 응답 (평소에는 항상 새로 조회)
+        self._fallback = ResponseCache('gocamping', {'basedList': timedelta(days=7)})
 
     def get_campsite_list(self, num_of_rows=500):
         if not self.service_key:
@@ -20,10 +25,29 @@ class CampingAPI:
             "_type": "json"
         }
         try:
-            resp = requests.get(f"{self.base_url}/basedList", params=params, timeout=30)
-            return resp.json().get('response', {}).get('body', {}).get('items', {}).get('item', [])
+            if http_client.cache_only('gocamping'):
+                print("Camping API 할당량 부족 또는 서킷 열림 - 캐시된 목록 사용")
+                return self._cached(params)
+            try:
+                resp = http_client.get('gocamping', f"{self.base_url}/basedList", params=params, timeout=30)
+            except http_client.CircuitOpen as e:
+                print(f"Camping API {e} - 캐시된 목록 사용")
+                return self._cached(params)
+            page = decode(resp.content, CampingSite)
+            if not (page.ok and page.items):
+                print(f"Camping API 응답 이상({page.code} {page.message}, {len(page.items)}건) - 캐시된 목록 사용")
+                return self._cached(params)
+            self._fallback.set('basedList', params, page.payload())
+            return page.items
         except Exception as e:
-            print(f"Camping API Error: {e}")
+            print(f"Camping API Error: {e} - 캐시된 목록 사용")
+            return self._cached(params)
+
+    def _cached(self, params):
+        """마지막 정상 응답의 항목 (없거나 읽을 수 없으면 빈 목록)"""
+        try:
+            return from_payload(self._fallback.get('basedList', params, allow_stale=True), CampingSite).items
+        except Exception:
             return []
 
 def load_camping_client():
@@ -1,10 +1,15 @@
 """캠핑장 데이터 조회 (API 기반) - v10.0"""
 import random
+import logging
 from collections import defaultdict
 from core.camping_api import load_camping_client
 from core.naver_map import get_naver_map_link
+from core.place import Place
+from core.catalogue import load_catalogue
 from core.config import REGION_ALIASES
 
+logger = logging.getLogger(__name__)
+
 
 def get_random_region_name(api_name: str) -> str:
     """API 지역명을 다양한 표현으로 변환"""
@@ -31,6 +36,12 @@ def get_camping_data(theme: str = '글램핑', min_items: int = 3, max_items: in
     if not all_items:
         return None
     
+    # 응답의 mapX/mapY를 카탈로그에 남겨 주변 장소 질의에 사용 (이미 시도한 장소는 건너뜀)
+    try:
+        load_catalogue().attach_coordinates(all_items)
+    except Exception as e:
+        logger.warning(f"카탈로그 좌표 보충 실패: {e}")
+    
     # 1. 이미지 있는 항목만 필터링
     items_with_image = [item for item in all_items if item.get('firstImageUrl')]
     
@@ -47,14 +58,12 @@ def get_camping_data(theme: str = '글램핑', min_items: int = 3, max_items: in
     if not filtered:
         filtered = items_with_image  # 폴백: 이미지 있는 전체
     
-    # 3. 시군구별 그룹핑
+    # 3. 시군구별 그룹핑 (후보는 Place로 보관, 선택된 항목만 dict로 변환)
     grouped = defaultdict(list)
     for item in filtered:
-        do_name = item.get('doNm', '')
-        sigungu = item.get('sigunguNm', '')
-        if do_name and sigungu:
-            key = (do_name, sigungu)
-            grouped[key].append(item)
+        place = Place.from_camping(item, source='api_camping')
+        if place.do and place.sigungu:
+            grouped[(place.do, place.sigungu)].append(place)
     
     # 4. 3개 이상 데이터 있는 시군구만 필터링
     valid_regions = {k: v for k, v in grouped.items() if len(v) >= min_items}
@@ -71,22 +80,14 @@ def get_camping_data(theme: str = '글램핑', min_items: int = 3, max_items: in
     count = random.randint(min_items, min(max_items, len(candidates)))
     selected_items = random.sample(candidates, count)
     
-    # 7. 결과 포맷팅
+    # 7. 로컬 카탈로그로 설명/품질인증 보충 (장소별 API 호출 없음)
+    load_catalogue().enrich_all(selected_items)
+    
+    # 8. 결과 포맷팅 - 작업 체크포인트(JSON)에 저장되므로 dict로
     results = []
-    for item in selected_items:
-        name = item.get('facltNm', '')
-        results.append({
-            'title': name,
-            'addr': item.get('addr1', ''),
-            'do': do_name,
-            'sigungu': sigungu,
-            'overview': item.get('intro', '') or item.get('lineIntro', ''),
-            'image': item.get('firstImageUrl', ''),
-            'map_url': get_naver_map_link(name),
-            'tel': item.get('tel', ''),
-            'homepage': item.get('homepage', ''),
-            'source': 'api_camping'
-        })
+    for place in selected_items:
+        place.map_url = get_naver_map_link(place.title)
+        results.append(place.to_dict())
     
     return {
         'items': results,
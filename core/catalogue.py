@@ -0,0 +1,611 @@
+"""오프라인 장소 카탈로그 - data/의 CSV를 하나로 합쳐 API 호출 없이 로컬에서 조회
+
+빌드 단계(python app.py build-catalogue)에서 야영장 등록 현황을 기준으로
+괴산군 관광지정보, 열린관광지, 지역콘텐츠, 품질인증 현황의 같은 장소를 하나로 묶습니다.
+이후에는 새 날짜의 CSV가 들어온 계열만 직전 스냅샷과 비교해 바뀐 행이 닿는 항목만 다시 묶습니다
+(python app.py refresh-data, 프로세스에서 처음 조회할 때도 확인).
+
+- 블로킹: (시도, 시군구)가 같은 후보끼리만 비교 (시군구를 모르면 시도 단위)
+- 후보 탐색: 블록별 이름 3-gram 역색인
+- 판정: 정규화 이름 일치 / 포함 / 3-gram 자카드 유사도 MATCH_THRESHOLD 이상
+"""
+
+import re
+import logging
+import threading
+import unicodedata
+from collections import defaultdict
+from datetime import datetime, date
+from pathlib import Path
+from sqlalchemy import insert
+from core.config import REGION_ALIASES
+from core.database import Session, CatalogueEntry, DatasetSnapshot, DatasetRow
+from core.datasets import DATA_DIR, DatasetRegistry, DatasetError
+from core.spatial import GridIndex, as_coord
+
+logger = logging.getLogger(__name__)
+
+MATCH_THRESHOLD = 0.6
+CONTAIN_RATIO = 0.6  # 앞부분이 아닌 곳에 포함될 때의 최소 길이 비율 ('화성행궁' + '야간개장'은 앞부분 일치로 허용)
+
+# 데이터셋 항목이 합쳐질 수 있는 기존 항목 종류 (캠핑장과 같은 이름의 산/계곡을 묶지 않도록)
+COMPATIBLE = {
+    'camping': {'camping'},
+    'attraction': {'attraction'},
+    'lodging': {'lodging', 'camping'},
+    'shop': {'shop'},
+}
+
+# 이름 비교 전에 떼는 일반 명사 (긴 것부터)
+GENERIC_SUFFIXES = ('오토캠핑장', '글램핑장', '캠핑장', '야영장', '글램핑', '캠핑', '관광지', '유원지')
+
+_BRACKETS = re.compile(r'\[[^\]]*\]|\([^)]*\)|<[^>]*>')
+_NON_WORD = re.compile(r'[^\w가-힣]')
+_PREFIX = re.compile(r'^\s*\[([^\]]+)\]\s*')
+
+
+def _sido_map() -> dict:
+    """시도 표기 -> 짧은 이름 (강원특별자치도/강원도/강원 -> 강원)"""
+    mapping = {}
+    for canonical, aliases in REGION_ALIASES.items():
+        short = min(aliases, key=len)
+        for name in (canonical, *aliases):
+            mapping[name] = short
+    mapping['전북특별자치도'] = '전북'
+    return mapping
+
+
+SIDO = _sido_map()
+
+
+def sido_of(name: str) -> str:
+    name = (name or '').strip()
+    return SIDO.get(name, name[:2])
+
+
+def sigungu_stem(name: str) -> str:
+    """'춘천시' -> '춘천', '정선' -> '정선' (시/군/구 유무가 다른 표기를 맞춤)"""
+    name = (name or '').strip()
+    return name[:-1] if len(name) > 2 and name[-1] in '시군구' else name
+
+
+def split_addr(addr: str) -> tuple:
+    """주소 -> (짧은 시도명, 시군구 어간)"""
+    tokens = (addr or '').split()
+    if not tokens:
+        return '', ''
+    sigungu = tokens[1] if len(tokens) > 1 and tokens[1][-1] in '시군구' else ''
+    return sido_of(tokens[0]), sigungu_stem(sigungu)
+
+
+def match_key(name: str) -> str:
+    """비교용 이름 - 괄호 내용, 공백/기호, 일반 명사 접미어 제거"""
+    key = unicodedata.normalize('NFC', name or '')
+    key = _NON_WORD.sub('', _BRACKETS.sub(' ', key)).lower()
+    for suffix in GENERIC_SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix) + 1:
+            return key[:-len(suffix)]
+    return key
+
+
+def trigrams(key: str) -> frozenset:
+    if len(key) < 3:
+        return frozenset((key,)) if key else frozenset()
+    return frozenset(key[i:i + 3] for i in range(len(key) - 2))
+
+
+def score(key_a: str, grams_a: frozenset, key_b: str, grams_b: frozenset) -> float:
+    if key_a == key_b:
+        return 1.0
+    short, long = sorted((key_a, key_b), key=len)
+    if len(short) >= 3 and (long.startswith(short) or (short in long and len(short) / len(long) >= CONTAIN_RATIO)):
+        return 0.9
+    return len(grams_a & grams_b) / len(grams_a | grams_b) if grams_a and grams_b else 0.0
+
+
+class _Index:
+    """블록별 3-gram 역색인"""
+
+    def __init__(self):
+        self.entries = []  # (key, grams, obj)
+        self.blocks = defaultdict(lambda: defaultdict(set))  # (시도, 시군구) -> gram -> 인덱스
+
+    def add(self, obj, name: str, sido: str, sigungu: str) -> int:
+        key = match_key(name)
+        grams = trigrams(key)
+        idx = len(self.entries)
+        self.entries.append((key, grams, obj))
+        for block in {(sido, sigungu), (sido, '')}:
+            postings = self.blocks[block]
+            for gram in grams:
+                postings[gram].add(idx)
+        return idx
+
+    def find(self, name: str, sido: str, sigungu: str, accept=None):
+        """같은 블록에서 가장 비슷한 항목, 기준 미달이면 None
+
+        Args:
+            accept: obj -> bool, False인 후보는 건너뜀
+        """
+        key = match_key(name)
+        grams = trigrams(key)
+        postings = self.blocks.get((sido, sigungu or ''))
+        if not key or postings is None:
+            return None
+        candidates = set()
+        for gram in grams:
+            candidates |= postings.get(gram, set())
+
+        best, best_score = None, 0.0
+        for idx in candidates:
+            other_key, other_grams, obj = self.entries[idx]
+            if accept is not None and not accept(obj):
+                continue
+            s = score(key, grams, other_key, other_grams)
+            if s > best_score:
+                best, best_score = obj, s
+        return best if best_score >= MATCH_THRESHOLD else None
+
+
+# ===== 빌드 =====
+
+def _as_int(value) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _coord(lat, lon) -> dict:
+    coord = as_coord(lat, lon)
+    return {'lat': coord[0], 'lon': coord[1]} if coord else {}
+
+
+def _record(kind: str, name: str, addr: str = '', sido: str = '', sigungu: str = '', **fields) -> dict:
+    addr_sido, addr_sigungu = split_addr(addr)
+    record = {
+        'kind': kind, 'name': name.strip(), 'addr': addr.strip(),
+        'sido': sido_of(sido) if sido else addr_sido,
+        'sigungu': sigungu_stem(sigungu) if sigungu else addr_sigungu,
+        'overview': '', 'tel': '', 'lat': None, 'lon': None,
+        'quality': '', 'quality_until': '', 'accessible': False, 'detail': {},
+    }
+    record.update({k: v for k, v in fields.items() if v})
+    return record
+
+
+# 행 -> 카탈로그 레코드 (장소가 아닌 행은 None)
+
+def _camping_record(row: dict):
+    if not (row.get('야영장명') or '').strip():
+        return None
+    return _record(
+        'camping', row.get('야영장명', ''), row.get('주소', ''), row.get('도', ''), row.get('시군구', ''),
+        detail={
+            'glamping': _as_int(row.get('주요시설 글램핑')),
+            'caravan': _as_int(row.get('주요시설 카라반')),
+            'pets': row.get('반려동물출입', ''),
+            'facilities': row.get('부대시설', ''),
+            'themes': row.get('테마환경', ''),
+        },
+    )
+
+
+def _goesan_record(row: dict):
+    if not row.get('관광지명'):
+        return None
+    return _record(
+        'attraction', row.get('관광지명', ''), row.get('소재지도로명주소') or row.get('소재지지번주소', ''),
+        overview=row.get('관광지소개', ''), tel=row.get('관리기관전화번호', ''),
+        **_coord(row.get('위도'), row.get('경도')),
+        detail={'facilities': row.get('공공편익시설정보', '')},
+    )
+
+
+def _open_tourism_record(row: dict):
+    record = _record('attraction', row.get('관광지명', ''), row.get('주소', ''),
+                     overview=row.get('설명', ''), tel=row.get('연락처', ''), accessible=True)
+    # '양평 세미원' - 앞에 붙은 지역명은 비교에서 제외
+    first, _, rest = record['name'].partition(' ')
+    if rest and first in (record['sido'], record['sigungu']):
+        record['name'] = rest
+    return record
+
+
+def _local_content_record(row: dict):
+    title = (row.get('콘텐츠명') or '').strip()
+    prefix = _PREFIX.match(title)
+    if prefix:
+        title = title[prefix.end():]
+    if not title:
+        return None
+    return _record(
+        'attraction', title, sido=row.get('지역명', ''), sigungu=prefix.group(1) if prefix else '',
+        overview=(row.get('헤더 타이틀') or '').strip(),
+        detail={'content_url': row.get('콘텐츠 URL', '')},
+    )
+
+
+def _quality_record(row: dict):
+    if not (row.get('업소명') or '').strip():
+        return None
+    return _record(
+        'shop' if '면세' in row.get('인증유형', '') else 'lodging',
+        row.get('업소명', ''), row.get('주소', ''), tel=row.get('연락처', ''),
+        quality=row.get('인증 등급', ''), quality_until=row.get('인증만료날짜', ''),
+        detail={'certified_as': row.get('인증유형', '')},
+    )
+
+
+# 기준 데이터셋(야영장)을 먼저 넣고 나머지를 차례로 합침
+# (core.datasets.FAMILIES의 계열 이름, 변환 함수, 읽는 컬럼 - 행 키 컬럼 포함)
+READERS = (
+    ('camping', _camping_record,
+     ('야영장명', '주소', '도', '시군구', '주요시설 글램핑', '주요시설 카라반', '반려동물출입', '부대시설', '테마환경')),
+    ('goesan', _goesan_record,
+     ('관광지명', '소재지도로명주소', '소재지지번주소', '관광지소개', '관리기관전화번호', '위도', '경도', '공공편익시설정보')),
+    ('open_tourism', _open_tourism_record, ('관광지명', '주소', '설명', '연락처')),
+    ('local_content', _local_content_record, ('지자체섹션고유ID', '콘텐츠명', '지역명', '헤더 타이틀', '콘텐츠 URL')),
+    ('quality', _quality_record, ('업소명', '주소', '연락처', '인증유형', '인증 등급', '인증만료날짜')),
+)
+
+MERGE_FIELDS = ('addr', 'overview', 'tel', 'lat', 'lon', 'quality', 'quality_until')
+
+# 변경분 반영 시 기존 항목에서 읽는 컬럼 (병합 대상 비교/갱신용)
+_ENTRY_COLUMNS = ('id', 'kind', 'name', 'sido', 'sigungu', *MERGE_FIELDS, 'accessible', 'detail', 'sources')
+
+_IN_CHUNK = 500  # IN (...) 한 번에 넣는 값 수 (SQLite 변수 제한)
+
+
+def _merge(entry: dict, record: dict):
+    for field in MERGE_FIELDS:
+        if record[field] and not entry[field]:
+            entry[field] = record[field]
+    entry['accessible'] = entry['accessible'] or record['accessible']
+    entry['detail'] = {**record['detail'], **entry['detail']}
+    entry['sources'].extend(record['sources'])
+
+
+def _chunks(values: list):
+    for i in range(0, len(values), _IN_CHUNK):
+        yield values[i:i + _IN_CHUNK]
+
+
+def _apply(session, diffs: list) -> dict:
+    """diff를 카탈로그에 반영 - 계열별 연결(병합) 수
+
+    바뀌거나 사라진 행이 속한 항목만 풀어서, 그 항목의 나머지 행과 새 행을
+    빌드와 같은 순서(READERS)로 다시 연결합니다. 나머지 항목은 건드리지 않습니다.
+    """
+    from core.content_generator import normalize_title
+
+    families = [result.family for result in diffs]
+    known = {(family, key): (row_id, entry_id) for row_id, family, key, entry_id in
+             session.query(DatasetRow.id, DatasetRow.family, DatasetRow.key, DatasetRow.entry_id)
+             .filter(DatasetRow.family.in_(families))}
+
+    # 1. 바뀐/사라진 행 제거, 그 행이 속했던 항목은 해체
+    dropped, dissolved = [], set()
+    for result in diffs:
+        for key in (*result.removed, *result.changed):
+            row_id, entry_id = known[(result.family, key)]
+            dropped.append(row_id)
+            if entry_id is not None:
+                dissolved.add(entry_id)
+    for chunk in _chunks(dropped):
+        session.query(DatasetRow).filter(DatasetRow.id.in_(chunk)).delete(synchronize_session=False)
+
+    # 해체한 항목의 API 보충 좌표는 같은 이름/시군구로 다시 만들어지면 옮겨 줌
+    carried = {}
+    rehomed = []  # 해체한 항목에 남아 있던 행 (family, key, None, data, row_id)
+    for chunk in _chunks(sorted(dissolved)):
+        for name, sido, sigungu, lat, lon in (session.query(CatalogueEntry.name, CatalogueEntry.sido, CatalogueEntry.sigungu,
+                                                            CatalogueEntry.lat, CatalogueEntry.lon)
+                                              .filter(CatalogueEntry.id.in_(chunk), CatalogueEntry.lat.isnot(None))):
+            carried[(match_key(name), sido, sigungu)] = (lat, lon)
+        rehomed.extend((row.family, row.key, None, row.data, row.id) for row in
+                       session.query(DatasetRow).filter(DatasetRow.entry_id.in_(chunk)).order_by(DatasetRow.id))
+        session.query(CatalogueEntry).filter(CatalogueEntry.id.in_(chunk)).delete(synchronize_session=False)
+
+    # 2. 남은 항목으로 색인 구성
+    index = _Index()
+    entries = {}
+    next_id = 1
+    for row in session.query(*(getattr(CatalogueEntry, c) for c in _ENTRY_COLUMNS)):
+        entry = row._asdict()
+        entry['detail'] = entry['detail'] or {}
+        entry['sources'] = list(entry['sources'] or [])
+        entries[entry['id']] = entry
+        index.add(entry, entry['name'], entry['sido'] or '', entry['sigungu'] or '')
+        next_id = max(next_id, entry['id'] + 1)
+
+    # 3. 새 행과 해체된 항목의 행을 READERS 순서로 연결
+    rank = {family: i for i, (family, _, _) in enumerate(READERS)}
+    readers = {family: reader for family, reader, _ in READERS}
+    pending = list(rehomed)
+    for result in diffs:
+        for key, (digest, data) in (*result.added.items(), *result.changed.items()):
+            pending.append((result.family, key, digest, data, None))
+    pending.sort(key=lambda item: rank[item[0]])
+
+    dirty, created = set(), []
+    matched = dict.fromkeys(families, 0)
+    new_rows, moved_rows = [], []
+    for family, key, digest, data, row_id in pending:
+        record = readers[family](data)
+        entry = None
+        if record is not None:
+            record['sources'] = [family]
+            # 같은 데이터셋의 행끼리는 서로 다른 장소로 봄
+            kinds = COMPATIBLE[record['kind']]
+            entry = index.find(record['name'], record['sido'], record['sigungu'],
+                               accept=lambda e: e['kind'] in kinds and family not in e['sources'])
+            if entry is not None:
+                _merge(entry, record)
+                dirty.add(entry['id'])
+                matched[family] = matched.get(family, 0) + 1
+            else:
+                entry = dict(record, id=next_id)
+                next_id += 1
+                if entry['lat'] is None:
+                    coord = carried.get((match_key(entry['name']), entry['sido'], entry['sigungu']))
+                    if coord:
+                        entry['lat'], entry['lon'] = coord
+                entries[entry['id']] = entry
+                created.append(entry)
+                index.add(entry, entry['name'], entry['sido'], entry['sigungu'])
+        entry_id = entry['id'] if entry is not None else None
+        if row_id is None:
+            new_rows.append({'family': family, 'key': key, 'hash': digest, 'data': data, 'entry_id': entry_id})
+        else:
+            moved_rows.append({'id': row_id, 'entry_id': entry_id})
+
+    # 4. 바뀐 항목과 행만 기록
+    now = datetime.utcnow()
+    created_ids = {entry['id'] for entry in created}
+    updates = [{c: entries[i][c] for c in ('id', *MERGE_FIELDS, 'accessible', 'detail', 'sources')}
+               for i in dirty - created_ids]
+    if updates:
+        session.bulk_update_mappings(CatalogueEntry, [dict(u, built_at=now) for u in updates])
+    if created:
+        session.execute(insert(CatalogueEntry),
+                        [dict(entry, title_norm=normalize_title(entry['name']), built_at=now) for entry in created])
+    if new_rows:
+        session.execute(insert(DatasetRow), new_rows)
+    if moved_rows:
+        session.bulk_update_mappings(DatasetRow, moved_rows)
+    logger.info(f"카탈로그 반영: 해체 {len(dissolved)}곳, 새 항목 {len(created)}곳, 갱신 {len(updates)}곳")
+    return matched
+
+
+def refresh_catalogue(data_dir: Path = DATA_DIR, full: bool = False) -> dict:
+    """바뀐 데이터셋 파일의 변경분만 카탈로그에 반영 - 반영한 계열별 {'rows', 'added', 'changed', 'removed', 'matched'}
+
+    처음 실행하거나 full이면 카탈로그를 비우고 모든 행을 새로 넣습니다.
+    파일이 없거나 비어 있는 계열은 오류를 남기고 기존 데이터를 그대로 둡니다.
+    """
+    registry = DatasetRegistry(data_dir)
+    with Session() as session:
+        if not full and session.query(DatasetSnapshot.family).first() is None:
+            full = True
+        if full:
+            for model in (CatalogueEntry, DatasetRow, DatasetSnapshot):
+                session.query(model).delete()
+
+        diffs = []
+        for dataset, _, columns in READERS:
+            try:
+                result = registry.diff(dataset, session, force=full, columns=columns)
+            except DatasetError as e:
+                logger.error(f"카탈로그 {dataset} 갱신 건너뜀 (기존 데이터 유지): {e}")
+                continue
+            if result is not None:
+                logger.info(f"카탈로그 {dataset} ({result.path.name}, {result.encoding}): {result.rows}행, {result.summary()}")
+                diffs.append(result)
+        if not diffs:
+            return {}
+
+        changed = [result for result in diffs if result]
+        matched = _apply(session, changed) if changed else {}
+        for result in diffs:
+            registry.save_snapshot(result, session)
+        session.commit()
+
+    return {result.family: {'rows': result.rows, 'added': len(result.added), 'changed': len(result.changed),
+                            'removed': len(result.removed), 'matched': matched.get(result.family, 0)}
+            for result in diffs}
+
+
+def build_catalogue(data_dir: Path = DATA_DIR) -> dict:
+    """카탈로그 전체 재생성"""
+    stats = refresh_catalogue(data_dir, full=True)
+    with Session() as session:
+        logger.info(f"카탈로그 빌드 완료: {session.query(CatalogueEntry.id).count()}곳")
+    return stats
+
+
+# ===== 조회 =====
+
+class Catalogue:
+    """빌드된 카탈로그 조회 (처음 사용할 때 한 번 읽어 블록/3-gram 색인 구성)
+
+    조회 중에는 데이터셋을 다시 읽지 않습니다. 카탈로그는 build-catalogue / refresh-data
+    명령으로만 만들고, 아직 없으면 빈 색인으로 두어 보충 단계를 건너뜁니다.
+    """
+
+    def __init__(self):
+        self._index = None
+        self._spatial = None
+        self._located = set()  # 좌표 보충을 이미 시도한 장소명
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> _Index:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    with Session() as session:
+                        rows = session.query(CatalogueEntry).order_by(CatalogueEntry.id).all()
+                    if not rows:
+                        logger.info("빌드된 카탈로그 없음 - 보충 생략 (python app.py build-catalogue)")
+                    index = _Index()
+                    for row in rows:
+                        index.add(row, row.name, row.sido or '', row.sigungu or '')
+                    self._index = index
+        return self._index
+
+    @property
+    def built(self) -> bool:
+        return bool(self.index.entries)
+
+    def refresh(self, full: bool = False) -> dict:
+        """데이터셋 변경분 반영 후 바뀐 것이 있으면 다음 조회 때 색인을 다시 구성"""
+        stats = refresh_catalogue(full=full)
+        if stats:
+            with self._lock:
+                self._index = None
+                self._spatial = None
+                self._located = set()
+        return stats
+
+    def match(self, name: str, addr: str = '', sido: str = '', sigungu: str = '', kinds=None):
+        """이름과 지역으로 카탈로그 항목 찾기 (CatalogueEntry 또는 None)
+
+        Args:
+            kinds: 지정하면 이 종류의 항목만 후보로 삼음
+        """
+        addr_sido, addr_sigungu = split_addr(addr)
+        sido = sido_of(sido) if sido else addr_sido
+        sigungu = sigungu_stem(sigungu) if sigungu else addr_sigungu
+        accept = (lambda entry: entry.kind in kinds) if kinds else None
+        return self.index.find(name, sido, sigungu, accept=accept)
+
+    # ===== 좌표 =====
+
+    @property
+    def spatial(self) -> GridIndex:
+        """좌표가 있는 항목의 격자 색인"""
+        if self._spatial is None:
+            index = self.index
+            with self._lock:
+                if self._spatial is None:
+                    spatial = GridIndex()
+                    for _, _, entry in index.entries:
+                        if entry.lat is not None and entry.lon is not None:
+                            spatial.add(entry.lat, entry.lon, entry)
+                    self._spatial = spatial
+        return self._spatial
+
+    def attach_coordinates(self, items: list) -> int:
+        """GoCamping 응답 항목의 mapX/mapY로 카탈로그의 빈 좌표를 채워 저장 - 채운 수"""
+        from core.place import Place
+
+        if not self.built:
+            return 0
+        updates = []
+        for item in items:
+            name = item.get('facltNm')
+            if not name or name in self._located:
+                continue
+            self._located.add(name)
+            place = Place.from_camping(item)
+            if place.lat is None:
+                continue
+            entry = self.match(place.title, place.addr, place.do, place.sigungu, kinds={'camping'})
+            if entry is None or entry.lat is not None:
+                continue
+            entry.lat, entry.lon = place.lat, place.lon
+            updates.append({'id': entry.id, 'lat': place.lat, 'lon': place.lon})
+            if self._spatial is not None:
+                self._spatial.add(place.lat, place.lon, entry)
+
+        if updates:
+            with Session() as session:
+                session.bulk_update_mappings(CatalogueEntry, updates)
+                session.commit()
+            logger.info(f"카탈로그 좌표 보충: {len(updates)}곳")
+        return len(updates)
+
+    def locate(self, place):
+        """Place의 (lat, lon) - 자체 좌표, 카탈로그 좌표, 같은 시군구 좌표 평균 순 (모르면 None)
+
+        두루누비 코스처럼 좌표 없이 시군구만 아는 장소는 시군구 중심으로 근사합니다.
+        """
+        if place.lat is not None and place.lon is not None:
+            return place.lat, place.lon
+        entry = self.match(place.title, place.addr, place.do, place.sigungu)
+        if entry is not None and entry.lat is not None:
+            return entry.lat, entry.lon
+        sido, sigungu = split_addr(place.addr)
+        points = [(e.lat, e.lon) for e in self.places(sido=place.do or sido, sigungu=place.sigungu or sigungu)
+                  if e.lat is not None] if (place.sigungu or sigungu) else []
+        if not points:
+            return None
+        return sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points)
+
+    def near(self, lat: float, lon: float, radius_km: float = 20, kind: str = None) -> list:
+        """반경 안의 [(거리 km, CatalogueEntry)] - 가까운 순"""
+        accept = (lambda entry: entry.kind == kind) if kind else None
+        return self.spatial.within(lat, lon, radius_km, accept=accept)
+
+    def nearest(self, lat: float, lon: float, k: int = 5, kind: str = None, max_km: float = 100) -> list:
+        """가까운 k개의 [(거리 km, CatalogueEntry)]"""
+        accept = (lambda entry: entry.kind == kind) if kind else None
+        return self.spatial.nearest(lat, lon, k, max_km=max_km, accept=accept)
+
+    def nearby_places(self, place, radius_km: float = 20, kind: str = 'camping', limit: int = 5) -> list:
+        """장소 주변의 [(거리 km, CatalogueEntry)] (예: 두루누비 코스 20km 안 캠핑장) - 자기 자신은 제외"""
+        coord = self.locate(place)
+        if coord is None:
+            return []
+        own = match_key(place.title)
+        return [(d, e) for d, e in self.near(*coord, radius_km, kind=kind) if match_key(e.name) != own][:limit]
+
+    # ===== 목록 =====
+
+    def places(self, kind: str = None, sido: str = None, sigungu: str = None) -> list:
+        sido = sido_of(sido) if sido else None
+        sigungu = sigungu_stem(sigungu) if sigungu else None
+        return [obj for _, _, obj in self.index.entries
+                if (kind is None or obj.kind == kind)
+                and (sido is None or obj.sido == sido)
+                and (sigungu is None or obj.sigungu == sigungu)]
+
+    def enrich(self, place):
+        """Place에 카탈로그 정보(설명, 연락처, 유효한 품질인증, 열린관광지 여부) 보충"""
+        kinds = COMPATIBLE['lodging'] if 'camping' in place.source else None
+        entry = self.match(place.title, place.addr, place.do, place.sigungu, kinds=kinds)
+        if entry is None:
+            return place
+        if not place.overview and entry.overview:
+            place.overview = entry.overview
+        if not place.tel and entry.tel:
+            place.tel = entry.tel
+        if entry.quality and (entry.quality_until or '9999') >= date.today().isoformat():
+            place.quality = entry.quality
+        place.accessible = place.accessible or bool(entry.accessible)
+        return place
+
+    def enrich_all(self, places: list) -> list:
+        try:
+            if not self.built:
+                return places
+            for place in places:
+                self.enrich(place)
+        except Exception as e:
+            logger.warning(f"카탈로그 보충 실패: {e}")
+        return places
+
+
+_catalogue = None
+_catalogue_lock = threading.Lock()
+
+
+def load_catalogue() -> Catalogue:
+    """프로세스 공용 인스턴스"""
+    global _catalogue
+    if _catalogue is None:
+        with _catalogue_lock:
+            if _catalogue is None:
+                _catalogue = Catalogue()
+    return _catalogue
@@ -0,0 +1,248 @@
+"""호스트별 서킷 브레이커 - 장애 중인 외부 API를 타임아웃까지 기다리지 않고 바로 건너뜀
+
+- closed: 최근 WINDOW_SECONDS 동안의 호출 결과를 모아 MIN_CALLS건 이상이고
+  실패율이 FAILURE_RATE 이상이면 open
+- open: OPEN_FOR초 동안 요청을 보내지 않고 CircuitOpen (호출자는 캐시로 폴백)
+- half_open: 대기 시간이 지나면 시험 요청 하나만 통과 - 성공하면 closed,
+  실패하면 다시 open (대기 시간은 두 배씩, 최대 MAX_OPEN_FOR초)
+
+프로세스 공용이라 데몬의 작업/워커 스레드가 같은 상태를 봅니다.
+open 상태는 CircuitState에 기록해 다른 프로세스(worker 등)가 시작할 때 이어받고,
+상태는 tap_circuit_state 등의 지표로 노출합니다.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from core.database import Session, CircuitState
+from core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 300.0
+MIN_CALLS = 3
+FAILURE_RATE = 0.5
+OPEN_FOR = 30.0
+MAX_OPEN_FOR = 600.0
+
+CLOSED, HALF_OPEN, OPEN = 'closed', 'half_open', 'open'
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpen(Exception):
+    """호스트의 서킷이 열려 있어 요청을 보내지 않음"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} 서킷 열림 - {retry_in:.0f}초 후 재시도")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 (여러 스레드에서 동시에 호출 가능)
+
+    Args:
+        on_change: (breaker, 이전 상태) -> None, 상태가 바뀔 때 잠금 밖에서 호출
+    """
+
+    def __init__(self, host: str, window: float = WINDOW_SECONDS, min_calls: int = MIN_CALLS,
+                 failure_rate: float = FAILURE_RATE, open_for: float = OPEN_FOR,
+                 max_open_for: float = MAX_OPEN_FOR, clock=time.monotonic, on_change=None):
+        self.host = host
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.base_open_for = open_for
+        self.max_open_for = max_open_for
+        self.clock = clock
+        self.on_change = on_change
+        self.state = CLOSED
+        self.open_for = open_for
+        self._opened_at = 0.0
+        self._results = deque()  # (시각, 성공 여부)
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float):
+        while self._results and self._results[0][0] < now - self.window:
+            self._results.popleft()
+
+    def stats(self) -> tuple:
+        """창 안의 (호출 수, 실패 수)"""
+        with self._lock:
+            self._trim(self.clock())
+            return len(self._results), sum(1 for _, ok in self._results if not ok)
+
+    def retry_in(self) -> float:
+        """open이면 시험 요청까지 남은 초, 아니면 0"""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_for - self.clock())
+
+    def is_open(self) -> bool:
+        """지금 요청하면 거절되는지"""
+        return (self.state == OPEN and self.retry_in() > 0) or (self.state == HALF_OPEN and self._probing)
+
+    def _transition(self, state: str, now: float):
+        previous, self.state = self.state, state
+        if state == OPEN:
+            self._opened_at = now
+        elif state == CLOSED:
+            self._results.clear()
+            self.open_for = self.base_open_for
+        return previous
+
+    def _notify(self, previous):
+        if previous is not None and previous != self.state and self.on_change:
+            self.on_change(self, previous)
+
+    def acquire(self):
+        """요청 전 확인 - 보낼 수 없으면 CircuitOpen (half_open이면 시험 요청 하나만 통과)"""
+        previous = None
+        with self._lock:
+            now = self.clock()
+            if self.state == OPEN:
+                if now < self._opened_at + self.open_for:
+                    registry.inc('tap_circuit_rejected_total', host=self.host)
+                    raise CircuitOpen(self.host, self._opened_at + self.open_for - now)
+                previous = self._transition(HALF_OPEN, now)
+            if self.state == HALF_OPEN:
+                if self._probing:
+                    registry.inc('tap_circuit_rejected_total', host=self.host)
+                    raise CircuitOpen(self.host, 0.0)
+                self._probing = True
+        self._notify(previous)
+
+    def record(self, ok: bool):
+        """요청 결과 기록"""
+        previous = None
+        with self._lock:
+            now = self.clock()
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if ok:
+                    previous = self._transition(CLOSED, now)
+                else:
+                    self.open_for = min(self.open_for * 2, self.max_open_for)
+                    previous = self._transition(OPEN, now)
+            elif self.state == CLOSED:
+                self._results.append((now, ok))
+                self._trim(now)
+                calls = len(self._results)
+                failures = sum(1 for _, r in self._results if not r)
+                if not ok and calls >= self.min_calls and failures / calls >= self.failure_rate:
+                    previous = self._transition(OPEN, now)
+        self._notify(previous)
+
+    def release(self):
+        """결과를 판정할 수 없이 끝난 요청 (half_open 시험 요청이었다면 다음 요청에 기회를 넘김)"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = False
+
+    def trip(self, seconds: float):
+        """다른 프로세스가 기록한 open 상태 이어받기 (on_change는 호출하지 않음)"""
+        with self._lock:
+            if self.state != OPEN:
+                self.open_for = max(self.base_open_for, seconds)
+                self._transition(OPEN, self.clock() - self.open_for + seconds)
+
+    def call(self, fn, is_failure=None, failure_exceptions: tuple = (Exception,)):
+        """acquire -> fn() -> 결과 기록
+
+        Args:
+            is_failure: 결과 -> bool, 정상 반환이지만 호스트 장애로 볼 결과 (예: 5xx)
+            failure_exceptions: 호스트 장애로 볼 예외, 그 밖의 예외는 판정하지 않음
+        """
+        self.acquire()
+        try:
+            result = fn()
+        except failure_exceptions:
+            self.record(False)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record(not (is_failure and is_failure(result)))
+        return result
+
+
+class BreakerRegistry:
+    """호스트별 서킷 모음 - 처음 사용할 때 CircuitState의 open 상태를 불러옴"""
+
+    def __init__(self, persist: bool = True, **options):
+        self.persist = persist
+        self.options = options
+        self._breakers = {}
+        self._lock = threading.Lock()
+        self._loaded = not persist
+
+    def _load(self):
+        try:
+            with Session() as session:
+                rows = session.query(CircuitState).filter(CircuitState.open_until > datetime.utcnow()).all()
+        except Exception as e:
+            logger.warning(f"서킷 상태 로드 실패: {e}")
+            rows = []
+        now = datetime.utcnow()
+        for row in rows:
+            self._create(row.host).trip((row.open_until - now).total_seconds())
+            registry.set_gauge('tap_circuit_state', STATE_VALUES[OPEN], host=row.host)
+        if rows:
+            logger.info(f"열린 서킷 {len(rows)}개 이어받음: {', '.join(r.host for r in rows)}")
+
+    def _create(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers[host] = CircuitBreaker(host, on_change=self._changed, **self.options)
+        registry.set_gauge('tap_circuit_state', STATE_VALUES[CLOSED], host=host)
+        return breaker
+
+    def get(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                if not self._loaded:
+                    self._loaded = True
+                    self._load()
+                breaker = self._breakers.get(host) or self._create(host)
+        return breaker
+
+    def is_open(self, host: str) -> bool:
+        breaker = self._breakers.get(host) if self._loaded else self.get(host)
+        return breaker is not None and breaker.is_open()
+
+    def states(self) -> dict:
+        """{호스트: 상태}"""
+        return {host: breaker.state for host, breaker in list(self._breakers.items())}
+
+    def _changed(self, breaker: CircuitBreaker, previous: str):
+        registry.set_gauge('tap_circuit_state', STATE_VALUES[breaker.state], host=breaker.host)
+        registry.inc('tap_circuit_transitions_total', host=breaker.host, state=breaker.state)
+        calls, failures = breaker.stats()
+        if breaker.state == OPEN:
+            logger.warning(f"서킷 열림: {breaker.host} ({previous} -> open, {breaker.open_for:.0f}초 차단, "
+                           f"최근 {calls}건 중 실패 {failures}건)")
+        else:
+            logger.info(f"서킷 {breaker.state}: {breaker.host}")
+        if breaker.state != HALF_OPEN:
+            self._save(breaker, failures)
+
+    def _save(self, breaker: CircuitBreaker, failures: int):
+        """open이면 재개 시각, closed면 빈 값을 기록 (다른 프로세스용)"""
+        if not self.persist:
+            return
+        now = datetime.utcnow()
+        open_until = now + timedelta(seconds=breaker.retry_in()) if breaker.state == OPEN else None
+        try:
+            stmt = sqlite_insert(CircuitState).values(host=breaker.host, state=breaker.state, failures=failures,
+                                                      open_until=open_until, updated_at=now)
+            with Session() as session:
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=['host'],
+                    set_={k: stmt.excluded[k] for k in ('state', 'failures', 'open_until', 'updated_at')},
+                ))
+                session.commit()
+        except Exception as e:
+            logger.warning(f"서킷 상태 저장 실패({breaker.host}): {e}")
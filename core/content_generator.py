@@ -1,17 +1,26 @@
+import os
 import logging
 import random
 import re
+import threading
 import unicodedata
 from pathlib import Path
 import yaml
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from core.theme_selector import ThemeSelector
 from core.image_handler import ImageHandler
 from core.database import Session, PlaceLog
+from core.place import Place
 from core.naver_map import get_naver_map_link
+from core.aho_corasick import AhoCorasick
+from core.region_index import RegionIndex
 
 logger = logging.getLogger(__name__)
 
+# process_html 토큰: 일반 <h3> 제목 또는 info-box 블록
+SECTION_TOKEN = re.compile(r'<h3>([^<]*)</h3>|<div class="info-box">(.*?)</div>', re.DOTALL)
+
 def normalize_title(title):
     if not title: return ""
     t = unicodedata.normalize('NFKD', title)
@@ -25,10 +34,18 @@ def extract_base_name(title):
     match = re.match(r'^([가-힣]+(?:길|로|trail)?)', title)
     return match.group(1) if match else title[:4]
 
+DURUNUBI_SOURCES = {'durunubi_walk': '1', 'durunubi_bike': '2'}
+
+
 class ContentGenerator:
+    IMAGE_WORKERS = 4
+    MIN_ITEMS = 3
+    MAX_ITEMS = 6
+
     def __init__(self):
         self.config_path = Path(__file__).parent.parent / "config"
         self._regions = None
+        self._region_index = None
         self._image_handler = None
 
     @property
@@ -36,13 +53,17 @@ class ContentGenerator:
         if self._regions is None:
             with open(self.config_path / "regions.yaml", 'r', encoding='utf-8') as f:
                 self._regions = yaml.safe_load(f)
+            self._region_index = RegionIndex(self._regions)
         return self._regions
 
+    @property
+    def region_index(self):
+        if self._region_index is None:
+            self._region_index = RegionIndex(self.regions)
+        return self._region_index
+
     def _get_region_group(self, addr):
-        for group, cities in self.regions.items():
-            for city in cities:
-                if city in addr: return group
-        return None
+        return self.region_index.resolve(addr)
 
     def _get_image_handler(self):
         if self._image_handler is None:
@@ -50,189 +71,255 @@ class ContentGenerator:
             self._image_handler = ImageHandler(photo_api=load_photo_client())
         return self._image_handler
 
-    def fetch_items(self, theme_data):
-        source = theme_data.get('source', 'camping')
-        
-        if source == 'camping':
-            return self._fetch_camping(theme_data)
-        elif source in ('durunubi_walk', 'durunubi_bike'):
-            return self._fetch_durunubi(theme_data, source)
-        else:
-            return self._fetch_camping(theme_data)
-
-    def _fetch_camping(self, theme_data):
-        from core.camping_api import load_camping_client
-        api = load_camping_client()
-        raw_items = api.get_campsite_list(num_of_rows=200)
-        
-        filter_key = theme_data.get('filter_key')
-        filter_contains = theme_data.get('filter_contains')
-        filter_value = theme_data.get('filter_value')
+    def fetch_items(self, theme_data, region=None, series=None):
+        """테마에 맞는 장소 목록 - (items, region, theme_data)
         
-        if filter_key and (filter_contains or filter_value):
-            filtered = []
-            for item in raw_items:
-                val = item.get(filter_key, '')
-                if filter_contains and filter_contains in str(val):
-                    filtered.append(item)
-                elif filter_value and str(val) == str(filter_value):
-                    filtered.append(item)
-            logger.info(f"테마 필터링: {len(raw_items)} -> {len(filtered)}")
-            raw_items = filtered if filtered else raw_items
+        Args:
+            region: 지정하면 그 지역 그룹에서만 고름 (계획된 슬롯 실행 시)
+            series: 지정하면 해당 시리즈 코스를 맨 앞에 둠
+        """
+        grouped = self.candidate_groups(theme_data)
         
-        grouped = defaultdict(list)
-        with Session() as session:
-            for item in raw_items:
-                title = item.get('facltNm')
-                addr = item.get('addr1', '')
-                group = self._get_region_group(addr)
-                if not group: continue
-                
-                norm_name = normalize_title(title)
-                if not session.query(PlaceLog).filter_by(title_norm=norm_name).first():
-                    grouped[group].append({
-                        'title': title,
-                        'addr1': addr,
-                        'overview': item.get('intro', '') or item.get('lineIntro', ''),
-                        'firstimage': item.get('firstImageUrl', ''),
-                        'source': 'camping'
-                    })
-        
-        valid_regions = [k for k, v in grouped.items() if len(v) >= 3]
+        valid_regions = [k for k, v in grouped.items() if len(v) >= self.MIN_ITEMS]
+        if region is not None:
+            valid_regions = [region] if region in valid_regions else []
         if not valid_regions: return [], "", theme_data
         
         selected_region = random.choice(valid_regions)
-        return grouped[selected_region][:6], selected_region, theme_data
+        items = grouped[selected_region]
+        if series:
+            items = sorted(items, key=lambda item: item.get('series') != series)
+        return items[:self.MAX_ITEMS], selected_region, theme_data
 
-    def _fetch_durunubi(self, theme_data, source):
-        from core.durunubi_api import load_durunubi_client
-        api = load_durunubi_client()
+    def candidate_groups(self, theme_data, raw=None, used=None) -> dict:
+        """지역 그룹별 후보 장소 {group: [item, ...]} - 이미 쓴 장소는 제외
         
-        course_type = "1" if source == 'durunubi_walk' else "2"
-        raw_items = api.get_course_list(course_type=course_type, num_of_rows=200)
+        Args:
+            raw: raw_items(source) 결과 (여러 테마를 평가할 때 한 번만 받아 재사용)
+            used: used_places() 결과
+        """
+        source = theme_data.get('source', 'camping')
+        if raw is None:
+            raw = self.raw_items(source)
+        if used is None:
+            used = self.used_places()
         
+        if source in DURUNUBI_SOURCES:
+            return self._group_durunubi(theme_data, source, raw, used)
+        return self._group_camping(theme_data, raw, used)
+
+    def raw_items(self, source):
+        """소스의 원본 목록 (캠핑: API 응답 항목, 두루누비: 로컬 코스 저장소 행)"""
+        if source in DURUNUBI_SOURCES:
+            from core.course_store import load_course_store
+            store = load_course_store(region_index=self.region_index)
+            return store.courses(DURUNUBI_SOURCES[source])
+        
+        from core.camping_api import load_camping_client
+        return load_camping_client().get_campsite_list(num_of_rows=200)
+
+    def used_places(self) -> set:
+        """이미 발행한 장소명 (정규화)"""
+        with Session() as session:
+            return {t for (t,) in session.query(PlaceLog.title_norm)}
+
+    @staticmethod
+    def _apply_theme_filter(rows, theme_data, value_of):
         filter_key = theme_data.get('filter_key')
         filter_contains = theme_data.get('filter_contains')
         filter_value = theme_data.get('filter_value')
         
-        if filter_key and (filter_contains or filter_value):
-            filtered = []
-            for item in raw_items:
-                val = item.get(filter_key, '')
-                if filter_contains and filter_contains in str(val):
-                    filtered.append(item)
-                elif filter_value and str(val) == str(filter_value):
-                    filtered.append(item)
-            logger.info(f"테마 필터링: {len(raw_items)} -> {len(filtered)}")
-            raw_items = filtered if filtered else raw_items
-        
-        seen_series = set()
-        diverse_items = []
-        for item in raw_items:
-            title = item.get('crsKorNm', '')
-            base = extract_base_name(title)
-            if base not in seen_series:
-                seen_series.add(base)
-                diverse_items.append(item)
-        
-        logger.info(f"시리즈 필터링: {len(raw_items)} -> {len(diverse_items)}")
-        raw_items = diverse_items if len(diverse_items) >= 5 else raw_items
+        if not (filter_key and (filter_contains or filter_value)):
+            return rows
         
+        filtered = []
+        for row in rows:
+            val = value_of(row, filter_key)
+            if filter_contains and filter_contains in str(val):
+                filtered.append(row)
+            elif filter_value and str(val) == str(filter_value):
+                filtered.append(row)
+        logger.info(f"테마 필터링: {len(rows)} -> {len(filtered)}")
+        return filtered if filtered else rows
+
+    def _group_camping(self, theme_data, raw_items, used):
+        raw_items = self._apply_theme_filter(raw_items, theme_data, lambda item, key: item.get(key, ''))
+        
+        groups = self.region_index.resolve_many(item.get('addr1', '') for item in raw_items)
         grouped = defaultdict(list)
-        with Session() as session:
-            for item in raw_items:
-                title = item.get('crsKorNm', '')
-                addr = item.get('sigun', '') or item.get('areaNm', '')
-                group = self._get_region_group(addr)
-                if not group: continue
-                
-                norm_name = normalize_title(title)
-                if not session.query(PlaceLog).filter_by(title_norm=norm_name).first():
-                    grouped[group].append({
-                        'title': title,
-                        'addr1': addr,
-                        'overview': item.get('crsContents', '') or item.get('crsSummary', ''),
-                        'firstimage': item.get('crsImg', ''),
-                        'source': source
-                    })
-        
-        valid_regions = [k for k, v in grouped.items() if len(v) >= 3]
-        if not valid_regions: return [], "", theme_data
+        for item, group in zip(raw_items, groups):
+            title = item.get('facltNm')
+            if not group: continue
+            if normalize_title(title) in used: continue
+            
+            grouped[group].append(Place.from_camping(item, region=group))
+        return grouped
+
+    def _group_durunubi(self, theme_data, source, courses, used):
+        """시리즈 다양화는 전체 코스를 대상으로 지역 그룹별 적용"""
+        courses = self._apply_theme_filter(courses, theme_data, lambda course, key: (course.data or {}).get(key, ''))
         
-        selected_region = random.choice(valid_regions)
-        items = grouped[selected_region][:6]
+        grouped = defaultdict(list)
+        seen_series = defaultdict(set)
+        for course in courses:
+            group = course.region_group
+            if not group or course.series_key in seen_series[group]: continue
+            if normalize_title(course.title) in used: continue
+            
+            seen_series[group].add(course.series_key)
+            grouped[group].append(Place.from_course(course, source))
         
-        return items, selected_region, theme_data
+        logger.info(f"시리즈 필터링: {len(courses)} -> {sum(len(v) for v in grouped.values())}")
+        return grouped
 
     def process_html(self, content, items, theme, region=""):
-        """HTML 후처리 - 이미지 및 지도 링크 삽입 (SEO 최적화)"""
+        """HTML 후처리 - 이미지 및 지도 링크 삽입 (SEO 최적화)
+        
+        문서를 한 번만 훑으면서 <h3>와 info-box를 차례로 만나고,
+        장소명 키워드 전체를 한 번에 대조해 삽입할 위치를 정합니다.
+        """
         handler = self._get_image_handler()
         
-        for item in items:
+        # 장소별 이미지 검색은 병렬로 (같은 검색어 요청은 http_client에서 하나로 합쳐짐)
+        with ThreadPoolExecutor(max_workers=self.IMAGE_WORKERS) as pool:
+            img_urls = list(pool.map(lambda item: handler.get_image(item, region=region, theme=theme), items))
+        
+        keywords = []
+        img_tags = []
+        map_tags = []
+        for item, img_url in zip(items, img_urls):
             title = item['title']
+            keywords.append(title.split()[0] if ' ' in title else title[:10])
             
-            # SEO 최적화된 이미지 alt 텍스트
+            # 1. 이미지 - SEO 최적화된 alt 텍스트
             alt_text = f"{title} - {region} {theme} 위치 및 정보"
-            
-            # 1. 이미지 삽입
-            img_url = handler.get_image(item, region=region, theme=theme)
-            if img_url:
-                img_tag = f'<figure class="wp-block-image"><img src="{img_url}" alt="{alt_text}" title="{title}"/></figure>'
-                title_keyword = title.split()[0] if ' ' in title else title[:10]
-                pattern = f'(<h3>[^<]*{re.escape(title_keyword)}[^<]*</h3>)'
-                if re.search(pattern, content):
-                    content = re.sub(pattern, f'\\1\n{img_tag}', content, count=1)
+            img_tags.append(
+                f'<figure class="wp-block-image"><img src="{img_url}" alt="{alt_text}" title="{title}"/></figure>'
+                if img_url else ''
+            )
             
             # 2. 지도 링크 - 현재 페이지에서 열기 (전면 광고용)
             map_url = get_naver_map_link(title)
-            map_tag = f'<p class="map-link"><a href="{map_url}">📍 {title} 네이버 지도에서 보기</a></p>'
+            map_tags.append(f'<p class="map-link"><a href="{map_url}">📍 {title} 네이버 지도에서 보기</a></p>')
+        
+        matcher = AhoCorasick(keywords)
+        seen = set()      # h3를 이미 만난 장소
+        waiting = set()   # h3는 만났지만 아직 info-box를 만나지 못한 장소
+        out = []
+        pos = 0
+        
+        for token in SECTION_TOKEN.finditer(content):
+            h3_text, box_content = token.group(1), token.group(2)
             
-            title_keyword = title.split()[0] if ' ' in title else title[:10]
-            section_pattern = f'(<h3>[^<]*{re.escape(title_keyword)}[^<]*</h3>.*?)(<div class="info-box">)(.*?)(</div>)'
+            if h3_text is not None:
+                matched = sorted(matcher.find_ids(h3_text) - seen)
+                if not matched:
+                    continue
+                seen.update(matched)
+                waiting.update(matched)
+                out.append(content[pos:token.end()])
+                # 같은 h3를 공유하면 나중 장소의 이미지가 h3 바로 아래 (기존 동작 유지)
+                out.extend(f'\n{img_tags[i]}' for i in reversed(matched) if img_tags[i])
+                pos = token.end()
             
-            def replace_info_box(match):
-                before = match.group(1)
-                box_open = match.group(2)
-                box_content = match.group(3)
-                box_close = match.group(4)
-                
+            elif waiting:
+                # 대기 중인 장소 모두 이 박스가 첫 info-box - 박스당 지도 링크는 하나
                 if '네이버 지도' not in box_content:
-                    return f'{before}{box_open}{box_content}\n{map_tag}\n{box_close}'
-                return match.group(0)
-            
-            content = re.sub(section_pattern, replace_info_box, content, count=1, flags=re.DOTALL)
+                    out.append(content[pos:token.end(2)])
+                    out.append(f'\n{map_tags[min(waiting)]}\n')
+                    pos = token.end(2)
+                waiting.clear()
         
-        # 3. 마무리 섹션에 안내 문구 추가
+        out.append(content[pos:])
+        content = ''.join(out)
+        
+        # 3. 마무리 섹션의 마지막 문단 뒤에 안내 문구 추가
         notice = '<p class="notice">※ 최신 가격 정보와 상세 문의 사항은 네이버 지도 후기를 참조해 주세요.</p>'
-        if '마무리</h2>' in content and notice not in content:
-            content = re.sub(
-                r'(마무리</h2>.*?)(<p>.*?</p>)(\s*)$',
-                f'\\1\\2\n{notice}\\3',
-                content,
-                flags=re.DOTALL
-            )
+        closing = content.find('마무리</h2>')
+        if closing >= 0 and notice not in content:
+            body = content.rstrip()
+            if body.endswith('</p>') and content.find('<p>', closing) >= 0:
+                content = f'{body}\n{notice}{content[len(body):]}'
         
         return content
 
-    def select_theme_with_images(self):
+    def _try_theme(self, theme_data, cancelled=None):
+        """후보 테마 하나를 시도 - 아이템과 이미지가 충분하면 (items, region, theme_data), 아니면 None
+
+        cancelled가 설정되면(다른 후보가 이미 확정됨) 남은 API 요청을 보내지 않고 None.
+        """
+        if cancelled is not None and cancelled.is_set():
+            return None
+        items, region, theme_data = self.fetch_items(theme_data)
+        if not items or (cancelled is not None and cancelled.is_set()):
+            return None
+        handler = self._get_image_handler()
+        if not handler.check_images_available(items, region, theme_data.get('theme', ''), min_images=2,
+                                              cancelled=cancelled):
+            return None
+        return items, region, theme_data
+
+    def _theme_candidates(self, selector, count):
+        """서로 다른 (소스, 테마) 후보 count개 (히스토리에는 남기지 않음)"""
+        candidates, seen = [], set()
+        for _ in range(count * 5):
+            theme_data = selector.select(record=False)
+            key = (theme_data['source'], theme_data.get('theme'))
+            if key not in seen:
+                seen.add(key)
+                candidates.append(theme_data)
+            if len(candidates) >= count:
+                break
+        return candidates
+
+    def select_theme_with_images(self, attempts: int = 3, speculative: int = None):
+        """이미지까지 확보 가능한 테마 선택
+        
+        speculative개의 후보를 동시에 시도해 먼저 성공한 후보를 확정하고 나머지는 취소합니다.
+        (1이면 한 번에 하나씩 순서대로 시도) 히스토리에는 확정된 선택만 기록됩니다.
+        """
         with open(self.config_path / "themes.yaml", 'r', encoding='utf-8') as f:
             themes = yaml.safe_load(f)
         selector = ThemeSelector(themes, Path("cache/theme_history.json"))
         
-        handler = self._get_image_handler()
+        if speculative is None:
+            speculative = int(os.getenv('SPECULATIVE_THEMES', '3'))
+        speculative = max(1, min(speculative, attempts))
+        candidates = self._theme_candidates(selector, attempts)
+        self._get_image_handler()  # 지연 초기화는 스레드 시작 전에
+        self.region_index
         
-        for attempt in range(3):
-            theme_data = selector.select()
-            items, region, theme_data = self.fetch_items(theme_data)
-            
-            if items and handler.check_images_available(items, region, theme_data.get('theme', ''), min_images=2):
-                logger.info(f"시도 {attempt + 1}: 성공")
-                return items, region, theme_data
-            
-            logger.info(f"시도 {attempt + 1}: 이미지 부족, 재시도")
+        if speculative == 1:
+            for attempt, theme_data in enumerate(candidates):
+                result = self._try_theme(theme_data)
+                if result:
+                    logger.info(f"시도 {attempt + 1}: 성공")
+                    selector.commit(result[2])
+                    return result
+                logger.info(f"시도 {attempt + 1}: 이미지 부족, 재시도")
+            return [], "", {}
+        
+        cancelled = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=speculative)
+        try:
+            futures = {pool.submit(self._try_theme, t, cancelled): t for t in candidates}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"후보 실패 ({futures[future].get('theme')}): {e}")
+                    continue
+                if result:
+                    logger.info(f"병렬 시도 성공: {result[2].get('theme')} (후보 {len(candidates)}개)")
+                    selector.commit(result[2])
+                    return result
+                logger.info(f"후보 탈락: {futures[future].get('theme')}")
+        finally:
+            # 남은 후보는 취소 - 실행 중인 후보는 결과를 버림
+            cancelled.set()
+            pool.shutdown(wait=False, cancel_futures=True)
         
         return [], "", {}
 
-
 def load_content_generator():
     return ContentGenerator()
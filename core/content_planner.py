@@ -0,0 +1,225 @@
+"""콘텐츠 캘린더 - 며칠치 (소스, 주제, 지역, 시리즈) 배정을 미리 검증해 두고 발행 때 하나씩 꺼냄"""
+
+import random
+import logging
+from datetime import datetime, date, timedelta
+from pathlib import Path
+import yaml
+from sqlalchemy import or_, and_
+from core.database import Session, PlanSlot
+from core.theme_selector import ThemeSelector
+
+logger = logging.getLogger(__name__)
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+# 이 시간이 지나도 끝나지 않은 running 슬롯은 죽은 워커의 것으로 보고 다시 꺼냄
+LEASE_TIMEOUT = timedelta(minutes=30)
+
+
+def _available(now: datetime):
+    """꺼낼 수 있는 슬롯 조건 - planned 또는 임대가 만료된 running"""
+    return or_(
+        PlanSlot.status == 'planned',
+        and_(PlanSlot.status == 'running',
+             or_(PlanSlot.used_at.is_(None), PlanSlot.used_at < now - LEASE_TIMEOUT)),
+    )
+
+
+def pending_slots() -> int:
+    """꺼낼 수 있는 슬롯 수 (계획기를 만들지 않고 확인)"""
+    with Session() as session:
+        return session.query(PlanSlot).filter(_available(datetime.utcnow())).count()
+
+
+class ContentPlanner:
+    """ThemeSelector의 다양성 규칙을 제약 조건으로 삼아 슬롯을 배정
+
+    - 직전 소스는 다시 쓰지 않음 (모든 소스가 막히면 완화)
+    - 최근 2개 지역, 최근 3개 걷기길 시리즈는 제외
+    - 같은 (소스, 주제, 지역)은 계획 안에서 한 번만
+    """
+
+    def __init__(self, generator=None, themes: dict = None, selector: ThemeSelector = None,
+                 slots_per_day: int = None):
+        if generator is None:
+            from core.content_generator import ContentGenerator
+            generator = ContentGenerator()
+        self.generator = generator
+        if themes is None:
+            with open(CONFIG_DIR / "themes.yaml", 'r', encoding='utf-8') as f:
+                themes = yaml.safe_load(f)
+        self.themes = themes
+        self.selector = selector or ThemeSelector(themes, Path("cache/theme_history.json"))
+        if slots_per_day is None:
+            with open(CONFIG_DIR / "settings.yaml", 'r', encoding='utf-8') as f:
+                settings = yaml.safe_load(f) or {}
+            slots_per_day = settings.get('content', {}).get('posts_per_day', 3)
+        self.slots_per_day = slots_per_day
+
+    # ===== 계획 =====
+
+    def feasibility(self) -> list:
+        """후보 장소가 충분한 (소스, 주제, 지역) 조합과 후보 수
+
+        소스별 원본 목록과 발행 이력은 한 번만 읽고 모든 주제에 재사용합니다.
+        """
+        generator = self.generator
+        used = generator.used_places()
+        options = []
+        for source, theme_list in self.themes.items():
+            try:
+                raw = generator.raw_items(source)
+            except Exception as e:
+                logger.warning(f"후보 집계 실패 ({source}): {e}")
+                continue
+            for theme in theme_list or []:
+                theme_data = dict(theme, source=source)
+                for region, items in generator.candidate_groups(theme_data, raw, used).items():
+                    if len(items) < generator.MIN_ITEMS:
+                        continue
+                    series = sorted({i['series'] for i in items if i.get('series') in ThemeSelector.TRAIL_SERIES})
+                    options.append({'source': source, 'theme_data': theme_data, 'region': region,
+                                    'count': len(items), 'series': series})
+        logger.info(f"가능한 조합: {len(options)}개")
+        return options
+
+    def _pick(self, options: list, recent: dict, planned: set):
+        """제약을 만족하는 조합 하나 (소스를 먼저 고르고 그 안에서 조합 선택 - select와 같은 분포)"""
+        excluded_regions = recent['region'][-2:]
+        excluded_series = recent['series'][-3:]
+
+        eligible = []
+        for option in options:
+            key = (option['source'], option['theme_data'].get('theme'), option['region'])
+            if key in planned or option['region'] in excluded_regions:
+                continue
+            series = None
+            if option['series']:
+                allowed = [s for s in option['series'] if s not in excluded_series]
+                if not allowed:
+                    continue
+                series = random.choice(allowed)
+            eligible.append((option, series))
+
+        if not eligible:
+            return None
+        by_source = {}
+        for option, series in eligible:
+            by_source.setdefault(option['source'], []).append((option, series))
+        sources = [s for s in by_source if s not in recent['source'][-1:]] or list(by_source)
+        return random.choice(by_source[random.choice(sources)])
+
+    def plan(self, days: int = 3) -> list:
+        """마지막 계획 다음 날부터 days일치 슬롯을 만들어 한 트랜잭션으로 저장"""
+        history = self.selector.recent()
+        recent = {
+            'source': list(history['recent_sources']),
+            'region': list(history['recent_regions']),
+            'series': list(history['recent_series']),
+        }
+
+        with Session() as session:
+            pending = (session.query(PlanSlot).filter(PlanSlot.status.in_(('planned', 'running')))
+                       .order_by(PlanSlot.day, PlanSlot.position).all())
+        planned = set()
+        for slot in pending:
+            planned.add((slot.source, slot.theme, slot.region))
+            recent['source'].append(slot.source)
+            recent['region'].append(slot.region)
+            if slot.series:
+                recent['series'].append(slot.series)
+        start = (date.fromisoformat(pending[-1].day) + timedelta(days=1)) if pending else date.today()
+
+        options = self.feasibility()
+        slots = []
+        for d in range(days):
+            day = (start + timedelta(days=d)).isoformat()
+            for position in range(self.slots_per_day):
+                picked = self._pick(options, recent, planned)
+                if picked is None:
+                    logger.warning(f"{day} {position + 1}번째 슬롯: 조건을 만족하는 조합 없음")
+                    break
+                option, series = picked
+                theme_data = option['theme_data']
+                planned.add((option['source'], theme_data.get('theme'), option['region']))
+                recent['source'].append(option['source'])
+                recent['region'].append(option['region'])
+                if series:
+                    recent['series'].append(series)
+                slots.append(PlanSlot(day=day, position=position, source=option['source'],
+                                      theme=theme_data.get('theme'), theme_data=theme_data,
+                                      region=option['region'], series=series, candidates=option['count']))
+
+        with Session() as session:
+            session.add_all(slots)
+            session.commit()
+
+        logger.info(f"캘린더 생성: {days}일, {len(slots)}개 슬롯")
+        for slot in slots:
+            logger.info(f"  {slot.day} #{slot.position + 1} {slot.source} / {slot.theme} / {slot.region}"
+                        + (f" / {slot.series}" if slot.series else ""))
+        return slots
+
+    # ===== 실행 =====
+
+    def _claim(self):
+        """다음 슬롯 점유 (여러 워커가 같은 슬롯을 꺼내지 않도록 상태 조건부 갱신)
+
+        점유 시각을 used_at에 기록하고, LEASE_TIMEOUT이 지나도 끝나지 않은 슬롯은 다시 꺼냅니다.
+        """
+        with Session() as session:
+            while True:
+                now = datetime.utcnow()
+                slot = (session.query(PlanSlot).filter(_available(now))
+                        .order_by(PlanSlot.day, PlanSlot.position, PlanSlot.id).first())
+                if slot is None:
+                    return None
+                if slot.status == 'running':
+                    logger.warning(f"임대 만료 슬롯 회수: {slot.day} #{slot.position + 1} {slot.theme} / {slot.region}")
+                claimed = (session.query(PlanSlot)
+                           .filter(PlanSlot.id == slot.id, _available(now))
+                           .update({PlanSlot.status: 'running', PlanSlot.used_at: now}, synchronize_session=False))
+                session.commit()
+                if claimed:
+                    return slot
+
+    def take(self):
+        """다음 슬롯을 실행해 (items, region, theme_data) 반환, 남은 슬롯이 없으면 None
+
+        후보 장소가 그사이 소진된 슬롯은 skipped로 표시하고 다음 슬롯으로 넘어갑니다.
+        슬롯 완료와 히스토리 기록은 한 트랜잭션으로 저장합니다.
+        """
+        while True:
+            slot = self._claim()
+            if slot is None:
+                return None
+
+            try:
+                items, region, theme_data = self.generator.fetch_items(
+                    dict(slot.theme_data), region=slot.region, series=slot.series)
+            except Exception as e:
+                logger.warning(f"슬롯 실행 실패 ({slot.theme} / {slot.region}): {e}")
+                items = []
+
+            with Session() as session:
+                row = session.get(PlanSlot, slot.id)
+                row.used_at = datetime.utcnow()
+                if not items:
+                    row.status = 'skipped'
+                    session.commit()
+                    logger.info(f"슬롯 건너뜀: {slot.day} #{slot.position + 1} {slot.theme} / {slot.region}")
+                    continue
+                row.status = 'used'
+                self.selector.record(source=slot.source, region=region, series=slot.series, session=session)
+                session.commit()
+
+            logger.info(f"슬롯 사용: {slot.day} #{slot.position + 1} {slot.theme} / {region}")
+            return items, region, theme_data
+
+    def remaining(self) -> int:
+        return pending_slots()
+
+
+def load_content_planner() -> ContentPlanner:
+    return ContentPlanner()
@@ -1,6 +1,7 @@
 """콘텐츠 후처리 모듈"""
 import re
 from .config import NOTICE_TEXT
+from .aho_corasick import AhoCorasick
 
 
 def get_sigungu_consistency(items: list) -> str:
@@ -20,57 +21,104 @@ def get_sigungu_consistency(items: list) -> str:
     return ''
 
 
+# 주소 관련 잔여 문구 - 여러 번의 re.sub 대신 하나의 교대(alternation) 패턴으로 제거
+CLEANUP_PATTERN = re.compile(
+    r'<p>\s*주소:\s*주소 정보 없음\s*</p>'
+    r'|<p>\s*주소:\s*</p>'
+    r'|주소:\s*주소 정보 없음'
+    r'|주소 정보 없음'
+    r'|주소:\s*(?i:nan|none)'
+    r'|(?m:주소:\s*$)'
+)
+BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+
+
+def iter_h3(content: str):
+    """<h3 ...>...</h3> 구간을 (시작, 끝, 내부 텍스트)로 순서대로 생성
+
+    대소문자 무시, 속성 허용. 하나의 h3 안에서만 매칭하므로
+    여러 섹션에 걸친 역추적이 일어나지 않습니다.
+    """
+    lowered = content.lower()
+    pos = 0
+    while True:
+        start = lowered.find('<h3', pos)
+        if start < 0:
+            return
+        after = start + 3
+        if after < len(lowered) and lowered[after] not in '> \t\r\n/':
+            pos = after
+            continue
+        open_end = lowered.find('>', after)
+        if open_end < 0:
+            return
+        close = lowered.find('</h3>', open_end + 1)
+        if close < 0:
+            return
+        end = close + len('</h3>')
+        yield start, end, content[open_end + 1:close]
+        pos = end
+
+
+def _build_insert(item: dict, do_name: str, theme: str) -> str:
+    """h3 뒤에 붙일 이미지 + 정보 박스"""
+    title = item['title']
+    addr = item.get('addr', '')
+    map_url = item.get('map_url', '')
+    image_url = item.get('image', '')
+    
+    addr_valid = addr and addr.strip() and addr != 'nan' and addr != 'None'
+    
+    info_parts = []
+    if addr_valid:
+        info_parts.append(f'<p><strong>주소:</strong> {addr}</p>')
+    if map_url:
+        info_parts.append(f'<p><a href="{map_url}" target="_blank">📍 네이버 지도에서 보기</a></p>')
+    
+    insert = ''
+    if image_url and image_url.startswith('http'):
+        alt_text = f"{title} - {do_name} {theme}"
+        insert += f'\n<figure><img src="{image_url}" alt="{alt_text}" title="{title}"/></figure>'
+    if info_parts:
+        insert += f'\n<div class="info-box">\n{"".join(info_parts)}\n</div>'
+    return insert
+
+
 def insert_images_and_links(content: str, items: list, do_name: str, theme: str) -> str:
-    """이미지와 네이버 지도 링크 삽입"""
-    final_content = content
+    """이미지와 네이버 지도 링크 삽입
     
-    for item in items:
-        title = item['title']
-        addr = item.get('addr', '')
-        map_url = item.get('map_url', '')
-        image_url = item.get('image', '')
-        
-        addr_valid = addr and addr.strip() and addr != 'nan' and addr != 'None'
-        
-        info_parts = []
-        if addr_valid:
-            info_parts.append(f'<p><strong>주소:</strong> {addr}</p>')
-        if map_url:
-            info_parts.append(f'<p><a href="{map_url}" target="_blank">📍 네이버 지도에서 보기</a></p>')
-        
-        info_box = f'<div class="info-box">\n{"".join(info_parts)}\n</div>' if info_parts else ''
-        
-        title_keyword = title[:8] if len(title) >= 8 else title
-        pattern = f'(<h3[^>]*>.*?{re.escape(title_keyword)}.*?</h3>)'
-        match = re.search(pattern, final_content, re.IGNORECASE | re.DOTALL)
-        
-        if match:
-            replacement = match.group(1)
-            
-            if image_url and image_url.startswith('http'):
-                alt_text = f"{title} - {do_name} {theme}"
-                img_tag = f'<figure><img src="{image_url}" alt="{alt_text}" title="{title}"/></figure>'
-                replacement += '\n' + img_tag
-            
-            if info_box:
-                replacement += '\n' + info_box
-            
-            final_content = final_content.replace(match.group(1), replacement, 1)
+    문서를 한 번만 훑으며 각 <h3>를 모든 장소명 키워드(앞 8글자)와 동시에
+    대조하고, 장소별로 처음 일치한 h3 바로 뒤에 이미지/정보 박스를 넣습니다.
+    """
+    if not items:
+        return content
+    
+    matcher = AhoCorasick([item['title'][:8] for item in items], ignore_case=True)
+    placed = set()
+    out = []
+    pos = 0
     
-    return final_content
+    for start, end, inner in iter_h3(content):
+        matched = sorted(matcher.find_ids(inner) - placed)
+        if not matched:
+            continue
+        out.append(content[pos:end])
+        # 같은 h3를 공유하면 나중 장소가 h3 바로 아래 (기존 동작 유지)
+        for idx in reversed(matched):
+            out.append(_build_insert(items[idx], do_name, theme))
+        placed.update(matched)
+        pos = end
+        if len(placed) == len(items):
+            break
+    
+    out.append(content[pos:])
+    return ''.join(out)
 
 
 def clean_content(content: str) -> str:
     """불필요한 텍스트 제거"""
-    content = re.sub(r'<p>\s*주소:\s*주소 정보 없음\s*</p>', '', content)
-    content = re.sub(r'<p>\s*주소:\s*</p>', '', content)
-    content = re.sub(r'주소:\s*주소 정보 없음', '', content)
-    content = re.sub(r'주소 정보 없음', '', content)
-    content = re.sub(r'주소:\s*nan', '', content, flags=re.IGNORECASE)
-    content = re.sub(r'주소:\s*None', '', content, flags=re.IGNORECASE)
-    content = re.sub(r'주소:\s*$', '', content, flags=re.MULTILINE)
-    content = re.sub(r'\n{3,}', '\n\n', content)
-    return content
+    content = CLEANUP_PATTERN.sub('', content)
+    return BLANK_LINES_PATTERN.sub('\n\n', content)
 
 
 def add_notice(content: str) -> str:
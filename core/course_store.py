@@ -0,0 +1,147 @@
+"""두루누비 코스 로컬 저장소 - 전체 목록 동기화 후 로컬에서 조회"""
+
+import os
+import logging
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from core.database import Session, DurunubiCourse
+from core.datasets import MAX_REMOVED_RATIO
+
+logger = logging.getLogger(__name__)
+
+COURSE_TYPES = ('1', '2')
+
+# 같은 코스 종류를 여러 스레드가 동시에 동기화하지 않도록
+_sync_locks = {t: threading.Lock() for t in COURSE_TYPES}
+
+
+class CourseSyncError(Exception):
+    """받아온 목록이 비었거나 너무 줄어 동기화를 거부함 (로컬 사본 유지)"""
+    pass
+
+
+def course_addr(item: dict) -> str:
+    return item.get('sigun', '') or item.get('areaNm', '')
+
+
+class CourseStore:
+    """두루누비 전체 코스를 SQLite에 보관
+
+    동기화는 max_age_hours가 지난 경우에만 수행하며, modifiedtime이 바뀐
+    코스만 시리즈 키와 지역 그룹을 다시 계산합니다. 목록에서 사라진 코스는 삭제하되,
+    받아온 목록이 비었거나 기존 코스의 MAX_REMOVED_RATIO를 넘게 사라지면 잘린 응답으로 보고
+    CourseSyncError를 냅니다.
+    """
+
+    def __init__(self, api=None, region_index=None, max_age_hours: float = 24,
+                 page_size: int = 200, workers: int = 4):
+        self._api = api
+        self._region_index = region_index
+        self.max_age = timedelta(hours=max_age_hours)
+        self.page_size = page_size
+        self.workers = workers
+
+    @property
+    def api(self):
+        if self._api is None:
+            from core.durunubi_api import load_durunubi_client
+            self._api = load_durunubi_client()
+        return self._api
+
+    @property
+    def region_index(self):
+        if self._region_index is None:
+            from core.content_generator import ContentGenerator
+            self._region_index = ContentGenerator().region_index
+        return self._region_index
+
+    def last_synced(self, course_type: str):
+        with Session() as session:
+            return session.query(func.max(DurunubiCourse.synced_at)).filter_by(course_type=course_type).scalar()
+
+    def is_stale(self, course_type: str) -> bool:
+        last = self.last_synced(course_type)
+        return last is None or datetime.utcnow() - last > self.max_age
+
+    def sync(self, course_type: str, force: bool = False) -> dict:
+        """전체 코스 동기화 - {'added', 'updated', 'removed', 'total'}"""
+        with _sync_locks.setdefault(course_type, threading.Lock()):
+            # 대기하는 동안 다른 스레드가 동기화를 마쳤으면 건너뜀
+            if not force and not self.is_stale(course_type):
+                return {'added': 0, 'updated': 0, 'removed': 0, 'total': None}
+            return self._sync(course_type, force)
+
+    def _sync(self, course_type: str, force: bool) -> dict:
+        from core.content_generator import extract_base_name
+
+        items = self.api.get_all_courses(course_type, num_of_rows=self.page_size, workers=self.workers)
+        now = datetime.utcnow()
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'total': len(items)}
+
+        with Session() as session:
+            existing = {c.crs_idx: c for c in session.query(DurunubiCourse).filter_by(course_type=course_type)}
+
+            latest = {}
+            for item in items:
+                key = item.get('crsIdx') or item.get('crsKorNm', '')
+                if key:
+                    latest[key] = item
+
+            removed = [key for key in existing if key not in latest]
+            if not latest:
+                raise CourseSyncError(f"두루누비 목록이 비어 있음(brdDiv={course_type}) - 기존 {len(existing)}개 유지")
+            if existing and len(removed) > len(existing) * MAX_REMOVED_RATIO:
+                raise CourseSyncError(f"두루누비 목록(brdDiv={course_type}): 기존 {len(existing)}개 중 "
+                                      f"{len(removed)}개가 사라짐 - 잘린 응답으로 보고 건너뜀")
+
+            changed = [key for key, item in latest.items()
+                       if force or key not in existing or existing[key].modified != item.get('modifiedtime')]
+            groups = self.region_index.resolve_many(course_addr(latest[key]) for key in changed)
+
+            for key, group in zip(changed, groups):
+                item = latest[key]
+                course = existing.get(key)
+                if course is None:
+                    course = DurunubiCourse(course_type=course_type, crs_idx=key)
+                    session.add(course)
+                    stats['added'] += 1
+                else:
+                    stats['updated'] += 1
+                course.title = item.get('crsKorNm', '')
+                course.addr = course_addr(item)
+                course.series_key = extract_base_name(course.title)
+                course.region_group = group
+                course.modified = item.get('modifiedtime')
+                course.data = item
+
+            for key in removed:
+                session.delete(existing[key])
+                stats['removed'] += 1
+
+            session.flush()
+            session.query(DurunubiCourse).filter_by(course_type=course_type).update(
+                {DurunubiCourse.synced_at: now}, synchronize_session=False
+            )
+            session.commit()
+
+        logger.info(f"두루누비 동기화(brdDiv={course_type}): 전체 {stats['total']}, "
+                    f"추가 {stats['added']}, 갱신 {stats['updated']}, 삭제 {stats['removed']}")
+        return stats
+
+    def courses(self, course_type: str) -> list:
+        """로컬 코스 목록 (필요하면 먼저 동기화, 실패 시 기존 사본 사용)"""
+        try:
+            self.sync(course_type)
+        except Exception as e:
+            logger.warning(f"두루누비 동기화 실패, 로컬 사본 사용: {e}")
+        with Session() as session:
+            return session.query(DurunubiCourse).filter_by(course_type=course_type).order_by(DurunubiCourse.id).all()
+
+
+def load_course_store(region_index=None) -> CourseStore:
+    return CourseStore(
+        region_index=region_index,
+        max_age_hours=float(os.getenv('DURUNUBI_SYNC_HOURS', '24')),
+        workers=int(os.getenv('DURUNUBI_SYNC_WORKERS', '4')),
+    )
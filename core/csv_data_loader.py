@@ -1,10 +1,20 @@
 """CSV 파일 기반 데이터 로더 + Photo API 이미지 연동 + 이미지 검증 + 테마 50:50"""
 
+import logging
 import pandas as pd
-import requests
 from pathlib import Path
 import random
 import urllib.parse
+from core import url_validity
+from core.datasets import load_registry, DatasetError
+from core.image_ranker import rank, photo_candidates, first_valid
+
+logger = logging.getLogger(__name__)
+
+# 청크 로드 시 읽는 컬럼
+CAMPING_COLUMNS = ('야영장명', '주소', '도', '시군구', '주요시설 글램핑', '주요시설 카라반', '반려동물출입', '테마환경', '부대시설')
+CAMPING_NUMERIC = ('주요시설 글램핑', '주요시설 카라반')
+ARTICLE_COLUMNS = ('콘텐츠명', '콘텐츠분류명', '지역명', '대표이미지 URL', '기사상세정보URL')
 
 
 class CSVDataLoader:
@@ -18,13 +28,18 @@ class CSVDataLoader:
     
     def _load_data(self):
         """CSV 파일들 로드"""
-        camping_file = self.data_dir / "한국관광공사 전국 야영장 등록 현황_20260106.csv"
-        if camping_file.exists():
-            self.camping_df = pd.read_csv(camping_file, encoding='cp949', on_bad_lines='skip')
-        
-        articles_file = self.data_dir / "한국관광공사_여행기사목록_20251107.csv"
-        if articles_file.exists():
-            self.articles_df = pd.read_csv(articles_file, encoding='cp949', on_bad_lines='skip')
+        registry = load_registry(self.data_dir)
+        try:
+            self.camping_df = registry.load_frame(
+                'camping', CAMPING_COLUMNS, dtype=dict.fromkeys(CAMPING_COLUMNS, str), numeric=CAMPING_NUMERIC,
+                predicate=lambda chunk: chunk['야영장명'].notna() & chunk['도'].notna(),
+            )
+        except (DatasetError, OSError, ValueError) as e:
+            logger.error(f"camping 데이터 로드 실패: {e}")
+        try:
+            self.articles_df = registry.load_frame('articles', ARTICLE_COLUMNS, dtype=dict.fromkeys(ARTICLE_COLUMNS, str))
+        except (DatasetError, OSError, ValueError) as e:
+            logger.error(f"articles 데이터 로드 실패: {e}")
     
     def _init_photo_api(self):
         """Photo API 초기화"""
@@ -41,16 +56,10 @@ class CSVDataLoader:
     
     def _is_image_valid(self, url: str) -> bool:
         """이미지 URL이 실제로 존재하는지 확인"""
-        if not url:
-            return False
-        try:
-            resp = requests.head(url, timeout=5, allow_redirects=True)
-            return resp.status_code == 200
-        except:
-            return False
+        return url_validity.is_valid(url)
     
     def _search_photo(self, keywords: list, used_images: set) -> str:
-        """키워드 리스트로 사진 검색, 중복 제외, https 변환, 유효성 검증"""
+        """키워드 리스트로 사진 검색 - 점수순 상위 후보만 병렬 검증, 중복 제외, https 변환"""
         if not self.photo_api:
             return ""
         
@@ -59,14 +68,10 @@ class CSVDataLoader:
                 continue
             try:
                 photos = self.photo_api.search_photos(keyword, num_of_rows=10)
-                for photo in photos:
-                    url = photo.get('galWebImageUrl', '')
-                    if url and url not in used_images:
-                        if url.startswith('http://'):
-                            url = url.replace('http://', 'https://')
-                        if self._is_image_valid(url):
-                            used_images.add(url)
-                            return url
+                url = first_valid(rank(photo_candidates(photos), used_images), self._is_image_valid)
+                if url:
+                    used_images.add(url)
+                    return url
             except:
                 continue
         return ""
@@ -1,5 +1,7 @@
 """여행기사 데이터 조회"""
 import random
+from core.place import Place
+from core.catalogue import load_catalogue
 from .utils import extract_place_name, is_only_sigungu, make_naver_map_url, get_image, is_image_valid
 
 
@@ -93,17 +95,15 @@ def get_articles_by_category(loader, category: str, region: str = None, limit: i
         if place_name and not is_only_sigungu(place_name):
             map_url = make_naver_map_url(place_name)
         
-        results.append({
-            'title': title,
-            'addr': '',
-            'region': do_name,
-            'do': do_name,
-            'sigungu': sigungu,
-            'overview': '',
-            'detail_url': detail_url,
-            'map_url': map_url,
-            'image': img_url,
-            'source': 'csv_article'
-        })
+        results.append(Place.from_row(
+            'csv_article',
+            title=title,
+            region=do_name,
+            do=do_name,
+            sigungu=sigungu,
+            detail_url=detail_url,
+            map_url=map_url,
+            image=img_url,
+        ))
     
-    return results
+    return load_catalogue().enrich_all(results)
@@ -1,12 +1,24 @@
 """데이터 로더 베이스 클래스"""
+import logging
 import pandas as pd
 import random
 from pathlib import Path
+from core.datasets import load_registry, DatasetError
+from .camping import CAMPING_COLUMNS, CAMPING_DTYPE, CAMPING_NUMERIC, camping_predicate
+
+logger = logging.getLogger(__name__)
 
 
 class BaseDataLoader:
-    def __init__(self):
+    def __init__(self, themes: list = None, regions: list = None):
+        """
+        Args:
+            themes: 지정하면 이 테마 중 하나에 맞는 야영장만 로드
+            regions: 지정하면 도 이름이 이 중 하나를 포함하는 야영장만 로드
+        """
         self.data_dir = Path(__file__).parent.parent.parent / "data"
+        self.themes = themes
+        self.regions = regions
         self.camping_df = None
         self.article_df = None
         self.photo_api = None
@@ -15,17 +27,20 @@ class BaseDataLoader:
         self._init_apis()
     
     def _load_data(self):
-        camping_file = self.data_dir / "고캠핑정보조회_야영장정보목록_20260106.csv"
+        # 야영장 등록 현황 중 날짜가 가장 늦은 파일 - 필요한 컬럼만 청크로 읽어 테마/지역 조건에 맞는 행만 보관
         # [v10.0 비활성화] 여행기사 - 이미 큐레이팅된 콘텐츠 재사용은 품질 저하 유발
         # article_file = self.data_dir / "한국관광공사_여행기사목록_20251107.csv"
         
         try:
-            self.camping_df = pd.read_csv(camping_file, encoding='cp949', on_bad_lines='skip')
-        except:
-            try:
-                self.camping_df = pd.read_csv(camping_file, encoding='utf-8', on_bad_lines='skip')
-            except:
-                self.camping_df = pd.DataFrame()
+            self.camping_df = load_registry(self.data_dir).load_frame(
+                'camping', CAMPING_COLUMNS, dtype=CAMPING_DTYPE, numeric=CAMPING_NUMERIC,
+                predicate=camping_predicate(self.themes, self.regions),
+            )
+        except (DatasetError, OSError, ValueError) as e:
+            logger.error(f"야영장 데이터 로드 실패: {e}")
+            self.camping_df = pd.DataFrame()
+        if self.camping_df.empty:
+            logger.error("야영장 데이터가 비어 있습니다 - 캠핑 테마 후보가 없습니다")
         
         # [v10.0 비활성화] 여행기사 CSV 로드 - 2026-01-17 제거
         # 사유: 이미 가공된 콘텐츠를 AI로 재가공 시 품질 저하
@@ -1,9 +1,36 @@
 """캠핑장 데이터 조회"""
+import re
 import pandas as pd
 import random
+from core.place import Place
+from core.catalogue import load_catalogue
 from .utils import make_naver_map_url, get_image
 
 
+# 야영장 등록 현황 30여 개 컬럼 중 로더가 쓰는 것 (청크 로드 시 usecols/dtype)
+CAMPING_COLUMNS = ('야영장명', '주소', '도', '시군구', '주요시설 글램핑', '주요시설 카라반', '반려동물출입')
+CAMPING_DTYPE = {'야영장명': str, '주소': str, '도': str, '시군구': str, '반려동물출입': str}
+CAMPING_NUMERIC = ('주요시설 글램핑', '주요시설 카라반')
+
+
+def camping_predicate(themes: list = None, regions: list = None):
+    """청크마다 남길 행 - 이름과 도가 있고, 지정하면 테마 중 하나와 지역 중 하나에 맞는 행"""
+    region_pattern = '|'.join(map(re.escape, regions)) if regions else None
+
+    def predicate(chunk: pd.DataFrame) -> pd.Series:
+        mask = chunk['야영장명'].notna() & chunk['도'].notna()
+        if themes:
+            matched = pd.Series(False, index=chunk.index)
+            for theme in themes:
+                matched |= chunk.index.isin(filter_by_theme(chunk, theme).index)
+            mask &= matched
+        if region_pattern:
+            mask &= chunk['도'].str.contains(region_pattern, na=False)
+        return mask
+
+    return predicate
+
+
 def filter_by_theme(df: pd.DataFrame, theme: str) -> pd.DataFrame:
     """테마별 필터링"""
     if theme == '글램핑':
@@ -69,18 +96,15 @@ def get_camping_by_theme(loader, theme: str, region: str = None, limit: int = No
         if image_url:
             used_images.add(image_url)
         
-        results.append({
-            'title': name,
-            'addr': addr,
-            'region': do_name,
-            'do': do_name,
-            'sigungu': sigungu,
-            'overview': '',
-            'facilities': '',
-            'pets': '',
-            'map_url': make_naver_map_url(name),
-            'image': image_url,
-            'source': 'csv_camping'
-        })
+        results.append(Place.from_row(
+            'csv_camping',
+            title=name,
+            addr=addr,
+            region=do_name,
+            do=do_name,
+            sigungu=sigungu,
+            map_url=make_naver_map_url(name),
+            image=image_url,
+        ))
     
-    return results
+    return load_catalogue().enrich_all(results)
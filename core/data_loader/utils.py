@@ -1,7 +1,10 @@
 """데이터 로더 유틸리티"""
 import re
-import requests
+from functools import lru_cache
 from urllib.parse import quote
+from core import url_validity
+from core.aho_corasick import AhoCorasick
+from core.image_ranker import rank, photo_candidates, naver_candidates, first_valid
 
 COMPOUND_PLACES = [
     '일출봉', '해돋이봉', '국립공원', '도립공원', '선운산', '자연휴양림', '수목원',
@@ -34,55 +37,69 @@ SIGUNGU_NAMES = [
 ]
 
 
+# 우선순위: 복합 장소명 -> 일반 키워드 (따옴표/쉼표 폴백은 일반 -> 복합)
+_PRIMARY_ORDER = COMPOUND_PLACES + PLACE_KEYWORDS
+_FALLBACK_ORDER = PLACE_KEYWORDS + COMPOUND_PLACES
+_KEYWORD_MATCHER = AhoCorasick(list(dict.fromkeys(_PRIMARY_ORDER)))
+_HANGUL_RUN = re.compile(r'[가-힣]+')
+_QUOTED = re.compile(r"['\"]([^'\"]+)['\"]")
+
+
+def _keyword_candidates(text: str) -> dict:
+    """키워드별 '[가-힣]+키워드' 최장 일치를 한 번의 스캔으로 계산
+    
+    한글 연속 구간마다 키워드 앞에 한 글자 이상 있는 마지막 위치까지를
+    후보로 삼습니다 (re.findall(rf'([가-힣]+{keyword})')와 같은 결과).
+    """
+    best = {}
+    patterns = _KEYWORD_MATCHER.patterns
+    for run in _HANGUL_RUN.finditer(text):
+        word = run.group()
+        last = {}
+        for start, end, pid in _KEYWORD_MATCHER.iter(word):
+            if start >= 1:
+                last[pid] = end
+        for pid, end in last.items():
+            keyword = patterns[pid]
+            if end > len(best.get(keyword, '')):
+                best[keyword] = word[:end]
+    return best
+
+
+def _pick(candidates: dict, order: list, exclude_keyword_only: bool = False) -> str:
+    for keyword in order:
+        result = candidates.get(keyword)
+        if not result:
+            continue
+        if result not in EXCLUDE_WORDS and len(result) >= 3:
+            if not exclude_keyword_only or result != keyword:
+                return result
+    return ''
+
+
+@lru_cache(maxsize=4096)
 def extract_place_name(title: str) -> str:
-    """기사 제목에서 장소명 추출"""
+    """기사 제목에서 장소명 추출 (키워드 전체를 한 번에 스캔)"""
     if not title:
         return ''
     
-    # 1. 복합 장소명 먼저 찾기
-    for compound in COMPOUND_PLACES:
-        pattern = rf'([가-힣]+{compound})'
-        matches = re.findall(pattern, title)
-        if matches:
-            result = max(matches, key=len)
-            if result not in EXCLUDE_WORDS and len(result) >= 3:
-                return result
-    
-    # 2. 일반 키워드로 끝나는 단어 찾기
-    for keyword in PLACE_KEYWORDS:
-        pattern = rf'([가-힣]+{keyword})'
-        matches = re.findall(pattern, title)
-        if matches:
-            result = max(matches, key=len)
-            # 최소 3글자 이상, 키워드만 있는 경우 제외
-            if result not in EXCLUDE_WORDS and len(result) >= 3 and result != keyword:
-                return result
+    # 1. 복합 장소명 먼저, 2. 일반 키워드로 끝나는 단어
+    candidates = _keyword_candidates(title)
+    result = (_pick(candidates, COMPOUND_PLACES)
+              or _pick(candidates, PLACE_KEYWORDS, exclude_keyword_only=True))
+    if result:
+        return result
     
     # 3. 따옴표 안의 내용에서 장소 키워드 확인
-    quote_pattern = r"['\"]([^'\"]+)['\"]"
-    quote_matches = re.findall(quote_pattern, title)
-    if quote_matches:
-        for match in quote_matches:
-            for keyword in PLACE_KEYWORDS + COMPOUND_PLACES:
-                if keyword in match:
-                    sub_pattern = rf'([가-힣]+{keyword})'
-                    sub_matches = re.findall(sub_pattern, match)
-                    if sub_matches:
-                        result = max(sub_matches, key=len)
-                        if result not in EXCLUDE_WORDS and len(result) >= 3:
-                            return result
+    for quoted in _QUOTED.findall(title):
+        result = _pick(_keyword_candidates(quoted), _FALLBACK_ORDER)
+        if result:
+            return result
     
     # 4. 쉼표로 분리된 마지막 부분
     if ',' in title:
         last_part = title.split(',')[-1].strip()
-        for keyword in PLACE_KEYWORDS + COMPOUND_PLACES:
-            if keyword in last_part:
-                pattern = rf'([가-힣]+{keyword})'
-                matches = re.findall(pattern, last_part)
-                if matches:
-                    result = max(matches, key=len).strip()
-                    if result not in EXCLUDE_WORDS and len(result) >= 3:
-                        return result
+        return _pick(_keyword_candidates(last_part), _FALLBACK_ORDER)
     
     return ''
 
@@ -113,47 +130,33 @@ def make_naver_map_url(name: str) -> str:
 
 
 def is_image_valid(url: str) -> bool:
-    """이미지 URL 유효성 검사"""
-    if not url:
-        return False
-    try:
-        response = requests.head(url, timeout=5, allow_redirects=True)
-        return response.status_code == 200
-    except:
-        return False
+    """이미지 URL 유효성 검사 (검사 결과는 url_validity 캐시에 보관)"""
+    return url_validity.is_valid(url)
 
 
 def search_photo(photo_api, keywords: list, used_images: set) -> str:
-    """Photo API로 이미지 검색"""
+    """Photo API로 이미지 검색 - 키워드별로 후보를 점수순 정렬해 상위 몇 개만 병렬 검증"""
     if not photo_api:
         return ''
     for keyword in keywords:
         try:
             results = photo_api.search_photos(keyword, num_of_rows=5)
-            if results:
-                for photo in results:
-                    url = photo.get('galWebImageUrl', '')
-                    if url and url not in used_images:
-                        url = url.replace('http://', 'https://')
-                        if is_image_valid(url):
-                            return url
-        except:
+            url = first_valid(rank(photo_candidates(results), used_images), is_image_valid)
+            if url:
+                return url
+        except Exception:
             continue
     return ''
 
 
 def search_naver_image(naver_api, query: str, used_images: set) -> str:
-    """네이버 이미지 검색"""
+    """네이버 이미지 검색 - 크기 메타데이터로 거른 뒤 상위 후보만 병렬 검증"""
     if not naver_api:
         return ''
     try:
         results = naver_api.search(query, display=5)
-        for item in results:
-            url = item.get('url', '')
-            if url and url not in used_images:
-                if is_image_valid(url):
-                    return url
-    except:
+        return first_valid(rank(naver_candidates(results), used_images), is_image_valid)
+    except Exception:
         pass
     return ''
 
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, UniqueConstraint, JSON
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, UniqueConstraint, JSON, Boolean, Float
 from sqlalchemy.orm import declarative_base, sessionmaker
 from datetime import datetime
 from dotenv import load_dotenv
@@ -46,6 +46,172 @@ class PostLog(Base):
     embedding = Column(JSON) # 문맥 벡터 저장
     created_at = Column(DateTime, default=datetime.utcnow)
 
+class PublishLog(Base):
+    """발행 멱등성 기록 - 같은 키로 재시도해도 글이 중복 생성되지 않도록"""
+    __tablename__ = "publish_log"
+    id = Column(Integer, primary_key=True)
+    target = Column(String)
+    idempotency_key = Column(String, index=True)
+    remote_id = Column(String)
+    url = Column(String)
+    status = Column(String)  # pending / done
+    created_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint('target', 'idempotency_key', name='_publish_key_uc'),)
+
+class PublishJob(Base):
+    """발행 파이프라인 작업 - 마지막 완료 단계와 산출물을 체크포인트로 저장"""
+    __tablename__ = "publish_jobs"
+    id = Column(Integer, primary_key=True)
+    stage = Column(String, default='created')  # 마지막으로 완료된 단계
+    status = Column(String, default='pending', index=True)  # pending / running / done / failed
+    artifacts = Column(JSON, default=dict)
+    attempts = Column(Integer, default=0)
+    version = Column(Integer, default=0)  # 작업 점유(claim) 경합 방지용
+    worker = Column(String)
+    error = Column(String)
+    locked_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class DurunubiCourse(Base):
+    """두루누비 코스 로컬 사본 - 시리즈 키와 지역 그룹을 동기화 시점에 미리 계산"""
+    __tablename__ = "durunubi_courses"
+    id = Column(Integer, primary_key=True)
+    course_type = Column(String, index=True)  # 1: 걷기길 / 2: 자전거길
+    crs_idx = Column(String)
+    title = Column(String)
+    addr = Column(String)
+    series_key = Column(String, index=True)
+    region_group = Column(String, index=True)
+    modified = Column(String)  # API의 modifiedtime
+    data = Column(JSON)  # 원본 항목
+    synced_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint('course_type', 'crs_idx', name='_course_uc'),)
+
+class ApiCache(Base):
+    """API 응답 캐시 - 엔드포인트별 TTL이 지나면 다시 조회"""
+    __tablename__ = "api_cache"
+    key = Column(String, primary_key=True)  # service/endpoint + 파라미터 해시
+    endpoint = Column(String, index=True)
+    payload = Column(JSON)
+    expires_at = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class ApiQuota(Base):
+    """API 키별 일일 호출 수 (KST 날짜 기준)"""
+    __tablename__ = "api_quota"
+    id = Column(Integer, primary_key=True)
+    key = Column(String)  # 할당량을 공유하는 키 이름 (예: data_go_kr)
+    day = Column(String)  # YYYY-MM-DD
+    used = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (UniqueConstraint('key', 'day', name='_quota_day_uc'),)
+
+class UrlCheck(Base):
+    """이미지 URL 검사 결과 - TTL 동안 재사용, 지나면 조건부 요청으로 재검증"""
+    __tablename__ = "url_checks"
+    url = Column(String, primary_key=True)
+    host = Column(String, index=True)
+    valid = Column(Boolean)
+    status = Column(Integer)
+    content_type = Column(String)
+    content_length = Column(Integer)
+    etag = Column(String)
+    last_modified = Column(String)
+    checked_at = Column(DateTime, default=datetime.utcnow)
+
+class HostHealth(Base):
+    """연결 실패가 이어진 호스트 - dead_until까지는 요청하지 않음"""
+    __tablename__ = "host_health"
+    host = Column(String, primary_key=True)
+    failures = Column(Integer, default=0)
+    dead_until = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class CircuitState(Base):
+    """API 호스트별 서킷 브레이커 상태 - 다른 프로세스가 시작할 때 open 상태를 이어받음"""
+    __tablename__ = "circuit_states"
+    host = Column(String, primary_key=True)
+    state = Column(String, default='closed')  # closed / open
+    failures = Column(Integer, default=0)  # 열릴 때 창 안의 실패 수
+    open_until = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class ThemeHistory(Base):
+    """주제 선택 히스토리 (kind: source / region / series)"""
+    __tablename__ = "theme_history"
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, index=True)
+    value = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class PlanSlot(Base):
+    """콘텐츠 캘린더 슬롯 - 미리 검증한 (소스, 주제, 지역, 시리즈) 배정"""
+    __tablename__ = "plan_slots"
+    id = Column(Integer, primary_key=True)
+    day = Column(String, index=True)  # YYYY-MM-DD
+    position = Column(Integer, default=0)  # 하루 안에서의 순서
+    source = Column(String)
+    theme = Column(String)
+    theme_data = Column(JSON)
+    region = Column(String)
+    series = Column(String)
+    candidates = Column(Integer)  # 계획 시점의 후보 장소 수
+    status = Column(String, default='planned', index=True)  # planned / running / used / skipped
+    created_at = Column(DateTime, default=datetime.utcnow)
+    used_at = Column(DateTime)  # running이면 점유 시각(임대 만료 판단), used/skipped면 사용 시각
+
+class UsedTitle(Base):
+    """발행에 사용한 제목 - 실행이 바뀌어도 같은 제목을 다시 쓰지 않도록"""
+    __tablename__ = "used_titles"
+    hash = Column(Integer, primary_key=True)  # 공백을 뺀 제목의 64비트 해시
+    title = Column(String)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class CatalogueEntry(Base):
+    """data/ CSV를 합친 오프라인 장소 카탈로그 - 빌드 시점에 데이터셋 간 동일 장소를 하나로 묶음"""
+    __tablename__ = "catalogue"
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, index=True)  # camping / attraction / lodging / shop
+    name = Column(String)
+    title_norm = Column(String, index=True)  # normalize_title (PlaceLog와 같은 규칙)
+    sido = Column(String, index=True)  # 짧은 시도명 (예: 강원)
+    sigungu = Column(String, index=True)
+    addr = Column(String)
+    overview = Column(String)
+    tel = Column(String)
+    lat = Column(Float)
+    lon = Column(Float)
+    quality = Column(String)  # 한국관광 품질인증 등급
+    quality_until = Column(String)  # 인증 만료일 YYYY-MM-DD
+    accessible = Column(Boolean, default=False)  # 열린관광지 (무장애)
+    detail = Column(JSON)  # 데이터셋별 부가 정보 (시설 수, 콘텐츠 URL 등)
+    sources = Column(JSON)  # 합쳐진 데이터셋 이름 목록
+    built_at = Column(DateTime, default=datetime.utcnow)
+
+class DatasetSnapshot(Base):
+    """데이터셋 계열별로 마지막에 반영한 파일 - 같은 파일이면 다시 읽지 않음"""
+    __tablename__ = "dataset_snapshots"
+    family = Column(String, primary_key=True)
+    file = Column(String)
+    file_date = Column(String)  # 파일 이름의 YYYYMMDD
+    encoding = Column(String)
+    size = Column(Integer)
+    mtime = Column(Float)
+    rows = Column(Integer)
+    loaded_at = Column(DateTime, default=datetime.utcnow)
+
+class DatasetRow(Base):
+    """마지막 스냅샷의 행 - 키별 해시로 다음 파일과 비교, entry_id는 이 행이 합쳐진 카탈로그 항목"""
+    __tablename__ = "dataset_rows"
+    id = Column(Integer, primary_key=True)
+    family = Column(String)
+    key = Column(String)
+    hash = Column(String)
+    data = Column(JSON)
+    entry_id = Column(Integer, index=True)
+    __table_args__ = (UniqueConstraint('family', 'key'),)
+
 def init_db():
     Base.metadata.create_all(engine)
 
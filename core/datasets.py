@@ -0,0 +1,243 @@
+"""데이터셋 레지스트리 - data/에 날짜를 붙여 떨어지는 CSV를 계열별로 찾아 읽기
+
+파일 이름은 '<계열 이름>_YYYYMMDD.csv' 형식이며, 계열마다 날짜가 가장 늦은 파일을 씁니다.
+인코딩은 파일마다 한 번만 판별해 DatasetSnapshot에 기록하고, 파일 이름/크기/수정 시각이
+직전 스냅샷과 같으면 다시 읽지 않습니다. 바뀐 파일은 행 키별 해시를 직전 스냅샷(DatasetRow)과
+비교해 추가/변경/삭제된 행만 돌려줍니다.
+
+읽기는 모두 스트리밍입니다 - 비교는 행을 하나씩 읽으며 필요한 컬럼만 남기고,
+pandas 로더는 CHUNK_ROWS행씩 usecols/dtype으로 읽어 조건에 맞는 행만 모읍니다.
+파일 크기와 관계없이 원본 전체를 메모리에 올리지 않으며, 처리량(행/초)을 로그로 남깁니다.
+
+파일이 없거나 읽은 행이 없으면(또는 행 대부분이 사라졌으면) DatasetError를 내고
+직전 스냅샷을 그대로 둡니다 - 빈 데이터로 조용히 바뀌지 않도록.
+"""
+
+import re
+import csv
+import glob
+import json
+import codecs
+import time
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from core.database import Session, DatasetSnapshot, DatasetRow
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+# 계열 이름 -> (파일 이름 앞부분, 행 키 컬럼)
+FAMILIES = {
+    'camping': ('한국관광공사 전국 야영장 등록 현황', ('야영장명', '주소')),
+    'goesan': ('충청북도_괴산군_관광지정보', ('관광지명',)),
+    'open_tourism': ('한국관광공사_열린관광지목록', ('관광지명', '주소')),
+    'local_content': ('한국관광공사_지역콘텐츠상세정보목록', ('지자체섹션고유ID', '콘텐츠명')),
+    'quality': ('한국관광공사 한국관광 품질인증 현황', ('업소명', '주소', '인증유형')),
+    'articles': ('한국관광공사_여행기사목록', ('콘텐츠아이디',)),
+}
+
+ENCODINGS = ('utf-8-sig', 'cp949')
+SNIFF_BYTES = 256 * 1024  # 인코딩 판별에 읽는 앞부분
+CHUNK_ROWS = 20000  # pandas 로더가 한 번에 읽는 행 수
+MAX_REMOVED_RATIO = 0.5  # 한 번에 이보다 많은 행이 사라지면 잘린 파일로 보고 거부
+
+_DATED = re.compile(r'^(?P<stem>.+)_(?P<date>\d{8})\.csv$')
+
+
+class DatasetError(Exception):
+    """데이터셋 파일을 찾거나 읽을 수 없음 (직전 스냅샷 유지)"""
+    pass
+
+
+@dataclass(slots=True)
+class DatasetDiff:
+    """직전 스냅샷 대비 바뀐 행 (added/changed: 키 -> (해시, 행), removed: 키 목록)"""
+    family: str
+    path: Path
+    encoding: str
+    rows: int = 0
+    seconds: float = 0.0
+    added: dict = field(default_factory=dict)
+    changed: dict = field(default_factory=dict)
+    removed: list = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+    def summary(self) -> str:
+        return f"+{len(self.added)} ~{len(self.changed)} -{len(self.removed)}, {rate(self.rows, self.seconds)}"
+
+
+def rate(rows: int, seconds: float) -> str:
+    return f"{rows / seconds:,.0f}행/초" if seconds > 0 else "-"
+
+
+def detect_encoding(path: Path) -> str:
+    """앞부분 SNIFF_BYTES로 인코딩 판별 (잘린 멀티바이트 문자는 점진 디코더가 보류)"""
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    for encoding in ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    raise DatasetError(f"인코딩 판별 실패: {path.name}")
+
+
+def row_hash(row: dict) -> str:
+    return hashlib.blake2b(json.dumps(row, ensure_ascii=False, sort_keys=True).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def row_key(columns: tuple, row: dict) -> str:
+    return '\t'.join((row.get(c) or '').strip() for c in columns)
+
+
+class DatasetRegistry:
+    """계열별 최신 파일 탐색과 스냅샷 비교"""
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = Path(data_dir)
+
+    def files(self, family: str) -> list:
+        """계열의 [(날짜, 경로)] - 오래된 순"""
+        stem = FAMILIES[family][0]
+        found = []
+        for path in self.data_dir.glob(f"{glob.escape(stem)}_*.csv"):
+            m = _DATED.match(path.name)
+            if m and m.group('stem') == stem:
+                found.append((m.group('date'), path))
+        return sorted(found)
+
+    def latest(self, family: str) -> Path:
+        files = self.files(family)
+        if not files:
+            raise DatasetError(f"데이터셋 파일 없음: {FAMILIES[family][0]}_YYYYMMDD.csv ({self.data_dir})")
+        return files[-1][1]
+
+    def encoding(self, path: Path, snapshot: DatasetSnapshot = None) -> str:
+        """스냅샷에 같은 파일의 인코딩이 있으면 재사용, 없으면 판별"""
+        if snapshot is not None and snapshot.file == path.name and snapshot.encoding:
+            return snapshot.encoding
+        return detect_encoding(path)
+
+    def locate(self, family: str) -> tuple:
+        """(최신 파일 경로, 인코딩) - pandas 로더용"""
+        path = self.latest(family)
+        with Session() as session:
+            snapshot = session.get(DatasetSnapshot, family)
+        return path, self.encoding(path, snapshot)
+
+    def stream(self, path: Path, encoding: str, columns=None):
+        """행을 하나씩 읽어 columns만 남긴 dict로 내보냄 (columns가 없으면 전체 컬럼)"""
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            reader = csv.DictReader(f)
+            if columns is None:
+                yield from reader
+                return
+            present = [c for c in columns if c in (reader.fieldnames or ())]
+            for row in reader:
+                yield {c: row[c] for c in present}
+
+    def diff(self, family: str, session, force: bool = False, columns=None):
+        """직전 스냅샷 대비 DatasetDiff, 파일이 그대로면 None
+
+        메모리에는 행 키/해시와 추가/변경된 행만 남기고, 키가 겹치는 행은 '#2', '#3'을 붙여 구분합니다.
+
+        Args:
+            force: 파일 이름/크기/수정 시각이 같아도 다시 읽어 비교
+            columns: 비교하고 돌려줄 컬럼 (나머지 컬럼만 바뀐 행은 변경으로 보지 않음)
+        """
+        path = self.latest(family)
+        stat = path.stat()
+        snapshot = session.get(DatasetSnapshot, family)
+        if (not force and snapshot is not None and snapshot.file == path.name
+                and snapshot.size == stat.st_size and snapshot.mtime == stat.st_mtime):
+            return None
+
+        encoding = self.encoding(path, snapshot)
+        previous = dict(session.query(DatasetRow.key, DatasetRow.hash).filter(DatasetRow.family == family))
+        key_columns = FAMILIES[family][1]
+        result = DatasetDiff(family, path, encoding)
+        seen = set()
+        started = time.perf_counter()
+        for row in self.stream(path, encoding, columns):
+            base = key = row_key(key_columns, row)
+            n = 1
+            while key in seen:
+                n += 1
+                key = f"{base}#{n}"
+            seen.add(key)
+            digest = row_hash(row)
+            old = previous.get(key)
+            if old is None:
+                result.added[key] = (digest, row)
+            elif old != digest:
+                result.changed[key] = (digest, row)
+        result.rows = len(seen)
+        result.seconds = time.perf_counter() - started
+        if not result.rows:
+            raise DatasetError(f"데이터셋에 행이 없음: {path.name}")
+        result.removed = [key for key in previous if key not in seen]
+
+        if previous and len(result.removed) > len(previous) * MAX_REMOVED_RATIO:
+            raise DatasetError(f"{path.name}: 기존 {len(previous)}행 중 {len(result.removed)}행이 사라짐 - 잘린 파일로 보고 건너뜀")
+        return result
+
+    def load_frame(self, family: str, columns: tuple, dtype: dict = None, numeric: tuple = (),
+                   predicate=None, chunksize: int = CHUNK_ROWS):
+        """최신 파일을 청크 단위로 읽어 조건에 맞는 행만 모은 DataFrame
+
+        Args:
+            columns: 읽을 컬럼 (파일에 없는 컬럼은 건너뜀)
+            dtype: 컬럼별 dtype (텍스트는 str)
+            numeric: 숫자로 바꿀 컬럼 (빈 값/잘못된 값은 0)
+            predicate: 청크 DataFrame -> 남길 행의 bool Series
+        """
+        import pandas as pd
+
+        path, encoding = self.locate(family)
+        wanted = set(columns)
+        total, parts = 0, []
+        started = time.perf_counter()
+        chunks = pd.read_csv(path, encoding=encoding, usecols=lambda c: c in wanted, dtype=dtype,
+                             chunksize=chunksize, on_bad_lines='skip')
+        for chunk in chunks:
+            total += len(chunk)
+            for column in numeric:
+                if column in chunk.columns:
+                    chunk[column] = pd.to_numeric(chunk[column], errors='coerce').fillna(0).astype('int32')
+            if predicate is not None:
+                chunk = chunk[predicate(chunk)]
+            if not chunk.empty:
+                parts.append(chunk)
+        elapsed = time.perf_counter() - started
+        if not total:
+            raise DatasetError(f"데이터셋에 행이 없음: {path.name}")
+
+        frame = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=[c for c in columns])
+        logger.info(f"{path.name}: {total}행 중 {len(frame)}행 사용, 컬럼 {len(frame.columns)}개 ({rate(total, elapsed)})")
+        return frame
+
+    def save_snapshot(self, result: DatasetDiff, session):
+        """반영을 마친 diff의 파일 정보 기록 (호출한 쪽 트랜잭션에서 커밋)"""
+        stat = result.path.stat()
+        m = _DATED.match(result.path.name)
+        session.merge(DatasetSnapshot(
+            family=result.family,
+            file=result.path.name,
+            file_date=m.group('date') if m else None,
+            encoding=result.encoding,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            rows=result.rows,
+            loaded_at=datetime.utcnow(),
+        ))
+
+
+def load_registry(data_dir: Path = DATA_DIR) -> DatasetRegistry:
+    return DatasetRegistry(data_dir)
@@ -1,9 +1,12 @@
 """한국관광공사 두루누비(걷기/자전거길) API 모듈"""
 
 import os
-import requests
+import math
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from core import http_client
+from core.api_response import decode, Page, Course
 
 load_dotenv()
 
@@ -15,7 +18,7 @@ class DurunubiAPI:
         self.service_key = service_key
         self.base_url = "https://apis.data.go.kr/B551011/Durunubi"
     
-    def _request(self, endpoint: str, params: dict) -> dict:
+    def _request(self, endpoint: str, params: dict) -> Page:
         default_params = {
             "serviceKey": self.service_key,
             "MobileOS": "ETC",
@@ -25,25 +28,23 @@ class DurunubiAPI:
         params.update(default_params)
         
         url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, params=params, timeout=30)
+        response = http_client.get('durunubi', url, params=params, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        page = decode(response.content, Course)
+        if not page.ok:
+            raise Exception(f"Durunubi API Error: {page.message or 'Unknown error'}")
         
-        header = data.get("response", {}).get("header", {})
-        if header.get("resultCode") != "0000":
-            error_msg = header.get("resultMsg", "Unknown error")
-            raise Exception(f"Durunubi API Error: {error_msg}")
-        
-        return data
+        return page
     
-    def get_course_list(
+    def get_course_page(
         self,
         course_type: str = "1",
-        num_of_rows: int = 20,
+        num_of_rows: int = 200,
         page_no: int = 1,
         area_code: Optional[str] = None
-    ) -> list:
+    ) -> tuple:
+        """한 페이지 조회 - (항목 리스트, 전체 건수)"""
         params = {
             "numOfRows": num_of_rows,
             "pageNo": page_no,
@@ -56,15 +57,33 @@ class DurunubiAPI:
         if area_code:
             params["areaCd"] = area_code
         
-        data = self._request("courseList", params)
-        items = data.get("response", {}).get("body", {}).get("items", {})
-        
-        if not items:
-            return []
+        page = self._request("courseList", params)
+        return page.items, page.total
+    
+    def get_course_list(
+        self,
+        course_type: str = "1",
+        num_of_rows: int = 20,
+        page_no: int = 1,
+        area_code: Optional[str] = None
+    ) -> list:
+        items, _ = self.get_course_page(course_type, num_of_rows, page_no, area_code)
+        return items
+    
+    def get_all_courses(self, course_type: str = "1", num_of_rows: int = 200, workers: int = 4) -> list:
+        """전체 코스 조회 - 첫 페이지로 전체 건수를 확인한 뒤 나머지 페이지를 병렬 조회"""
+        first, total = self.get_course_page(course_type, num_of_rows, 1)
+        pages = math.ceil(total / num_of_rows) if total else 1
+        if pages <= 1:
+            return first
         
-        item = items.get("item", [])
-        return item if isinstance(item, list) else [item]
-
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rest = pool.map(lambda page: self.get_course_page(course_type, num_of_rows, page)[0],
+                            range(2, pages + 1))
+            items = list(first)
+            for page_items in rest:
+                items.extend(page_items)
+        return items
 
 def load_durunubi_client() -> DurunubiAPI:
     service_key = os.getenv('TOUR_API_KEY')
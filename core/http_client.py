@@ -0,0 +1,116 @@
+"""외부 API 공통 HTTP 호출 - 모든 클라이언트가 이 함수를 거쳐 호출"""
+
+import time
+import threading
+import requests
+from core.circuit_breaker import BreakerRegistry, CircuitOpen  # noqa: F401 (클라이언트에서 http_client.CircuitOpen으로 사용)
+from core.image_ranker import host_of
+from core.metrics import record_api_call, registry
+from core.rate_limit import load_budget, QuotaExceeded  # noqa: F401 (클라이언트에서 http_client.QuotaExceeded로 사용)
+from core.single_flight import SingleFlight
+
+_budget = None
+_budget_lock = threading.Lock()
+_inflight = SingleFlight()
+breakers = BreakerRegistry()
+_service_hosts = {}  # 서비스 -> 마지막으로 호출한 호스트 (cache_only의 서킷 확인용)
+
+# 합칠 수 있는 요청 (본문이 없고 응답을 여러 호출자가 나눠 읽어도 되는 경우)
+COALESCE_METHODS = ('GET', 'HEAD')
+
+# 서킷 브레이커가 호스트 장애로 세는 결과 (4xx 등은 호스트가 응답한 것이므로 성공)
+BREAKER_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+def _host_failure(resp: requests.Response) -> bool:
+    return resp.status_code >= 500 or resp.status_code == 429
+
+
+def budget():
+    """공유 호출 예산 (처음 사용할 때 생성)"""
+    global _budget
+    if _budget is None:
+        with _budget_lock:
+            if _budget is None:
+                _budget = load_budget()
+    return _budget
+
+
+def cache_only(service: str, priority: str = None) -> bool:
+    """할당량이 부족하거나 서비스 호스트의 서킷이 열려 있어 캐시만 써야 하는지"""
+    host = _service_hosts.get(service)
+    if host and breakers.is_open(host):
+        return True
+    return budget().cache_only(service, priority)
+
+
+def _send(service: str, method: str, url: str, session=None, **kwargs) -> requests.Response:
+    """실제 네트워크 호출 + 지연 시간/상태 기록"""
+    sender = session or requests
+    start = time.monotonic()
+    try:
+        resp = sender.request(method, url, **kwargs)
+    except Exception:
+        record_api_call(service, 'error', time.monotonic() - start)
+        raise
+    record_api_call(service, resp.status_code, time.monotonic() - start)
+    return resp
+
+
+def _flight_key(service: str, method: str, url: str, session, kwargs: dict):
+    """합치기 키 - 본문/스트리밍 요청은 None (합치지 않음)
+
+    세션과 나머지 옵션(timeout, allow_redirects 등)까지 같은 요청만 합칩니다.
+    """
+    if method not in COALESCE_METHODS or kwargs.get('stream') or 'data' in kwargs or 'json' in kwargs:
+        return None
+    params = kwargs.get('params') or {}
+    headers = kwargs.get('headers') or {}
+    options = tuple(sorted((k, repr(v)) for k, v in kwargs.items() if k not in ('params', 'headers')))
+    return (service, method, url, id(session) if session is not None else None,
+            tuple(sorted((str(k), str(v)) for k, v in params.items())),
+            tuple(sorted((str(k), str(v)) for k, v in headers.items())),
+            options)
+
+
+def request(service: str, method: str, url: str, session=None, priority: str = None,
+            **kwargs) -> requests.Response:
+    """HTTP 요청 - 호스트 서킷과 호출 예산(속도 제한/일일 할당량) 확인 후 전송
+
+    같은 GET/HEAD 요청이 이미 진행 중이면 새로 보내지 않고 그 응답을 함께 받습니다.
+    (돌려받은 Response는 다른 호출자와 공유될 수 있으므로 수정하지 마세요)
+
+    Args:
+        service: 지표에 쓰일 서비스 이름 (예: 'gocamping', 'naver_image')
+        session: requests.Session (없으면 모듈 함수 사용)
+        priority: 'high' / 'normal' / 'low' (없으면 서비스 기본값)
+
+    Raises:
+        QuotaExceeded: 일일 할당량 중 이 우선순위의 몫이 바닥난 경우
+        CircuitOpen: 호스트 장애가 이어져 서킷이 열린 경우 (타임아웃을 기다리지 않고 바로 실패)
+    """
+    host = host_of(url)
+    _service_hosts[service] = host
+    breaker = breakers.get(host)
+
+    def send():
+        def attempt():
+            budget().acquire(service, priority)
+            return _send(service, method, url, session=session, **kwargs)
+        return breaker.call(attempt, is_failure=_host_failure, failure_exceptions=BREAKER_EXCEPTIONS)
+
+    key = _flight_key(service, method, url, session, kwargs)
+    if key is None:
+        return send()
+    resp, shared = _inflight.do(key, send)
+    if shared:
+        registry.inc('tap_api_coalesced_total', service=service)
+    return resp
+
+
+def get(service: str, url: str, **kwargs) -> requests.Response:
+    return request(service, 'GET', url, **kwargs)
+
+
+def head(service: str, url: str, **kwargs) -> requests.Response:
+    return request(service, 'HEAD', url, **kwargs)
@@ -1,9 +1,13 @@
 import logging
-import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import imagehash
 from PIL import Image
 from io import BytesIO
 from core.database import Session, ImageLog
+from core import http_client
+from core.metrics import record_bytes, record_cache
+from core.image_ranker import rank, photo_candidates, to_https, TOP_K
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 class ImageHandler:
     PHASH_THRESHOLD = 6
+    # 확인 후 기록(check-then-insert)이 병렬 조회끼리 겹치지 않도록 프로세스 안의 모든 핸들러가 공유
+    _register_lock = threading.Lock()
 
     def __init__(self, photo_api=None):
         self.photo_api = photo_api
@@ -24,43 +30,94 @@ class ImageHandler:
             logger.error(f"Hash 생성 실패: {e}")
             return None
 
-    def is_duplicate(self, url):
-        if not url:
-            return True
+    def _fetch_phash(self, url):
+        """이미지를 내려받아 phash 계산, 실패 시 None"""
         try:
-            resp = requests.get(url, timeout=15)
+            resp = http_client.get('image_download', url, timeout=15)
             resp.raise_for_status()
             content = resp.content
-            
-            current_hash = self._get_phash(content)
-            if not current_hash: return True
+            record_bytes('image', len(content))
+            return self._get_phash(content)
+        except Exception as e:
+            logger.warning(f"이미지 다운로드 실패: {e}")
+            return None
 
-            with Session() as session:
-                if session.query(ImageLog).filter_by(url=url).first():
-                    return True
-                
-                all_images = session.query(ImageLog).all()
-                for img_record in all_images:
-                    if img_record.phash:
-                        distance = imagehash.hex_to_hash(current_hash) - imagehash.hex_to_hash(img_record.phash)
-                        if distance < self.PHASH_THRESHOLD:
-                            return True
-                
-                new_img = ImageLog(url=url, phash=current_hash)
-                session.add(new_img)
-                session.commit()
+    def _register_if_new(self, url, current_hash):
+        """같은 URL이나 비슷한 이미지(phash)를 쓴 적이 없으면 기록하고 True"""
+        with self._register_lock, Session() as session:
+            known = session.query(ImageLog).filter_by(url=url).first() is not None
+            record_cache('image_log', known)
+            if known:
                 return False
+            
+            all_images = session.query(ImageLog).all()
+            for img_record in all_images:
+                if img_record.phash:
+                    distance = imagehash.hex_to_hash(current_hash) - imagehash.hex_to_hash(img_record.phash)
+                    if distance < self.PHASH_THRESHOLD:
+                        return False
+            
+            new_img = ImageLog(url=url, phash=current_hash)
+            session.add(new_img)
+            session.commit()
+            return True
+
+    def _used_urls(self, urls):
+        """이미 기록된 URL (http/https 표기 차이 포함)"""
+        variants = set(urls) | {'http://' + u[len('https://'):] for u in urls if u.startswith('https://')}
+        if not variants:
+            return set()
+        with Session() as session:
+            rows = session.query(ImageLog.url).filter(ImageLog.url.in_(variants)).all()
+        return {to_https(u) for (u,) in rows}
+
+    def is_duplicate(self, url):
+        if not url:
+            return True
+        current_hash = self._fetch_phash(url)
+        if not current_hash:
+            return True
+        try:
+            return not self._register_if_new(url, current_hash)
         except Exception as e:
             logger.warning(f"이미지 중복 체크 실패: {e}")
             return True
 
+    def _first_new(self, urls):
+        """점수순 후보 중 처음 나오는 새 이미지
+
+        1순위 후보만 먼저 받아 보고, 실패(다운로드 실패/중복)했을 때만 나머지 상위 후보를
+        병렬로 받아 해시를 구합니다.
+        """
+        urls = urls[:TOP_K]
+        if not urls:
+            return ""
+        if self._is_new(urls[0], self._fetch_phash(urls[0])):
+            return urls[0]
+        rest = urls[1:]
+        if not rest:
+            return ""
+        with ThreadPoolExecutor(max_workers=len(rest)) as pool:
+            hashes = list(pool.map(self._fetch_phash, rest))
+        for url, current_hash in zip(rest, hashes):
+            if self._is_new(url, current_hash):
+                return url
+        return ""
+
+    def _is_new(self, url, current_hash):
+        try:
+            return bool(current_hash) and self._register_if_new(url, current_hash)
+        except Exception as e:
+            logger.warning(f"이미지 중복 체크 실패: {e}")
+            return False
+
     def get_image(self, item, region="", theme=""):
         # 1. 원본 이미지 시도
         url = item.get('firstimage', '')
         if url and not self.is_duplicate(url):
             return url
         
-        # 2. PhotoAPI로 검색
+        # 2. PhotoAPI로 검색 - 메타데이터로 순위를 매기고 쓴 적 있는 URL은 받기 전에 제외
         if self.photo_api:
             title = item.get('title', '')
             keywords = self._build_search_keywords(title, region, theme)
@@ -68,10 +125,11 @@ class ImageHandler:
             
             for keyword in keywords:
                 photos = self.photo_api.search_photos(keyword, num_of_rows=5)
-                for p in photos:
-                    p_url = p.get('galWebImageUrl', '')
-                    if p_url and not self.is_duplicate(p_url):
-                        return p_url
+                candidates = photo_candidates(photos)
+                used = self._used_urls([u for _, u in candidates])
+                p_url = self._first_new(rank(candidates, used))
+                if p_url:
+                    return p_url
         
         return ""
 
@@ -98,7 +156,12 @@ class ImageHandler:
         
         return [k for k in keywords if k]
 
-    def check_images_available(self, items, region="", theme="", min_images=2):
+    def check_images_available(self, items, region="", theme="", min_images=2, cancelled=None):
+        """이미지를 min_images개 이상 확보할 수 있는지
+        
+        Args:
+            cancelled: threading.Event - 설정되면 남은 검색 요청을 보내지 않고 False (병렬 후보 취소용)
+        """
         found_count = 0
         
         for item in items:
@@ -109,6 +172,8 @@ class ImageHandler:
                 title = item.get('title', '')
                 keywords = self._build_search_keywords(title, region, theme)
                 for keyword in keywords:
+                    if cancelled is not None and cancelled.is_set():
+                        return False
                     photos = self.photo_api.search_photos(keyword, num_of_rows=1)
                     if photos:
                         found_count += 1
@@ -1,7 +1,8 @@
-import requests
 from PIL import Image
 from io import BytesIO
 import logging
+from core import http_client
+from core.metrics import record_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +13,8 @@ class ImageOptimizer:
 
     def optimize(self, url):
         try:
-            resp = requests.get(url, timeout=20)
+            resp = http_client.get('image_download', url, timeout=20)
+            record_bytes('image', len(resp.content))
             img = Image.open(BytesIO(resp.content))
             
             # RGB 변환 (PNG/RGBA 대응)
@@ -0,0 +1,123 @@
+"""이미지 후보 사전 선별 - 검색 응답의 메타데이터만으로 점수를 매겨 상위 후보만 검증"""
+
+import os
+from datetime import datetime
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+# 본문 삽입 시 너무 작은 이미지 (네이버 검색은 크기를 알려줌)
+MIN_WIDTH = 600
+MIN_HEIGHT = 340
+
+# 외부 링크(핫링크)를 막아 글에서 깨지는 호스트
+BAD_HOSTS = {
+    'postfiles.pstatic.net',
+    'blogfiles.pstatic.net',
+    'cafefiles.pstatic.net',
+    'cafeptthumb-phinf.pstatic.net',
+    'mblogthumb-phinf.pstatic.net',
+}
+BAD_HOSTS.update(h.strip() for h in os.getenv('IMAGE_BAD_HOSTS', '').split(',') if h.strip())
+
+# 후보 중 실제로 검증(HEAD/다운로드)할 개수
+TOP_K = 3
+
+
+def to_https(url: str) -> str:
+    return 'https://' + url[len('http://'):] if url.startswith('http://') else url
+
+
+def host_of(url: str) -> str:
+    try:
+        return urlparse(url).hostname or ''
+    except ValueError:
+        return ''
+
+
+def _as_int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def score_photo(photo: dict) -> float:
+    """관광공사 사진 - 최근 촬영일수록 높은 점수 (0~1)"""
+    month = str(photo.get('galPhotographyMonth') or '')
+    if len(month) != 6 or not month.isdigit():
+        return 0.3
+    age_years = datetime.now().year - int(month[:4]) + (datetime.now().month - int(month[4:])) / 12
+    return max(0.0, 1.0 - age_years / 20)
+
+
+def score_naver(item: dict) -> float:
+    """네이버 이미지 - 최소 크기 미만은 None, 가로형이고 클수록 높은 점수"""
+    width, height = _as_int(item.get('width') or item.get('sizewidth')), _as_int(item.get('height') or item.get('sizeheight'))
+    if not width or not height:
+        return 0.2
+    if width < MIN_WIDTH or height < MIN_HEIGHT:
+        return None
+    size = min(1.0, (width * height) / (1920 * 1080))
+    landscape = 1.0 if width >= height else 0.5
+    return 0.5 * size + 0.5 * landscape
+
+
+def photo_candidates(photos: list) -> list:
+    """Photo API 결과 -> [(점수, url)] (같은 galContentId는 하나만)"""
+    seen = set()
+    result = []
+    for photo in photos or []:
+        url = photo.get('galWebImageUrl', '')
+        content_id = photo.get('galContentId')
+        if not url or (content_id and content_id in seen):
+            continue
+        seen.add(content_id)
+        result.append((score_photo(photo), to_https(url)))
+    return result
+
+
+def naver_candidates(items: list) -> list:
+    """NaverImageAPI.search 결과 -> [(점수, url)] (https로 바꾸지 않음 - 모든 호스트가 https를 지원하지는 않음)"""
+    result = []
+    for item in items or []:
+        url = item.get('url') or item.get('link', '')
+        score = score_naver(item)
+        if url and score is not None:
+            result.append((score, url))
+    return result
+
+
+def rank(candidates: list, used: set = None) -> list:
+    """점수순 URL 리스트 - 이미 사용했거나 알려진 불량 호스트는 제외 (동점은 원래 순서)"""
+    used = used or set()
+    seen = set()
+    ranked = []
+    for order, (score, url) in enumerate(candidates):
+        if url in seen or url in used or to_https(url) in used or host_of(url) in BAD_HOSTS:
+            continue
+        seen.add(url)
+        ranked.append((-score, order, url))
+    return [url for _, _, url in sorted(ranked)]
+
+
+def first_valid(urls: list, validate, top_k: int = TOP_K):
+    """상위 top_k개 중 순위가 가장 높은 통과 URL, 없으면 ''
+
+    1순위만 먼저 검증하고, 실패했을 때만 나머지 상위 후보를 병렬 검증합니다.
+
+    Args:
+        validate: url -> bool (is_image_valid 등)
+    """
+    urls = urls[:top_k]
+    if not urls:
+        return ''
+    if validate(urls[0]):
+        return urls[0]
+    rest = urls[1:]
+    if not rest:
+        return ''
+    with ThreadPoolExecutor(max_workers=len(rest)) as pool:
+        for url, ok in zip(rest, pool.map(validate, rest)):
+            if ok:
+                return url
+    return ''
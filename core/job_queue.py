@@ -0,0 +1,121 @@
+"""SQLite 기반 영속 작업 큐 - 단계별 체크포인트 + 재개"""
+
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import or_, and_
+from core.database import Session, PublishJob
+
+logger = logging.getLogger(__name__)
+
+# 파이프라인 단계 (순서대로 실행, 완료 시 체크포인트)
+STAGES = ['selected', 'data_fetched', 'images_resolved', 'titled', 'generated', 'processed', 'published']
+
+MAX_ATTEMPTS = 3
+# 이 시간 동안 체크포인트가 없는 running 작업은 죽은 워커의 것으로 보고 회수
+LOCK_TIMEOUT = timedelta(minutes=30)
+
+
+class JobAborted(Exception):
+    """재시도해도 소용없는 실패 (데이터 없음 등) - 작업을 바로 failed 처리"""
+
+
+def remaining_stages(job: PublishJob) -> list:
+    """마지막 완료 단계 이후의 단계들"""
+    if job.stage not in STAGES:
+        return list(STAGES)
+    return STAGES[STAGES.index(job.stage) + 1:]
+
+
+class JobQueue:
+
+    def enqueue(self, artifacts: dict = None) -> int:
+        with Session() as session:
+            job = PublishJob(artifacts=artifacts or {})
+            session.add(job)
+            session.commit()
+            logger.info(f"작업 등록: #{job.id}")
+            return job.id
+
+    def claim(self, worker_id: str) -> PublishJob:
+        """대기 중이거나 잠금이 만료된 작업 하나를 원자적으로 점유
+
+        잠금이 만료됐는데 이미 MAX_ATTEMPTS번 시도한 작업(매번 워커가 죽는 작업)은 회수하지 않고 failed 처리합니다.
+        """
+        now = datetime.utcnow()
+        stale = and_(PublishJob.status == 'running', PublishJob.locked_at < now - LOCK_TIMEOUT)
+        with Session() as session:
+            exhausted = session.query(PublishJob).filter(stale, PublishJob.attempts >= MAX_ATTEMPTS).update({
+                'status': 'failed',
+                'error': f"워커가 응답 없이 {MAX_ATTEMPTS}회 중단됨",
+                'locked_at': None,
+                'updated_at': now,
+            }, synchronize_session=False)
+            session.commit()
+            if exhausted:
+                logger.warning(f"잠금 만료 작업 {exhausted}건 실패 확정 (시도 {MAX_ATTEMPTS}회 초과)")
+
+            candidates = session.query(PublishJob.id, PublishJob.version).filter(
+                or_(
+                    PublishJob.status == 'pending',
+                    and_(stale, PublishJob.attempts < MAX_ATTEMPTS)
+                )
+            ).order_by(PublishJob.id).limit(10).all()
+
+            for job_id, version in candidates:
+                claimed = session.query(PublishJob).filter(
+                    PublishJob.id == job_id,
+                    PublishJob.version == version
+                ).update({
+                    'status': 'running',
+                    'worker': worker_id,
+                    'locked_at': now,
+                    'version': version + 1,
+                    'attempts': PublishJob.attempts + 1,
+                }, synchronize_session=False)
+                session.commit()
+                if claimed:
+                    job = session.get(PublishJob, job_id)
+                    logger.info(f"작업 점유: #{job.id} (완료 단계: {job.stage}, 시도 {job.attempts})")
+                    return job
+        return None
+
+    def checkpoint(self, job_id: int, stage: str, artifacts: dict):
+        """단계 완료 기록 - 이후 실패해도 이 단계부터 재개"""
+        now = datetime.utcnow()
+        with Session() as session:
+            session.query(PublishJob).filter(PublishJob.id == job_id).update({
+                'stage': stage,
+                'artifacts': dict(artifacts),
+                'locked_at': now,
+                'updated_at': now,
+            }, synchronize_session=False)
+            session.commit()
+
+    def complete(self, job_id: int):
+        self._set_status(job_id, 'done', error=None)
+
+    def fail(self, job_id: int, error: str, retryable: bool = True):
+        with Session() as session:
+            job = session.get(PublishJob, job_id)
+            if job is None:
+                return
+            exhausted = not retryable or job.attempts >= MAX_ATTEMPTS
+            job.status = 'failed' if exhausted else 'pending'
+            job.error = error
+            job.locked_at = None
+            job.updated_at = datetime.utcnow()
+            session.commit()
+            state = "실패 확정" if exhausted else "재시도 대기"
+            logger.warning(f"작업 #{job_id} {state} (단계: {job.stage}): {error}")
+
+    def _set_status(self, job_id: int, status: str, **fields):
+        with Session() as session:
+            fields.update(status=status, locked_at=None, updated_at=datetime.utcnow())
+            session.query(PublishJob).filter(PublishJob.id == job_id).update(
+                fields, synchronize_session=False
+            )
+            session.commit()
+
+
+def load_job_queue():
+    return JobQueue()
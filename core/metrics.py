@@ -0,0 +1,266 @@
+"""실행 지표 수집 - 단계별 소요 시간, API 호출, 캐시 적중률, 다운로드 바이트
+
+데몬 모드에서는 Prometheus 텍스트 형식으로 HTTP 노출하고,
+실행마다 JSON 요약을 logs/metrics/에 남깁니다.
+"""
+
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 (초)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+HELP = {
+    'tap_stage_seconds': '파이프라인 단계별 소요 시간',
+    'tap_api_request_seconds': '외부 API 호출 지연 시간',
+    'tap_api_requests_total': '외부 API 호출 수 (상태별)',
+    'tap_cache_requests_total': '캐시 조회 수 (hit/miss)',
+    'tap_bytes_downloaded_total': '다운로드한 바이트 수',
+    'tap_api_quota_used': '오늘 사용한 API 호출 수 (할당량 키별)',
+    'tap_api_quota_limit': 'API 일일 호출 한도 (할당량 키별)',
+    'tap_api_throttled_total': '호출 예산으로 지연/차단된 API 호출 수 (rate/quota)',
+    'tap_api_coalesced_total': '진행 중인 동일 요청에 합쳐져 생략된 API 호출 수',
+    'tap_circuit_state': '호스트별 서킷 상태 (0 closed / 1 half-open / 2 open)',
+    'tap_circuit_transitions_total': '서킷 상태 전환 수 (전환된 상태별)',
+    'tap_circuit_rejected_total': '서킷이 열려 보내지 않은 요청 수',
+}
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    parts = []
+    for k, v in labels:
+        v = str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{k}="{v}"')
+    return '{' + ','.join(parts) + '}'
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}  # key -> [bucket counts..., sum, count]
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [0] * (len(BUCKETS) + 2)
+            for i, bound in enumerate(BUCKETS):
+                if value <= bound:
+                    hist[i] += 1
+            hist[-2] += value
+            hist[-1] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'gauges': dict(self._gauges),
+                'histograms': {k: list(v) for k, v in self._histograms.items()},
+            }
+
+    def render_prometheus(self) -> str:
+        snap = self.snapshot()
+        lines = []
+        typed = set()
+
+        def header(name, kind):
+            if name not in typed:
+                typed.add(name)
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(snap['counters'].items()):
+            header(name, 'counter')
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for (name, labels), value in sorted(snap['gauges'].items()):
+            header(name, 'gauge')
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        for (name, labels), hist in sorted(snap['histograms'].items()):
+            header(name, 'histogram')
+            for i, bound in enumerate(BUCKETS):
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {hist[i]}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {hist[-1]}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {round(hist[-2], 6)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {hist[-1]}")
+
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+# ===== 계측 헬퍼 =====
+
+@contextmanager
+def span(stage: str):
+    """파이프라인 단계 소요 시간 측정"""
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        registry.observe('tap_stage_seconds', time.monotonic() - start, stage=stage)
+
+
+def record_api_call(service: str, status, elapsed: float):
+    """API 호출 1건 기록 (status: HTTP 상태 코드 또는 'error')"""
+    registry.inc('tap_api_requests_total', service=service, status=str(status))
+    registry.observe('tap_api_request_seconds', elapsed, service=service)
+
+
+def record_cache(cache: str, hit: bool):
+    registry.inc('tap_cache_requests_total', cache=cache, result='hit' if hit else 'miss')
+
+
+def record_bytes(kind: str, size: int):
+    registry.inc('tap_bytes_downloaded_total', size, kind=kind)
+
+
+# ===== 실행 요약 =====
+
+def _diff(after: dict, before: dict, name: str) -> dict:
+    """name 지표의 before 이후 증가분 {labels: value}"""
+    result = {}
+    for (metric, labels), value in after.items():
+        if metric != name:
+            continue
+        prev = before.get((metric, labels))
+        if isinstance(value, list):
+            prev = prev or [0] * len(value)
+            delta = [a - b for a, b in zip(value, prev)]
+            if delta[-1]:
+                result[labels] = delta
+        else:
+            delta = value - (prev or 0)
+            if delta:
+                result[labels] = delta
+    return result
+
+
+def summarize(before: dict, after: dict = None) -> dict:
+    """두 스냅샷 사이의 증가분을 사람이 읽기 쉬운 JSON 요약으로"""
+    after = after or registry.snapshot()
+    hists, counters = after['histograms'], after['counters']
+    b_hists, b_counters = before['histograms'], before['counters']
+
+    stages = {
+        dict(labels)['stage']: round(h[-2], 3)
+        for labels, h in _diff(hists, b_hists, 'tap_stage_seconds').items()
+    }
+
+    apis = {}
+    for labels, h in _diff(hists, b_hists, 'tap_api_request_seconds').items():
+        service = dict(labels)['service']
+        apis[service] = {'calls': h[-1], 'seconds': round(h[-2], 3), 'status': {}}
+    for labels, count in _diff(counters, b_counters, 'tap_api_requests_total').items():
+        lab = dict(labels)
+        apis.setdefault(lab['service'], {'calls': 0, 'seconds': 0, 'status': {}})
+        apis[lab['service']]['status'][lab['status']] = count
+
+    caches = {}
+    for labels, count in _diff(counters, b_counters, 'tap_cache_requests_total').items():
+        lab = dict(labels)
+        caches.setdefault(lab['cache'], {'hit': 0, 'miss': 0})[lab['result']] = count
+    for stats in caches.values():
+        total = stats['hit'] + stats['miss']
+        stats['hit_ratio'] = round(stats['hit'] / total, 3) if total else None
+
+    downloaded = {
+        dict(labels)['kind']: int(v)
+        for labels, v in _diff(counters, b_counters, 'tap_bytes_downloaded_total').items()
+    }
+
+    quota = {}
+    for (metric, labels), value in after['gauges'].items():
+        if metric in ('tap_api_quota_used', 'tap_api_quota_limit'):
+            quota.setdefault(dict(labels)['key'], {})[metric.rsplit('_', 1)[-1]] = value
+    for labels, count in _diff(counters, b_counters, 'tap_api_throttled_total').items():
+        lab = dict(labels)
+        entry = apis.setdefault(lab['service'], {'calls': 0, 'seconds': 0, 'status': {}})
+        entry.setdefault('throttled', {})[lab['reason']] = count
+    for labels, count in _diff(counters, b_counters, 'tap_api_coalesced_total').items():
+        entry = apis.setdefault(dict(labels)['service'], {'calls': 0, 'seconds': 0, 'status': {}})
+        entry['coalesced'] = int(count)
+
+    circuits = {}
+    for labels, count in _diff(counters, b_counters, 'tap_circuit_rejected_total').items():
+        circuits.setdefault(dict(labels)['host'], {})['rejected'] = int(count)
+    for labels, count in _diff(counters, b_counters, 'tap_circuit_transitions_total').items():
+        lab = dict(labels)
+        circuits.setdefault(lab['host'], {})[lab['state']] = int(count)
+
+    return {
+        'stages': stages,
+        'total_seconds': round(sum(stages.values()), 3),
+        'api': apis,
+        'quota': quota,
+        'circuits': circuits,
+        'cache': caches,
+        'bytes_downloaded': downloaded,
+    }
+
+
+def write_run_summary(summary: dict, log_dir: Path) -> Path:
+    out_dir = log_dir / 'metrics'
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"run-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    return path
+
+
+# ===== HTTP 노출 =====
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.rstrip('/') != '/metrics':
+            self.send_error(404)
+            return
+        body = registry.render_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port: int = 9108, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """/metrics 엔드포인트를 백그라운드 스레드로 시작"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True)
+    thread.start()
+    logger.info(f"메트릭 엔드포인트: http://{host}:{port}/metrics")
+    return server
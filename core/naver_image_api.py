@@ -2,8 +2,9 @@
 """네이버 이미지 검색 API 모듈"""
 
 import os
-import requests
 from dotenv import load_dotenv
+from core import http_client, url_validity
+from core.image_ranker import rank, naver_candidates, first_valid
 
 load_dotenv()
 
@@ -30,7 +31,7 @@ class NaverImageAPI:
         }
         
         try:
-            resp = requests.get(self.base_url, headers=headers, params=params, timeout=10)
+            resp = http_client.get('naver_image', self.base_url, headers=headers, params=params, timeout=10)
             resp.raise_for_status()
             data = resp.json()
             
@@ -47,7 +48,7 @@ class NaverImageAPI:
                     'height': item.get('sizeheight', ''),
                 })
             return results
-        except:
+        except Exception:
             return []
     
     def get_image_for_place(self, place_name: str, region: str = "") -> str:
@@ -63,21 +64,14 @@ class NaverImageAPI:
             if not query:
                 continue
             results = self.search(query, display=3)
-            for r in results:
-                url = r.get('url', '')
-                if url and self._is_valid_image(url):
-                    return url
+            url = first_valid(rank(naver_candidates(results)), self._is_valid_image)
+            if url:
+                return url
         return ""
     
     def _is_valid_image(self, url: str) -> bool:
         """이미지 URL 유효성 검사"""
-        if not url:
-            return False
-        try:
-            resp = requests.head(url, timeout=5, allow_redirects=True)
-            return resp.status_code == 200
-        except:
-            return False
+        return url_validity.is_valid(url)
 
 
 def load_naver_image_api():
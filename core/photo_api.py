@@ -1,5 +1,8 @@
 import os
-import requests
+from datetime import timedelta
+from core import http_client
+from core.api_response import decode, from_payload, GalleryPhoto
+from core.response_cache import ResponseCache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -8,6 +11,8 @@ class PhotoAPI:
     def __init__(self):
         self.service_key = os.getenv('TOUR_API_KEY')
         self.base_url = "http://apis.data.go.kr/B551011/PhotoGalleryService1"
+        # 할당량 부족/서킷 열림/오류 응답 시에만 쓰는 이전 정상 검색 결과
+        self._fallback = ResponseCache('photo_gallery', {'gallerySearchList1': timedelta(days=30)})
 
     def search_photos(self, keyword, num_of_rows=10):
         if not self.service_key: return []
@@ -20,10 +25,25 @@ class PhotoAPI:
             "keyword": keyword
         }
         try:
-            resp = requests.get(f"{self.base_url}/gallerySearchList1", params=params, timeout=30)
-            items = resp.json().get('response', {}).get('body', {}).get('items', {}).get('item', [])
-            return [items] if isinstance(items, dict) else items
-        except:
+            if http_client.cache_only('photo_gallery'):
+                return self._cached(params)
+            try:
+                resp = http_client.get('photo_gallery', f"{self.base_url}/gallerySearchList1", params=params, timeout=30)
+            except http_client.CircuitOpen:
+                return self._cached(params)
+            page = decode(resp.content, GalleryPhoto)
+            if not (page.ok and page.items):
+                return self._cached(params)
+            self._fallback.set('gallerySearchList1', params, page.payload())
+            return page.items
+        except Exception:
+            return self._cached(params)
+
+    def _cached(self, params):
+        """마지막 정상 응답의 항목 (없거나 읽을 수 없으면 빈 목록)"""
+        try:
+            return from_payload(self._fallback.get('gallerySearchList1', params, allow_stale=True), GalleryPhoto).items
+        except Exception:
             return []
 
 def load_photo_client():
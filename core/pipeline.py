@@ -0,0 +1,249 @@
+"""발행 파이프라인 v10.0 - 단계별 실행 + 체크포인트 재개
+
+각 단계는 artifacts(dict)를 받아 갱신하며, 완료될 때마다 작업 큐에
+저장됩니다. 실패한 작업은 마지막으로 완료된 다음 단계부터 다시 실행됩니다.
+"""
+
+import os
+import socket
+import logging
+import threading
+from core.job_queue import JobAborted, load_job_queue, remaining_stages
+from core.metrics import span
+
+logger = logging.getLogger(__name__)
+
+
+class PublishPipeline:
+
+    def __init__(self):
+        self._writer = None
+        self._title_gen = None
+        self._publishers = None
+
+    # ===== 지연 로드 =====
+
+    @property
+    def writer(self):
+        if self._writer is None:
+            from core.ai_writer import load_ai_writer
+            self._writer = load_ai_writer()
+            if not self._writer:
+                raise JobAborted("OPENAI_API_KEY 없음")
+        return self._writer
+
+    @property
+    def title_gen(self):
+        if self._title_gen is None:
+            from core.title_generator import load_title_generator
+            self._title_gen = load_title_generator()
+        return self._title_gen
+
+    @property
+    def publishers(self):
+        if self._publishers is None:
+            from core.publishers import load_publishers
+            self._publishers = load_publishers()
+        return self._publishers
+
+    # ===== 단계 =====
+
+    def selected(self, artifacts: dict):
+        """콘텐츠 캘린더(python app.py plan)에 남은 슬롯이 있으면 그 슬롯, 없으면 즉시 선택"""
+        if self._take_slot(artifacts):
+            logger.info(f"[1] 계획된 슬롯: {artifacts['theme']} / {artifacts['display_region']}")
+            return
+        from core.camping_data import get_random_theme
+        artifacts['theme'] = get_random_theme()
+        logger.info(f"[1] 테마: {artifacts['theme']}")
+
+    def _take_slot(self, artifacts: dict) -> bool:
+        """미리 검증된 슬롯을 꺼내 테마/지역/장소를 채움 - 슬롯이 없거나 실패하면 False"""
+        from collections import Counter
+        from core.content_planner import pending_slots, load_content_planner
+        from core.naver_map import get_naver_map_link
+        try:
+            if not pending_slots():
+                return False
+            taken = load_content_planner().take()
+        except Exception as e:
+            logger.warning(f"캘린더 슬롯 사용 실패, 즉시 선택: {e}")
+            return False
+        if not taken:
+            return False
+
+        places, region, theme_data = taken
+        # 작업 체크포인트(JSON)에 저장되므로 dict로
+        items = [place.to_dict() for place in places]
+        for item in items:
+            item['map_url'] = item.get('map_url') or get_naver_map_link(item['title'])
+        sigungus = Counter(item['sigungu'] for item in items if item.get('sigungu'))
+        artifacts.update(
+            theme=theme_data.get('theme'),
+            angle=theme_data.get('angle'),
+            items=items,
+            do_name=next((item['do'] for item in items if item.get('do')), region),
+            display_region=region,
+            sigungu=sigungus.most_common(1)[0][0] if sigungus else '',
+        )
+        return True
+
+    def data_fetched(self, artifacts: dict):
+        from core.camping_data import get_camping_data
+        if artifacts.get('items'):
+            # 계획된 슬롯은 장소까지 정해져 있음
+            logger.info(f"[2-3] 계획된 장소: {len(artifacts['items'])}개")
+            return
+        theme = artifacts['theme']
+
+        data = get_camping_data(theme)
+        if not data:
+            logger.warning(f"'{theme}' 데이터 없음, 글램핑 폴백")
+            data = get_camping_data('글램핑')
+
+        if not data:
+            raise JobAborted("데이터 없음")
+
+        artifacts.update(
+            items=data['items'],
+            do_name=data['do_name'],
+            display_region=data['display_region'],
+            sigungu=data['sigungu']
+        )
+        logger.info(f"[2] 지역: {data['display_region']} {data['sigungu']}")
+        logger.info(f"[3] 장소: {len(data['items'])}개")
+        for item in data['items']:
+            logger.info(f"    - {item['title']}")
+
+    def images_resolved(self, artifacts: dict):
+        from core.data_loader.utils import is_image_valid
+        for item in artifacts['items']:
+            url = item.get('image', '')
+            if url.startswith('http://'):
+                url = url.replace('http://', 'https://')
+            item['image'] = url if is_image_valid(url) else ''
+
+    def titled(self, artifacts: dict):
+        """제목 생성 - 생성 즉시 사용 처리(UsedTitle)되므로 따로 체크포인트해 본문 생성 재시도 때 재사용"""
+        artifacts['title'] = self.title_gen.generate(
+            artifacts['display_region'], artifacts['theme'], len(artifacts['items']),
+            sigungu=artifacts['sigungu']
+        )
+        logger.info(f"[4] 제목: {artifacts['title']}")
+
+    def generated(self, artifacts: dict):
+        from core.config import ANGLE_MAP
+        theme = artifacts['theme']
+        items = artifacts['items']
+
+        angle = artifacts.get('angle') or ANGLE_MAP.get(theme, theme)
+        logger.info(f"[5] AI 생성 중... (앵글: {angle})")
+        artifacts['raw_content'] = self.writer.generate_full_content(
+            items=items,
+            theme=theme,
+            region=f"{artifacts['display_region']} {artifacts['sigungu']}",
+            angle=angle
+        )
+
+    def processed(self, artifacts: dict):
+        from core.content_processor import process_content
+        from core.config import DEFAULT_LABEL
+        final_content = process_content(
+            artifacts['raw_content'], artifacts['items'], artifacts['display_region'], artifacts['theme']
+        )
+        artifacts['final_content'] = final_content
+        artifacts['labels'] = [DEFAULT_LABEL, artifacts['theme'], artifacts['display_region']]
+        logger.info(f"[6] 후처리 완료 ({len(final_content)}자)")
+
+    def published(self, artifacts: dict):
+        from core.publishers import publish_all
+        if not self.publishers:
+            raise JobAborted("사용 가능한 발행 대상 없음")
+        done = set(artifacts.get('published_targets', []))
+        pending = [p for p in self.publishers if p.name not in done]
+
+        logger.info(f"[7] 발행 중... (라벨: {artifacts['labels']})")
+        outcomes = publish_all(
+            pending,
+            title=artifacts['title'],
+            content=artifacts['final_content'],
+            labels=artifacts['labels'],
+            is_draft=False
+        )
+        for outcome in outcomes:
+            if outcome['ok']:
+                done.add(outcome['target'])
+                logger.info(f"[8] [{outcome['target']}] 발행 완료: {outcome['result'].get('url', 'URL 없음')} ({outcome['elapsed']}초)")
+            else:
+                logger.error(f"[8] [{outcome['target']}] 발행 실패: {outcome['error']}")
+
+        artifacts['published_targets'] = sorted(done)
+        artifacts.setdefault('outcomes', []).extend(outcomes)
+        failed = [o['target'] for o in outcomes if not o['ok']]
+        if failed:
+            # 성공한 대상은 published_targets에 남아 재시도 시 실패한 대상만 다시 발행
+            raise RuntimeError(f"발행 실패 대상: {failed}")
+
+    # ===== 실행 =====
+
+    def run_job(self, queue, job) -> bool:
+        """작업을 마지막 체크포인트 다음 단계부터 끝까지 실행"""
+        artifacts = dict(job.artifacts or {})
+        completed = stage = job.stage
+        try:
+            for stage in remaining_stages(job):
+                with span(stage):
+                    getattr(self, stage)(artifacts)
+                queue.checkpoint(job.id, stage, artifacts)
+                completed = stage
+        except JobAborted as e:
+            queue.fail(job.id, f"{stage}: {e}", retryable=False)
+            return False
+        except Exception as e:
+            # 실패한 단계의 부분 산출물(이미 발행된 대상 등)도 함께 보존
+            queue.checkpoint(job.id, completed, artifacts)
+            queue.fail(job.id, f"{stage}: {e}")
+            return False
+
+        queue.complete(job.id)
+        return True
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def run_once() -> bool:
+    """재개할 작업이 있으면 이어서, 없으면 새 작업을 등록해 한 건 실행"""
+    queue = load_job_queue()
+    pipeline = PublishPipeline()
+
+    job = queue.claim(worker_id())
+    if job is None:
+        queue.enqueue()
+        job = queue.claim(worker_id())
+    if job is None:
+        return False
+    return pipeline.run_job(queue, job)
+
+
+def drain(workers: int = 1) -> int:
+    """대기 중인 작업을 여러 워커로 모두 처리, 성공 건수 반환"""
+    queue = load_job_queue()
+    succeeded = []
+
+    def loop():
+        pipeline = PublishPipeline()
+        while True:
+            job = queue.claim(worker_id())
+            if job is None:
+                return
+            if pipeline.run_job(queue, job):
+                succeeded.append(job.id)
+
+    threads = [threading.Thread(target=loop, name=f"worker-{i}") for i in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(succeeded)
@@ -0,0 +1,125 @@
+"""장소 레코드 - 후보 장소를 dict 대신 고정 필드 객체로 보관
+
+__slots__ 데이터클래스라 항목마다 dict를 두지 않고, 여러 장소가 공유하는
+지역명/시군구/소스 문자열은 intern해 한 번만 저장합니다.
+기존 dict 소비 코드를 위해 get()/[] 조회를 지원하며, 프롬프트/HTML이나
+작업 체크포인트(JSON)로 넘길 때만 to_dict()로 변환합니다.
+"""
+
+import sys
+from dataclasses import dataclass
+from core.spatial import as_coord
+
+# 반복되는 값이라 intern하는 필드
+_INTERNED = ('do', 'sigungu', 'region', 'series', 'source')
+
+# API 원본 이름으로 조회하던 코드 호환 (ContentGenerator 계열)
+_ALIASES = {'addr1': 'addr', 'firstimage': 'image'}
+
+# to_dict로 내보내는 필드 - 기존 장소 dict와 같은 키 (좌표/지역 그룹/시리즈 등 내부용 필드는 제외)
+_DICT_FIELDS = ('title', 'addr', 'do', 'sigungu', 'overview', 'image', 'map_url', 'tel', 'homepage', 'source')
+
+
+def _clean(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return value
+    value = str(value)
+    return '' if value.lower() in ('nan', 'none') else value
+
+
+def _coord(lat, lon) -> dict:
+    coord = as_coord(lat, lon)
+    return {'lat': coord[0], 'lon': coord[1]} if coord else {}
+
+
+@dataclass(slots=True)
+class Place:
+    title: str = ''
+    addr: str = ''
+    do: str = ''
+    sigungu: str = ''
+    region: str = ''  # 지역 그룹 (예: '경기 남부')
+    overview: str = ''
+    image: str = ''
+    map_url: str = ''
+    tel: str = ''
+    homepage: str = ''
+    detail_url: str = ''
+    series: str = ''
+    source: str = ''
+    quality: str = ''  # 한국관광 품질인증 등급 (카탈로그)
+    accessible: bool = False  # 열린관광지 (카탈로그)
+    lat: float = None
+    lon: float = None
+
+    def __post_init__(self):
+        for name in _INTERNED:
+            value = getattr(self, name)
+            if value:
+                setattr(self, name, sys.intern(value))
+
+    # ===== dict 호환 =====
+
+    def get(self, key: str, default=None):
+        try:
+            return getattr(self, _ALIASES.get(key, key))
+        except AttributeError:
+            return default
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, _ALIASES.get(key, key))
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value):
+        setattr(self, _ALIASES.get(key, key), value)
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in _DICT_FIELDS}
+        # 카탈로그 보충 정보는 있을 때만 (AI 프롬프트에서 사용)
+        if self.quality:
+            data['quality'] = self.quality
+        if self.accessible:
+            data['accessible'] = True
+        return data
+
+    # ===== 원본 변환 =====
+
+    @classmethod
+    def from_camping(cls, item: dict, region: str = '', source: str = 'camping') -> 'Place':
+        """고캠핑 API 항목"""
+        return cls(
+            title=item.get('facltNm', ''),
+            addr=item.get('addr1', ''),
+            do=item.get('doNm', ''),
+            sigungu=item.get('sigunguNm', ''),
+            region=region,
+            overview=item.get('intro', '') or item.get('lineIntro', ''),
+            image=item.get('firstImageUrl', ''),
+            tel=item.get('tel', ''),
+            homepage=item.get('homepage', ''),
+            source=source,
+            **_coord(item.get('mapY'), item.get('mapX')),
+        )
+
+    @classmethod
+    def from_course(cls, course, source: str) -> 'Place':
+        """두루누비 코스 저장소 행 (DurunubiCourse)"""
+        data = course.data or {}
+        return cls(
+            title=course.title,
+            addr=course.addr,
+            region=course.region_group or '',
+            overview=data.get('crsContents', '') or data.get('crsSummary', ''),
+            image=data.get('crsImg', ''),
+            series=course.series_key or '',
+            source=source,
+        )
+
+    @classmethod
+    def from_row(cls, source: str, **values) -> 'Place':
+        """CSV 행 값 (nan/None은 빈 문자열로)"""
+        return cls(source=source, **{k: _clean(v) for k, v in values.items()})
@@ -0,0 +1,87 @@
+"""발행 대상 공통 인터페이스 + 다중 대상 동시 발행"""
+
+import os
+import time
+import logging
+import importlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# 대상 이름 -> load_publisher()를 제공하는 모듈
+TARGETS = {
+    'blogger': 'core.blogger_publisher',
+    'wordpress': 'core.wordpress_publisher',
+}
+
+
+class Publisher(ABC):
+    """발행기 공통 인터페이스
+
+    create_post는 최소한 {'id', 'url'}을 포함한 dict를 반환해야 합니다.
+    """
+    name = ''
+
+    @abstractmethod
+    def create_post(self, title: str, content: str, labels: list = None,
+                    is_draft: bool = True) -> dict:
+        """포스트 1건 생성"""
+
+
+def get_target_names() -> list:
+    """PUBLISH_TARGETS 환경 변수 (예: 'blogger,wordpress'), 기본 blogger"""
+    raw = os.getenv('PUBLISH_TARGETS', 'blogger')
+    return [t.strip() for t in raw.split(',') if t.strip()]
+
+
+def load_publishers(targets: list = None) -> list:
+    """대상별 발행기 로드 - 한 대상의 인증 실패가 다른 대상을 막지 않음"""
+    publishers = []
+    for name in targets or get_target_names():
+        module_name = TARGETS.get(name)
+        if not module_name:
+            logger.error(f"알 수 없는 발행 대상: {name}")
+            continue
+        try:
+            publishers.append(importlib.import_module(module_name).load_publisher())
+        except Exception as e:
+            logger.error(f"발행기 로드 실패 ({name}): {e}")
+    return publishers
+
+
+def _publish_one(publisher: Publisher, title: str, content: str, labels: list,
+                 is_draft: bool) -> dict:
+    start = time.monotonic()
+    outcome = {'target': publisher.name, 'ok': False, 'result': None, 'error': None}
+    try:
+        outcome['result'] = publisher.create_post(
+            title=title,
+            content=content,
+            labels=labels,
+            is_draft=is_draft
+        )
+        outcome['ok'] = True
+    except Exception as e:
+        outcome['error'] = str(e)
+        logger.error(f"[{publisher.name}] 발행 실패: {e}")
+    outcome['elapsed'] = round(time.monotonic() - start, 3)
+    return outcome
+
+
+def publish_all(publishers: list, title: str, content: str, labels: list = None,
+                is_draft: bool = False) -> list:
+    """같은 콘텐츠를 모든 대상에 동시에 발행
+
+    Returns:
+        대상별 결과 [{'target', 'ok', 'result', 'error', 'elapsed'}, ...]
+    """
+    if not publishers:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(publishers)) as pool:
+        futures = [
+            pool.submit(_publish_one, p, title, content, labels, is_draft)
+            for p in publishers
+        ]
+        return [f.result() for f in futures]
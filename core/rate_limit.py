@@ -0,0 +1,208 @@
+"""클라이언트 측 호출 속도 제한과 일일 할당량 관리"""
+
+import os
+import time
+import atexit
+import threading
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from core.database import Session, ApiQuota
+from core.metrics import registry
+
+load_dotenv()
+
+
+class TokenBucket:
+    """초당 rate개씩 토큰이 차는 버킷 - acquire는 토큰이 생길 때까지 대기
+
+    Args:
+        rate: 초당 허용 호출 수
+        capacity: 순간적으로 몰아 쓸 수 있는 최대 토큰 수 (기본: rate)
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """토큰을 확보할 때까지 대기하고 실제 대기 시간(초)을 반환"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+# ===== 일일 할당량 =====
+
+class QuotaExceeded(Exception):
+    """일일 할당량(또는 해당 우선순위 몫)이 바닥나 호출을 보내지 않음"""
+
+
+# 같은 할당량을 공유하는 서비스 -> 키 이름
+QUOTA_KEYS = {
+    'gocamping': 'data_go_kr',
+    'photo_gallery': 'data_go_kr',
+    'kor_service': 'data_go_kr',
+    'durunubi': 'data_go_kr',
+    'naver_image': 'naver_search',
+}
+
+# 서비스 기본 우선순위 - 카탈로그 동기화 > 상세 조회 > 사진 검색
+SERVICE_PRIORITY = {
+    'gocamping': 'high',
+    'durunubi': 'high',
+    'kor_service': 'normal',
+    'photo_gallery': 'low',
+    'naver_image': 'low',
+}
+
+# 남은 할당량 비율이 이 값 아래면 해당 우선순위 호출은 보내지 않음
+RESERVE = {'high': 0.0, 'normal': 0.05, 'low': 0.2}
+
+KST = timezone(timedelta(hours=9))
+
+
+def _today() -> str:
+    return datetime.now(KST).strftime('%Y-%m-%d')
+
+
+class DailyQuota:
+    """키 하나의 일일 호출 수 - 메모리에서 세고 flush_every건마다 DB에 합산
+
+    여러 프로세스가 같은 DB를 쓰면 flush 때마다 다른 프로세스의 사용량도 반영됩니다.
+    """
+
+    def __init__(self, key: str, limit: int, flush_every: int = 10):
+        self.key = key
+        self.limit = limit
+        self.flush_every = flush_every
+        self._day = None
+        self._base = 0  # 마지막 동기화 시점의 DB 사용량
+        self._pending = 0  # 아직 DB에 반영하지 않은 호출 수
+        self._lock = threading.Lock()
+
+    def _sync(self):
+        with Session() as session:
+            if self._pending:
+                stmt = sqlite_insert(ApiQuota).values(key=self.key, day=self._day, used=self._pending,
+                                                      updated_at=datetime.utcnow())
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=['key', 'day'],
+                    set_={'used': ApiQuota.used + stmt.excluded.used, 'updated_at': stmt.excluded.updated_at},
+                ))
+                session.commit()
+            row = session.query(ApiQuota.used).filter_by(key=self.key, day=self._day).scalar()
+        self._base = row or 0
+        self._pending = 0
+
+    def _roll(self):
+        today = _today()
+        if today != self._day:
+            if self._day is not None and self._pending:
+                self._sync()
+            self._day = today
+            self._pending = 0
+            self._sync()
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            self._roll()
+            return self._base + self._pending
+
+    def allows(self, priority: str) -> bool:
+        with self._lock:
+            self._roll()
+            remaining = self.limit - self._base - self._pending
+        return remaining - 1 >= self.limit * RESERVE.get(priority, 0.0)
+
+    def consume(self, priority: str) -> bool:
+        """우선순위 몫이 남아 있으면 1건 차감하고 True"""
+        with self._lock:
+            self._roll()
+            remaining = self.limit - self._base - self._pending
+            if remaining - 1 < self.limit * RESERVE.get(priority, 0.0):
+                return False
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._sync()
+            used = self._base + self._pending
+        registry.set_gauge('tap_api_quota_used', used, key=self.key)
+        return True
+
+    def flush(self):
+        with self._lock:
+            if self._day is not None and self._pending:
+                self._sync()
+
+
+class ApiBudget:
+    """모든 API 클라이언트가 공유하는 호출 예산 (속도 제한 + 일일 할당량)"""
+
+    def __init__(self, limits: dict, rates: dict):
+        """
+        Args:
+            limits: {키 이름: 일일 호출 한도}
+            rates: {키 이름: 초당 호출 수}
+        """
+        self._quotas = {key: DailyQuota(key, limit) for key, limit in limits.items() if limit}
+        self._buckets = {key: TokenBucket(rate) for key, rate in rates.items() if rate}
+        for key, limit in limits.items():
+            registry.set_gauge('tap_api_quota_limit', limit, key=key)
+
+    def acquire(self, service: str, priority: str = None):
+        """호출 1건 허가 - 할당량이 부족하면 QuotaExceeded, 속도 제한은 대기"""
+        key = QUOTA_KEYS.get(service)
+        if key is None:
+            return
+        priority = priority or SERVICE_PRIORITY.get(service, 'normal')
+        quota = self._quotas.get(key)
+        if quota and not quota.consume(priority):
+            registry.inc('tap_api_throttled_total', service=service, reason='quota')
+            raise QuotaExceeded(f"{key} 일일 할당량 부족 ({quota.used}/{quota.limit}, {service}, {priority})")
+        bucket = self._buckets.get(key)
+        if bucket and bucket.acquire():
+            registry.inc('tap_api_throttled_total', service=service, reason='rate')
+
+    def cache_only(self, service: str, priority: str = None) -> bool:
+        """지금 이 서비스 호출이 할당량 때문에 막히는지 (캐시만 써야 하는지)"""
+        quota = self._quotas.get(QUOTA_KEYS.get(service))
+        if quota is None:
+            return False
+        return not quota.allows(priority or SERVICE_PRIORITY.get(service, 'normal'))
+
+    def usage(self) -> dict:
+        return {key: {'used': q.used, 'limit': q.limit} for key, q in self._quotas.items()}
+
+    def flush(self):
+        for quota in self._quotas.values():
+            quota.flush()
+
+
+def load_budget() -> ApiBudget:
+    budget = ApiBudget(
+        limits={
+            'data_go_kr': int(os.getenv('DATA_GO_KR_DAILY_QUOTA', '10000')),
+            'naver_search': int(os.getenv('NAVER_SEARCH_DAILY_QUOTA', '25000')),
+        },
+        rates={
+            'data_go_kr': float(os.getenv('DATA_GO_KR_RATE', '10')),
+            'naver_search': float(os.getenv('NAVER_SEARCH_RATE', '10')),
+        },
+    )
+    atexit.register(budget.flush)
+    return budget
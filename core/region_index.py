@@ -0,0 +1,62 @@
+"""주소 -> 지역 그룹 해석기 (config/regions.yaml)"""
+
+import re
+from bisect import bisect_right
+
+
+class RegionIndex:
+    """regions.yaml의 시군구명 전체를 하나의 정규식으로 컴파일해 주소를 해석
+
+    주소를 왼쪽부터 훑으며 각 위치에서 가장 긴 시군구명을 겹치지 않게 찾고,
+    그중 가장 긴 이름, 길이가 같으면 먼저 나온 이름을 택합니다.
+    같은 시군구가 여러 그룹에 있으면 regions.yaml에서 앞선 그룹이 우선합니다.
+    """
+
+    _SEPARATOR = '\n'
+
+    def __init__(self, regions: dict):
+        self._group_of = {}
+        for group, group_cities in (regions or {}).items():
+            for city in group_cities or []:
+                if city and city not in self._group_of:
+                    self._group_of[city] = group
+        # 긴 이름을 앞에 두어 같은 위치에서는 가장 긴 이름이 매칭되도록
+        names = sorted(self._group_of, key=len, reverse=True)
+        self._pattern = re.compile('|'.join(map(re.escape, names))) if names else None
+        self._cache = {}
+
+    def _pick(self, matches) -> str:
+        best = None
+        for m in matches:
+            if best is None or len(m.group()) > len(best):
+                best = m.group()
+        return self._group_of[best] if best else None
+
+    def resolve(self, addr: str) -> str:
+        """주소의 지역 그룹, 없으면 None"""
+        if not addr or self._pattern is None:
+            return None
+        if addr not in self._cache:
+            self._cache[addr] = self._pick(self._pattern.finditer(addr))
+        return self._cache[addr]
+
+    def resolve_many(self, addrs) -> list:
+        """주소 리스트를 정규식 한 번의 스캔으로 해석 (중복/캐시된 주소는 건너뜀)"""
+        addrs = list(addrs)
+        pending = list(dict.fromkeys(
+            a for a in addrs if a and a not in self._cache and self._SEPARATOR not in a
+        ))
+        if pending and self._pattern is not None:
+            text = self._SEPARATOR.join(pending)
+            starts, offset = [], 0
+            for addr in pending:
+                starts.append(offset)
+                offset += len(addr) + 1
+
+            per_addr = [[] for _ in pending]
+            for m in self._pattern.finditer(text):
+                per_addr[bisect_right(starts, m.start()) - 1].append(m)
+            for addr, matches in zip(pending, per_addr):
+                self._cache[addr] = self._pick(matches)
+
+        return [self.resolve(a) for a in addrs]
@@ -0,0 +1,79 @@
+"""API 응답 캐시 (SQLite) - 같은 요청은 TTL 동안 네트워크 없이 재사용"""
+
+import json
+import hashlib
+import logging
+from datetime import datetime
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from core.database import Session, ApiCache
+from core.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+# 키에서 제외할 파라미터 (인증키 등 응답에 영향이 없는 값)
+IGNORED_PARAMS = {'serviceKey', 'MobileOS', 'MobileApp', '_type'}
+
+
+def cache_key(service: str, endpoint: str, params: dict) -> str:
+    relevant = {k: str(v) for k, v in (params or {}).items() if k not in IGNORED_PARAMS}
+    raw = json.dumps(relevant, sort_keys=True, ensure_ascii=False)
+    return f"{service}/{endpoint}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+
+class ResponseCache:
+    """서비스 하나의 응답 캐시
+
+    Args:
+        service: 지표/키에 쓰일 서비스 이름 (예: 'kor_service')
+        ttl: 엔드포인트별 TTL {endpoint: timedelta}, 없는 엔드포인트는 캐시하지 않음
+    """
+
+    def __init__(self, service: str, ttl: dict):
+        self.service = service
+        self.ttl = ttl
+
+    def get(self, endpoint: str, params: dict, allow_stale: bool = False):
+        """유효한 캐시 응답, 없으면 None
+
+        Args:
+            allow_stale: TTL이 지난 응답도 반환 (할당량 부족 등으로 캐시만 써야 할 때)
+        """
+        if endpoint not in self.ttl:
+            return None
+        with Session() as session:
+            entry = session.get(ApiCache, cache_key(self.service, endpoint, params))
+            hit = entry is not None and (allow_stale or entry.expires_at > datetime.utcnow())
+        record_cache(self.service, hit)
+        return entry.payload if hit else None
+
+    def set(self, endpoint: str, params: dict, payload):
+        ttl = self.ttl.get(endpoint)
+        if not ttl:
+            return
+        now = datetime.utcnow()
+        try:
+            stmt = sqlite_insert(ApiCache).values(key=cache_key(self.service, endpoint, params), endpoint=endpoint,
+                                                  payload=payload, expires_at=now + ttl, created_at=now)
+            with Session() as session:
+                # 동시에 같은 키를 저장해도 충돌하지 않도록 upsert
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=['key'],
+                    set_={'payload': stmt.excluded.payload, 'expires_at': stmt.excluded.expires_at,
+                          'created_at': stmt.excluded.created_at},
+                ))
+                session.commit()
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패({endpoint}): {e}")
+
+    def purge_expired(self) -> int:
+        with Session() as session:
+            count = session.query(ApiCache).filter(
+                ApiCache.key.like(f"{self.service}/%"), ApiCache.expires_at <= datetime.utcnow()
+            ).delete(synchronize_session=False)
+            session.commit()
+        return count
+
+    def clear(self):
+        with Session() as session:
+            session.query(ApiCache).filter(ApiCache.key.like(f"{self.service}/%")).delete(synchronize_session=False)
+            session.commit()
@@ -0,0 +1,36 @@
+"""재시도 백오프 유틸리티"""
+
+import random
+import time
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """지수 백오프 대기 시간 (full jitter)
+
+    Args:
+        attempt: 0부터 시작하는 재시도 횟수
+        base: 첫 대기 시간(초)
+        cap: 최대 대기 시간(초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def sleep_backoff(attempt: int, base: float = 1.0, cap: float = 60.0,
+                  retry_after: float = None) -> float:
+    """백오프만큼 대기 후 실제 대기 시간 반환
+
+    서버가 Retry-After를 알려주면 그 값을 우선 사용합니다.
+    """
+    delay = retry_after if retry_after else backoff_delay(attempt, base, cap)
+    time.sleep(delay)
+    return delay
+
+
+def parse_retry_after(value) -> float:
+    """Retry-After 헤더(초 단위) 파싱, 해석 불가 시 None"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,45 @@
+"""동일 요청 합치기 (single-flight) - 같은 키의 호출이 진행 중이면 그 결과를 함께 받음"""
+
+import threading
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 호출만 실행하고, 나머지 대기자에게 같은 결과(또는 예외)를 전달"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """(결과, 공유 여부) - 공유 여부가 True면 다른 스레드의 호출 결과를 받은 것"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
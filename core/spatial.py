@@ -0,0 +1,114 @@
+"""좌표 격자 색인 - 반경/최근접 장소 질의를 전체 목록 순회 없이 처리
+
+위경도를 한반도 기준 평면 좌표(km)로 근사해 cell_km 크기의 격자 칸에 나눠 담고,
+질의 지점 주변 칸만 보고 정확한 거리는 하버사인으로 계산합니다.
+"""
+
+import math
+import heapq
+from collections import defaultdict
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEG = math.pi * EARTH_RADIUS_KM / 180
+REFERENCE_LAT = 36.5  # 경도 방향 축척 기준 (한반도 중앙)
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 지점 사이 거리(km)"""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def as_coord(lat, lon):
+    """(lat, lon) float 쌍, 값이 없거나 범위를 벗어나면 None (GoCamping mapY/mapX 문자열 등)"""
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        return None
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180) or (lat == 0 and lon == 0):
+        return None
+    return lat, lon
+
+
+class GridIndex:
+    """격자 칸별 점 목록 (읽기 전용으로 쓰는 동안 여러 스레드에서 조회 가능)"""
+
+    def __init__(self, cell_km: float = 5.0):
+        self.cell_km = cell_km
+        self._x_scale = KM_PER_DEG * math.cos(math.radians(REFERENCE_LAT))
+        self._cells = defaultdict(list)  # (cx, cy) -> [(lat, lon, obj)]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _cell(self, lat: float, lon: float) -> tuple:
+        return int(math.floor(lon * self._x_scale / self.cell_km)), int(math.floor(lat * KM_PER_DEG / self.cell_km))
+
+    def add(self, lat: float, lon: float, obj):
+        self._cells[self._cell(lat, lon)].append((lat, lon, obj))
+        self._size += 1
+
+    def _ring(self, cx: int, cy: int, r: int):
+        """중심 칸에서 체비쇼프 거리 r인 칸들"""
+        if r == 0:
+            yield cx, cy
+            return
+        for dx in range(-r, r + 1):
+            yield cx + dx, cy - r
+            yield cx + dx, cy + r
+        for dy in range(-r + 1, r):
+            yield cx - r, cy + dy
+            yield cx + r, cy + dy
+
+    def _ring_min_km(self, r: int) -> float:
+        """r번째 고리 안의 점까지의 최소 거리 하한 (평면 근사 오차 여유 포함)"""
+        return max(0.0, (r - 1) * self.cell_km) * 0.95
+
+    def within(self, lat: float, lon: float, radius_km: float, accept=None) -> list:
+        """반경 안의 [(거리, obj)] - 가까운 순
+
+        Args:
+            accept: obj -> bool, False인 점은 제외
+        """
+        cx, cy = self._cell(lat, lon)
+        # 경도 축척은 위도에 따라 달라지므로 한 칸 여유
+        reach = int(math.ceil(radius_km / self.cell_km / 0.95)) + 1
+        found = []
+        for r in range(reach + 1):
+            for cell in self._ring(cx, cy, r):
+                for plat, plon, obj in self._cells.get(cell, ()):
+                    if accept is not None and not accept(obj):
+                        continue
+                    d = haversine(lat, lon, plat, plon)
+                    if d <= radius_km:
+                        found.append((d, obj))
+        found.sort(key=lambda pair: pair[0])
+        return found
+
+    def nearest(self, lat: float, lon: float, k: int = 5, max_km: float = 200.0, accept=None) -> list:
+        """가까운 k개의 [(거리, obj)] - 고리를 넓혀 가다 k번째 거리보다 먼 고리에서 멈춤"""
+        if k <= 0 or not self._size:
+            return []
+        cx, cy = self._cell(lat, lon)
+        heap = []  # (-거리, 순번, obj) 최대 힙
+        count = 0
+        max_ring = int(math.ceil(max_km / self.cell_km / 0.95)) + 1
+        for r in range(max_ring + 1):
+            if len(heap) == k and self._ring_min_km(r) > -heap[0][0]:
+                break
+            for cell in self._ring(cx, cy, r):
+                for plat, plon, obj in self._cells.get(cell, ()):
+                    if accept is not None and not accept(obj):
+                        continue
+                    d = haversine(lat, lon, plat, plon)
+                    if d > max_km:
+                        continue
+                    count += 1
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d, count, obj))
+                    elif d < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d, count, obj))
+        return [(-d, obj) for d, _, obj in sorted(heap, key=lambda item: -item[0])]
@@ -4,95 +4,144 @@ import json
 import random
 import logging
 from pathlib import Path
-from datetime import datetime
+from core.database import Session, ThemeHistory
 
 logger = logging.getLogger(__name__)
 
+# kind -> (히스토리 키, 보관 개수)
+HISTORY_KINDS = {
+    'source': ('recent_sources', 5),
+    'region': ('recent_regions', 3),
+    'series': ('recent_series', 5),
+}
+
 
 class ThemeSelector:
     TRAIL_SERIES = ['남파랑길', '서해랑길', '해파랑길', '동해랑길', 'DMZ평화의길']
-    
-    def __init__(self, themes: dict, history_file: Path):
+
+    def __init__(self, themes: dict, history_file: Path = None):
+        """
+        Args:
+            history_file: 예전 JSON 히스토리 - DB 히스토리가 비어 있을 때 한 번 가져옴
+        """
         self.themes = themes
         self.history_file = history_file
-        self.history_file.parent.mkdir(parents=True, exist_ok=True)
-    
+        self._history = None
+
     def _load_history(self) -> dict:
+        """히스토리 (DB에서 처음 한 번만 읽고 이후에는 메모리 사본 사용)"""
+        if self._history is None:
+            history = {key: [] for key, _ in HISTORY_KINDS.values()}
+            try:
+                with Session() as session:
+                    rows = session.query(ThemeHistory).order_by(ThemeHistory.id).all()
+                    if not rows:
+                        rows = self._import_legacy(session)
+                for row in rows:
+                    if row.kind in HISTORY_KINDS:
+                        history[HISTORY_KINDS[row.kind][0]].append(row.value)
+            except Exception as e:
+                logger.warning(f"히스토리 로드 실패: {e}")
+            for key, limit in HISTORY_KINDS.values():
+                history[key] = history[key][-limit:]
+            self._history = history
+        return self._history
+
+    def _import_legacy(self, session) -> list:
+        if not self.history_file or not self.history_file.exists():
+            return []
+        with open(self.history_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        rows = [ThemeHistory(kind=kind, value=value)
+                for kind, (key, _) in HISTORY_KINDS.items() for value in data.get(key, [])]
+        session.add_all(rows)
+        session.commit()
+        logger.info(f"히스토리 가져오기: {self.history_file} ({len(rows)}건)")
+        return rows
+
+    def _save_history(self, source: str = None, region: str = None, series: str = None, session=None):
+        """히스토리 추가
+
+        Args:
+            session: 주어지면 그 트랜잭션에 추가만 하고 커밋은 호출자가 함
+        """
+        history = self._load_history()
+        values = {'source': source, 'region': region, 'series': series}
+        rows = [ThemeHistory(kind=kind, value=value) for kind, value in values.items() if value]
+        if not rows:
+            return
+
         try:
-            if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 필수 키 보장
-                    if 'recent_sources' not in data:
-                        data['recent_sources'] = []
-                    if 'recent_regions' not in data:
-                        data['recent_regions'] = []
-                    if 'recent_series' not in data:
-                        data['recent_series'] = []
-                    return data
-        except Exception as e:
-            logger.warning(f"히스토리 로드 실패: {e}")
-        return {'recent_sources': [], 'recent_regions': [], 'recent_series': []}
-    
-    def _save_history(self, source: str = None, region: str = None, series: str = None):
-        try:
-            history = self._load_history()
-            
-            if source:
-                history['recent_sources'].append(source)
-                history['recent_sources'] = history['recent_sources'][-5:]
-            
-            if region:
-                history['recent_regions'].append(region)
-                history['recent_regions'] = history['recent_regions'][-3:]
-            
-            if series:
-                history['recent_series'].append(series)
-                history['recent_series'] = history['recent_series'][-5:]
-            
-            history['last_updated'] = datetime.now().isoformat()
-            
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(history, f, ensure_ascii=False, indent=2)
+            if session is not None:
+                session.add_all(rows)
+            else:
+                with Session() as own:
+                    own.add_all(rows)
+                    own.commit()
         except Exception as e:
             logger.warning(f"히스토리 저장 실패: {e}")
-    
+            return
+
+        for row in rows:
+            key, limit = HISTORY_KINDS[row.kind]
+            history[key] = (history[key] + [row.value])[-limit:]
+
+    def recent(self) -> dict:
+        """최근 사용 기록 사본 {'recent_sources': [...], 'recent_regions': [...], 'recent_series': [...]}"""
+        return {key: list(values) for key, values in self._load_history().items()}
+
+    def record(self, source: str = None, region: str = None, series: str = None, session=None):
+        """사용 기록 추가 (session이 주어지면 커밋은 호출자가 함)"""
+        self._save_history(source=source, region=region, series=series, session=session)
+
     def get_excluded_regions(self) -> list:
         history = self._load_history()
         return history.get('recent_regions', [])[-2:]
-    
+
     def get_excluded_series(self) -> list:
         history = self._load_history()
         return history.get('recent_series', [])[-3:]
-    
-    def record_usage(self, region: str, title: str):
-        series = None
-        for s in self.TRAIL_SERIES:
-            if s in title:
-                series = s
-                break
-        
-        self._save_history(region=region, series=series)
-    
-    def select(self) -> dict:
+
+    def get_excluded_sources(self) -> list:
         history = self._load_history()
-        recent = history.get('recent_sources', [])
+        return history.get('recent_sources', [])[-1:]
+
+    def series_of(self, title: str):
+        for s in self.TRAIL_SERIES:
+            if s in (title or ''):
+                return s
+        return None
+
+    def record_usage(self, region: str, title: str, session=None):
+        self._save_history(region=region, series=self.series_of(title), session=session)
+
+    def select(self, record: bool = True) -> dict:
+        """소스/테마 선택
+
+        Args:
+            record: False면 히스토리에 남기지 않음 (후보만 뽑고 확정 시 commit 호출)
+        """
         all_sources = list(self.themes.keys())
-        
-        exclude = recent[-1:] if recent else []
+
+        exclude = self.get_excluded_sources()
         available = [s for s in all_sources if s not in exclude]
-        
+
         if not available:
             available = all_sources
             logger.info("모든 소스 최근 사용됨, 전체에서 선택")
-        
+
         source = random.choice(available)
-        theme_data = random.choice(self.themes[source])
+        theme_data = dict(random.choice(self.themes[source]))
         theme_data['source'] = source
-        
-        self._save_history(source=source)
-        
+
+        if record:
+            self.commit(theme_data)
+
         logger.info(f"선택: {theme_data.get('theme')} (소스: {source})")
         logger.info(f"제외된 소스: {exclude}")
-        
+
         return theme_data
+
+    def commit(self, theme_data: dict, session=None):
+        """선택 확정 - 히스토리에 소스 기록"""
+        self._save_history(source=theme_data.get('source'), session=session)
@@ -1,6 +1,84 @@
-"""네이버 스타일 제목 생성기 v4.4 - 어디가좋을까 제거"""
+"""네이버 스타일 제목 생성기 v4.5 - 조합 공간 열거 + 사용한 제목 영구 기록
+
+- (지역, 테마, 시기, 개수)마다 PATTERNS x 필드 값의 전체 조합을 정수 인덱스로 열거
+- 인덱스를 무작위로 뽑아 아직 쓰지 않은 조합만 채택 (사용 여부는 해시 집합으로 O(1) 확인)
+- 사용한 제목의 해시는 SQLite에 남겨 다음 실행에서도 중복을 피함
+- 최근 제목과 글자 3-gram이 너무 겹치는 제목(개수만 다른 제목 등)도 제외
+"""
 import random
+import hashlib
+import logging
+import threading
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from string import Formatter
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from core.database import Session, UsedTitle
+
+logger = logging.getLogger(__name__)
+
+RECENT_TITLES = 50  # 유사도를 비교할 최근 제목 수
+SIMILARITY_LIMIT = 0.7  # 3-gram 자카드 유사도가 이 이상이면 비슷한 제목
+DRAW_TRIES = 20  # 무작위 추첨 횟수 (모두 실패하면 순회)
+
+
+def title_key(title: str) -> str:
+    return ''.join(title.split())
+
+
+def title_hash(title: str) -> int:
+    """공백을 뺀 제목의 64비트 해시 (SQLite INTEGER 범위)"""
+    digest = hashlib.blake2b(title_key(title).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def trigrams(title: str) -> frozenset:
+    key = title_key(title)
+    return frozenset(key[i:i + 3] for i in range(max(1, len(key) - 2)))
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TitleSpace:
+    """제목 조합 공간 - 정수 인덱스 하나를 제목으로 바로 변환
+
+    패턴마다 실제로 쓰는 필드만 혼합 기수(mixed radix)로 펼치므로,
+    패턴에 없는 필드 때문에 같은 제목이 여러 인덱스에 중복되지 않습니다.
+    """
+
+    def __init__(self, patterns: tuple, fields: dict):
+        self.parts = []  # (시작 인덱스, 패턴, [(필드명, 값 목록)])
+        size = 0
+        for pattern in patterns:
+            names = dict.fromkeys(name for _, name, _, _ in Formatter().parse(pattern) if name)
+            dims = [(name, fields[name]) for name in names]
+            self.parts.append((size, pattern, dims))
+            count = 1
+            for _, values in dims:
+                count *= len(values)
+            size += count
+        self.size = size
+        self._starts = [start for start, _, _ in self.parts]
+
+    def title(self, index: int) -> str:
+        start, pattern, dims = self.parts[bisect_right(self._starts, index) - 1]
+        rest = index - start
+        values = {}
+        for name, options in dims:
+            rest, i = divmod(rest, len(options))
+            values[name] = options[i]
+        return pattern.format(**values)
+
+
+@lru_cache(maxsize=256)
+def _title_space(patterns: tuple, fields: tuple) -> TitleSpace:
+    return TitleSpace(patterns, dict(fields))
 
 
 class TitleGenerator:
@@ -59,83 +137,126 @@ class TitleGenerator:
     }
     
     def __init__(self):
-        self.used_titles = []
+        self.used_titles = deque(maxlen=RECENT_TITLES)  # 최근 제목
+        self._recent = deque(maxlen=RECENT_TITLES)  # 최근 제목의 3-gram 집합
+        self._used = None  # 사용한 제목 해시 (DB에서 처음 한 번만 읽음)
+        self._lock = threading.Lock()
+    
+    # ===== 필드 값 =====
     
-    def _get_seasonal_time(self) -> str:
-        month = datetime.now().month
-        if random.random() < 0.7:
-            return random.choice(self.SEASON_TIME.get(month, self.TIME))
-        return random.choice(self.TIME)
+    def _time_pools(self) -> list:
+        """시기 표현 후보 - 70%는 이번 달 표현, 30%는 공통 표현을 먼저 시도"""
+        seasonal = tuple(self.SEASON_TIME.get(datetime.now().month, self.TIME))
+        pools = [seasonal, tuple(self.TIME)]
+        if random.random() >= 0.7:
+            pools.reverse()
+        return pools
     
-    def _get_location(self, do_name: str, sigungu: str) -> str:
+    def _location_options(self, do_name: str, sigungu: str) -> tuple:
         if not sigungu or sigungu == 'nan':
-            return do_name
-        
-        is_si = sigungu.endswith('시')
+            return (do_name,)
         
-        if is_si:
-            options = [
+        if sigungu.endswith('시'):
+            return (
                 sigungu,
                 f"{sigungu} 근처",
                 f"{sigungu} 주변",
                 f"{sigungu} 인근",
                 f"{do_name} {sigungu}",
-            ]
-        else:
-            options = [
-                sigungu,
-                f"{do_name} {sigungu}",
-            ]
-        
-        return random.choice(options)
+            )
+        return (
+            sigungu,
+            f"{do_name} {sigungu}",
+        )
     
-    def _get_facility(self, theme: str) -> str:
+    def _facility_options(self, theme: str) -> tuple:
         if theme and theme in self.FACILITY_MAP:
-            return random.choice(self.FACILITY_MAP[theme])
-        return theme if theme else '캠핑장'
+            return tuple(self.FACILITY_MAP[theme])
+        return (theme if theme else '캠핑장',)
+    
+    def _action_options(self, count: int) -> tuple:
+        return tuple(a.format(count=count) for a in self.ACTION_WITH_NUM) + tuple(self.ACTION_NO_NUM)
+    
+    def space(self, do_name: str, theme: str = None, count: int = 5, sigungu: str = None,
+              times: tuple = None) -> TitleSpace:
+        """(지역, 테마, 시기, 개수)의 전체 제목 조합 (같은 조건이면 캐시 재사용)"""
+        fields = (
+            ('time', times or tuple(self.SEASON_TIME.get(datetime.now().month, self.TIME))),
+            ('location', self._location_options(do_name, sigungu)),
+            ('mood', tuple(self.MOOD)),
+            ('facility', self._facility_options(theme)),
+            ('action', self._action_options(count)),
+            ('count', (count,)),
+        )
+        return _title_space(tuple(self.PATTERNS), fields)
+    
+    # ===== 사용 이력 =====
+    
+    def _load_used(self) -> set:
+        if self._used is None:
+            used = set()
+            try:
+                with Session() as session:
+                    used.update(h for (h,) in session.query(UsedTitle.hash))
+                    recent = (session.query(UsedTitle.title)
+                              .order_by(UsedTitle.created_at.desc()).limit(RECENT_TITLES).all())
+                for (title,) in reversed(recent):
+                    self._remember(title)
+            except Exception as e:
+                logger.warning(f"제목 이력 로드 실패: {e}")
+            self._used = used
+        return self._used
+    
+    def _remember(self, title: str):
+        self.used_titles.append(title)
+        self._recent.append(trigrams(title))
+    
+    def _mark_used(self, title: str):
+        h = title_hash(title)
+        self._used.add(h)
+        self._remember(title)
+        try:
+            with Session() as session:
+                session.execute(sqlite_insert(UsedTitle).values(hash=h, title=title).on_conflict_do_nothing())
+                session.commit()
+        except Exception as e:
+            logger.warning(f"제목 이력 저장 실패: {e}")
+    
+    def is_fresh(self, title: str) -> bool:
+        """한 번도 쓰지 않았고 최근 제목과도 충분히 다른 제목인지"""
+        if title_hash(title) in self._load_used():
+            return False
+        grams = trigrams(title)
+        return all(similarity(grams, r) < SIMILARITY_LIMIT for r in self._recent)
+    
+    # ===== 생성 =====
+    
+    def _draw(self, space: TitleSpace):
+        """남은 조합에서 균등 추첨, 없으면 None (공간이 거의 소진됐으면 무작위 시작점부터 순회)"""
+        for _ in range(DRAW_TRIES):
+            title = space.title(random.randrange(space.size))
+            if self.is_fresh(title):
+                return title
+        
+        start = random.randrange(space.size)
+        for offset in range(space.size):
+            title = space.title((start + offset) % space.size)
+            if title_hash(title) not in self._used and self.is_fresh(title):
+                return title
+        return None
     
     def generate(self, do_name: str, theme: str = None, count: int = None, sigungu: str = None) -> str:
         if count is None:
             count = random.randint(3, 6)
         
-        location = self._get_location(do_name, sigungu) if sigungu else do_name
-        time = self._get_seasonal_time()
-        mood = random.choice(self.MOOD)
-        facility = self._get_facility(theme)
-        
-        if random.random() < 0.5:
-            action = random.choice(self.ACTION_WITH_NUM).format(count=count)
-        else:
-            action = random.choice(self.ACTION_NO_NUM)
-        
-        pattern = random.choice(self.PATTERNS)
-        title = pattern.format(
-            time=time,
-            location=location,
-            mood=mood,
-            facility=facility,
-            action=action,
-            count=count
-        )
-        
-        attempts = 0
-        while title in self.used_titles and attempts < 10:
-            pattern = random.choice(self.PATTERNS)
-            mood = random.choice(self.MOOD)
-            facility = self._get_facility(theme)
-            title = pattern.format(
-                time=time,
-                location=location,
-                mood=mood,
-                facility=facility,
-                action=action,
-                count=count
-            )
-            attempts += 1
-        
-        self.used_titles.append(title)
-        if len(self.used_titles) > 10:
-            self.used_titles.pop(0)
+        spaces = [self.space(do_name, theme, count, sigungu, times) for times in self._time_pools()]
+        with self._lock:
+            self._load_used()
+            title = next((t for t in map(self._draw, spaces) if t), None)
+            if title is None:
+                logger.info(f"남은 제목 조합 없음 ({do_name} {sigungu or ''} {theme or ''}), 사용한 조합 재사용")
+                title = spaces[0].title(random.randrange(spaces[0].size))
+            self._mark_used(title)
         
         return title
     
@@ -1,10 +1,19 @@
 # core/tour_api.py
 """한국관광공사 TourAPI 연동 모듈"""
 
-import requests
+import os
+import math
+import logging
 from typing import Optional
 from pathlib import Path
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 import yaml
+from core import http_client
+from core.api_response import decode, from_payload, Page, TourItem
+from core.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
 
 
 class TourAPI:
@@ -28,11 +37,31 @@ class TourAPI:
         "전북": 37, "전남": 38, "제주": 39
     }
     
-    def __init__(self, service_key: str):
+    # 엔드포인트별 응답 캐시 유효 기간
+    CACHE_TTL = {
+        "searchKeyword1": timedelta(hours=6),
+        "areaBasedList1": timedelta(hours=24),
+        "detailCommon1": timedelta(days=7),
+    }
+    
+    def __init__(self, service_key: str, workers: int = 6, cache: ResponseCache = None):
+        """
+        Args:
+            workers: 페이지/상세 병렬 조회 워커 수 (호출 속도는 http_client의 공유 예산이 제한)
+        """
         self.service_key = service_key
         self.base_url = "http://apis.data.go.kr/B551011/KorService1"
+        self.workers = workers
+        self._cache = cache or ResponseCache('kor_service', self.CACHE_TTL)
     
-    def _request(self, endpoint: str, params: dict) -> dict:
+    def _request(self, endpoint: str, params: dict, use_cache: bool = True) -> Page:
+        if use_cache:
+            cached = self._cache.get(endpoint, params)
+            if cached is not None:
+                return from_payload(cached, TourItem)
+            if http_client.cache_only('kor_service'):
+                return self._stale_or_raise(endpoint, params)
+        
         default_params = {
             "serviceKey": self.service_key,
             "MobileOS": "ETC",
@@ -42,16 +71,50 @@ class TourAPI:
         params.update(default_params)
         
         url = f"{self.base_url}/{endpoint}"
-        response = requests.get(url, params=params, timeout=30)
+        try:
+            response = http_client.get('kor_service', url, params=params, timeout=30)
+        except (http_client.QuotaExceeded, http_client.CircuitOpen) as e:
+            if not use_cache:
+                raise
+            return self._stale_or_raise(endpoint, params, e)
         response.raise_for_status()
         
-        data = response.json()
+        page = decode(response.content, TourItem)
         
-        if data.get("response", {}).get("header", {}).get("resultCode") != "0000":
-            error_msg = data.get("response", {}).get("header", {}).get("resultMsg", "Unknown error")
-            raise Exception(f"API Error: {error_msg}")
+        if not page.ok:
+            raise Exception(f"API Error: {page.message or 'Unknown error'}")
         
-        return data
+        if use_cache:
+            self._cache.set(endpoint, params, page.payload())
+        return page
+    
+    def _stale_or_raise(self, endpoint: str, params: dict, error: Exception = None) -> Page:
+        """할당량 부족/서킷 열림 시 기한이 지난 캐시라도 사용"""
+        stale = self._cache.get(endpoint, params, allow_stale=True)
+        if stale is None:
+            if isinstance(error, http_client.CircuitOpen):
+                raise error
+            raise http_client.QuotaExceeded(f"KorService 할당량 부족, 캐시 없음: {endpoint}")
+        logger.info(f"{error or '할당량 부족'} - 캐시 응답 사용: {endpoint}")
+        return from_payload(stale, TourItem)
+    
+    def fetch_all_pages(self, endpoint: str, params: dict, num_of_rows: int = 100,
+                        max_pages: Optional[int] = None) -> list:
+        """목록 엔드포인트 전체 페이지 조회 - 첫 페이지로 전체 건수를 확인한 뒤 나머지를 병렬 조회"""
+        def page(page_no):
+            return self._request(endpoint, {**params, "numOfRows": num_of_rows, "pageNo": page_no})
+        
+        first = page(1)
+        pages = math.ceil(first.total / num_of_rows) if first.total else 1
+        if max_pages:
+            pages = min(pages, max_pages)
+        
+        items = list(first.items)
+        if pages > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for result in pool.map(page, range(2, pages + 1)):
+                    items.extend(result.items)
+        return items
     
     def search_keyword(
         self,
@@ -72,13 +135,7 @@ class TourAPI:
         if area_code:
             params["areaCode"] = area_code
         
-        data = self._request("searchKeyword1", params)
-        items = data.get("response", {}).get("body", {}).get("items", {})
-        
-        if not items:
-            return []
-        
-        return items.get("item", [])
+        return self._request("searchKeyword1", params).items
     
     def get_area_based_list(
         self,
@@ -96,13 +153,7 @@ class TourAPI:
         if content_type:
             params["contentTypeId"] = content_type
         
-        data = self._request("areaBasedList1", params)
-        items = data.get("response", {}).get("body", {}).get("items", {})
-        
-        if not items:
-            return []
-        
-        return items.get("item", [])
+        return self._request("areaBasedList1", params).items
     
     def get_detail_common(self, content_id: str) -> dict:
         params = {
@@ -113,21 +164,59 @@ class TourAPI:
             "overviewYN": "Y"
         }
         
-        data = self._request("detailCommon1", params)
-        items = data.get("response", {}).get("body", {}).get("items", {})
+        items = self._request("detailCommon1", params).items
+        return items[0] if items else {}
+    
+    def search_keyword_all(self, keyword: str, content_type: Optional[int] = None,
+                           area_code: Optional[int] = None, max_pages: Optional[int] = None) -> list:
+        params = {"keyword": keyword}
+        if content_type:
+            params["contentTypeId"] = content_type
+        if area_code:
+            params["areaCode"] = area_code
+        return self.fetch_all_pages("searchKeyword1", params, max_pages=max_pages)
+    
+    def get_area_based_all(self, area_code: int, content_type: Optional[int] = None,
+                           max_pages: Optional[int] = None) -> list:
+        params = {"areaCode": area_code, "arrange": "Q"}
+        if content_type:
+            params["contentTypeId"] = content_type
+        return self.fetch_all_pages("areaBasedList1", params, max_pages=max_pages)
+    
+    def get_details(self, content_ids: list) -> dict:
+        """여러 contentId의 공통정보를 워커 풀로 병렬 조회 - {contentId: 상세}"""
+        ids = list(dict.fromkeys(str(c) for c in content_ids if c))
         
-        if not items:
-            return {}
+        def fetch(content_id):
+            try:
+                return self.get_detail_common(content_id)
+            except Exception as e:
+                logger.warning(f"상세 조회 실패({content_id}): {e}")
+                return {}
         
-        item_list = items.get("item", [])
-        return item_list[0] if item_list else {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return dict(zip(ids, pool.map(fetch, ids)))
+    
+    def enrich_overviews(self, items: list, id_key: str = "contentid") -> list:
+        """개요/대표 이미지가 비어 있는 항목을 상세 정보로 채움 (항목을 직접 수정)"""
+        missing = [item for item in items if item.get(id_key) and not item.get("overview")]
+        details = self.get_details([item[id_key] for item in missing])
+        for item in missing:
+            detail = details.get(str(item[id_key])) or {}
+            if detail.get("overview"):
+                item["overview"] = detail["overview"]
+            if not item.get("firstimage") and detail.get("firstimage"):
+                item["firstimage"] = detail["firstimage"]
+        return items
 
 
 def load_api_client() -> TourAPI:
     config_path = Path(__file__).parent.parent / "config" / "settings.yaml"
     
     with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.safe_load(f) or {}
     
-    service_key = config["tour_api"]["service_key"]
-    return TourAPI(service_key)
+    service_key = (config.get("tour_api") or {}).get("service_key") or os.getenv('TOUR_API_KEY')
+    if not service_key:
+        raise ValueError("TOUR_API_KEY가 .env에 설정되지 않았습니다.")
+    return TourAPI(service_key, workers=int(os.getenv('TOUR_API_WORKERS', '6')))
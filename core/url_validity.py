@@ -0,0 +1,184 @@
+"""이미지 URL 유효성 캐시 - HEAD 검사 결과를 저장해 다시 검사하지 않음
+
+- 유효한 URL은 VALID_TTL, 실패한 URL은 INVALID_TTL 동안 네트워크 없이 결과 재사용
+- TTL이 지난 유효 URL은 ETag/Last-Modified 조건부 요청으로 재검증 (304면 갱신만)
+- 연결 오류가 HOST_FAILURE_LIMIT번 이어진 호스트는 HOST_DEAD_FOR 동안 검사 없이 실패 처리
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from core import http_client
+from core.database import Session, UrlCheck, HostHealth
+from core.image_ranker import host_of
+from core.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+VALID_TTL = timedelta(days=7)
+INVALID_TTL = timedelta(days=1)
+HOST_FAILURE_LIMIT = 3
+HOST_DEAD_FOR = timedelta(hours=1)
+
+
+def _as_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class UrlValidityCache:
+    """프로세스 메모리 + SQLite 2단계 캐시 (여러 스레드에서 동시에 호출 가능)"""
+
+    def __init__(self, valid_ttl: timedelta = VALID_TTL, invalid_ttl: timedelta = INVALID_TTL):
+        self.valid_ttl = valid_ttl
+        self.invalid_ttl = invalid_ttl
+        self._memo = {}  # url -> (valid, 만료 시각)
+        self._dead = {}  # host -> dead_until
+        self._failures = {}  # host -> 연속 연결 실패 수
+        self._lock = threading.Lock()
+        self._hosts_loaded = False
+
+    # ===== 호스트 음성 캐시 =====
+
+    def _load_hosts(self):
+        with Session() as session:
+            rows = session.query(HostHealth).filter(HostHealth.dead_until > datetime.utcnow()).all()
+        with self._lock:
+            self._dead.update({r.host: r.dead_until for r in rows})
+            self._hosts_loaded = True
+
+    def is_host_dead(self, host: str) -> bool:
+        if not self._hosts_loaded:
+            self._load_hosts()
+        until = self._dead.get(host)
+        return until is not None and until > datetime.utcnow()
+
+    def _host_result(self, host: str, ok: bool):
+        """호스트 응답 여부 기록 - 연결 실패가 이어지면 일정 시간 차단 (차단 상태만 DB에 저장)"""
+        if not host:
+            return
+        with self._lock:
+            if ok:
+                self._failures.pop(host, None)
+                return
+            failures = self._failures[host] = self._failures.get(host, 0) + 1
+            if failures < HOST_FAILURE_LIMIT:
+                return
+            del self._failures[host]
+            now = datetime.utcnow()
+            dead_until = self._dead[host] = now + HOST_DEAD_FOR
+
+        logger.info(f"호스트 일시 차단: {host} ({failures}회 연속 연결 실패)")
+        try:
+            stmt = sqlite_insert(HostHealth).values(host=host, failures=failures, dead_until=dead_until, updated_at=now)
+            with Session() as session:
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=['host'],
+                    set_={'failures': stmt.excluded.failures, 'dead_until': stmt.excluded.dead_until,
+                          'updated_at': stmt.excluded.updated_at},
+                ))
+                session.commit()
+        except Exception as e:
+            logger.warning(f"호스트 차단 기록 실패({host}): {e}")
+
+    # ===== URL 검사 =====
+
+    def _ttl(self, valid: bool) -> timedelta:
+        return self.valid_ttl if valid else self.invalid_ttl
+
+    def _remember(self, url: str, valid: bool, checked_at: datetime):
+        with self._lock:
+            self._memo[url] = (valid, checked_at + self._ttl(valid))
+
+    def _save(self, url: str, host: str, **fields):
+        """검사 결과 기록 - 실패해도 검사 결과는 그대로 돌려주도록 경고만 남김"""
+        try:
+            stmt = sqlite_insert(UrlCheck).values(url=url, host=host, **fields)
+            with Session() as session:
+                session.execute(stmt.on_conflict_do_update(
+                    index_elements=['url'], set_={k: stmt.excluded[k] for k in ('host', *fields)},
+                ))
+                session.commit()
+        except Exception as e:
+            logger.warning(f"URL 검사 결과 저장 실패({url}): {e}")
+
+    def is_valid(self, url: str) -> bool:
+        """URL이 200으로 응답하는 이미지인지 (캐시 우선)"""
+        if not url:
+            return False
+        now = datetime.utcnow()
+
+        memo = self._memo.get(url)
+        if memo and memo[1] > now:
+            record_cache('url_validity', True)
+            return memo[0]
+
+        host = host_of(url)
+        if self.is_host_dead(host):
+            record_cache('url_validity', True)
+            return False
+
+        with Session() as session:
+            row = session.get(UrlCheck, url)
+        if row is not None and row.checked_at + self._ttl(row.valid) > now:
+            record_cache('url_validity', True)
+            self._remember(url, row.valid, row.checked_at)
+            return row.valid
+        record_cache('url_validity', False)
+
+        headers = {}
+        if row is not None and row.valid:
+            if row.etag:
+                headers['If-None-Match'] = row.etag
+            if row.last_modified:
+                headers['If-Modified-Since'] = row.last_modified
+
+        try:
+            resp = http_client.head('image_head', url, timeout=5, allow_redirects=True, headers=headers or None)
+        except (http_client.QuotaExceeded, http_client.CircuitOpen):
+            return False
+        except Exception as e:
+            logger.debug(f"이미지 URL 검사 실패({url}): {e}")
+            self._host_result(host, ok=False)
+            return False
+        self._host_result(host, ok=True)
+
+        if resp.status_code == 304 and headers:
+            self._save(url, host, checked_at=now)
+            self._remember(url, True, now)
+            return True
+
+        valid = resp.status_code == 200
+        self._save(
+            url, host,
+            valid=valid,
+            status=resp.status_code,
+            content_type=resp.headers.get('Content-Type'),
+            content_length=_as_int(resp.headers.get('Content-Length')),
+            etag=resp.headers.get('ETag'),
+            last_modified=resp.headers.get('Last-Modified'),
+            checked_at=now,
+        )
+        self._remember(url, valid, now)
+        return valid
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def load_url_validity() -> UrlValidityCache:
+    """프로세스 공용 인스턴스"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = UrlValidityCache()
+    return _cache
+
+
+def is_valid(url: str) -> bool:
+    return load_url_validity().is_valid(url)
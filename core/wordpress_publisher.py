@@ -1,26 +1,299 @@
+"""WordPress REST API 발행 모듈 - 세션 재사용 + 미디어 업로드 + 멱등성"""
+
 import os
+import re
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import yaml
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
+from core import http_client
+from core.database import Session, PublishLog
+from core.image_optimizer import load_optimizer
+from core.metrics import record_cache
+from core.publishers import Publisher
+from core.retry import sleep_backoff, parse_retry_after
 
 load_dotenv()
+logger = logging.getLogger(__name__)
+
+IMG_SRC_PATTERN = re.compile(r'(<img\b[^>]*\bsrc=")([^"]+)(")', re.IGNORECASE)
+
 
-class WordPressPublisher:
-    def __init__(self):
-        self.site_url = os.getenv('WP_SITE_URL', '').rstrip('/')
+class WordPressPublisher(Publisher):
+    name = 'wordpress'
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+    # 다시 보내도 결과가 같은 요청 - 연결 오류/타임아웃/5xx에도 그대로 재전송
+    IDEMPOTENT_METHODS = {'GET', 'HEAD'}
+    MEDIA_WORKERS = 4
+
+    def __init__(self, site_url: str = None, default_category=None,
+                 default_status: str = 'draft', session: requests.Session = None):
+        """
+        Args:
+            site_url: 사이트 주소 (없으면 WP_SITE_URL, 로컬 REST 스텁 주소도 가능)
+            default_category: 기본 카테고리 ID 또는 이름 (최초 1회만 조회)
+            default_status: 기본 발행 상태
+            session: 재사용할 requests 세션
+        """
+        self.site_url = (site_url or os.getenv('WP_SITE_URL', '')).rstrip('/')
         self.username = os.getenv('WP_USERNAME')
         self.password = os.getenv('WP_APP_PASSWORD')
-        self.auth = HTTPBasicAuth(self.username, self.password)
+        self.default_category = default_category
+        self.default_status = default_status
+        self.optimizer = load_optimizer()
+
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.MEDIA_WORKERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.auth = HTTPBasicAuth(self.username, self.password)
+
+        self._term_cache = {}
+        self._term_lock = threading.Lock()
+        self._media_cache = {}
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.site_url}/wp-json/wp/v2"
+
+    def _request(self, method: str, path: str, max_retries: int = 3, **kwargs) -> requests.Response:
+        """REST 요청 (keep-alive 세션, 일시 오류 시 지수 백오프)
+
+        GET/HEAD만 연결 오류/타임아웃/5xx에 그대로 재전송합니다. 그 밖의 메서드는 서버가 이미
+        처리했을 수 있으므로 처리 전에 거절된 429만 재전송하고, 나머지는 _post가 원격 상태를 확인합니다.
+        """
+        kwargs.setdefault('timeout', 30)
+        url = f"{self.api_url}/{path.lstrip('/')}"
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+
+        for attempt in range(max_retries):
+            try:
+                resp = http_client.request('wordpress', method, url, session=self.session, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not idempotent or attempt == max_retries - 1:
+                    raise
+                delay = sleep_backoff(attempt)
+                logger.warning(f"WP 연결 실패, {delay:.1f}초 후 재시도: {e}")
+                continue
+
+            retryable = resp.status_code == 429 or (idempotent and resp.status_code in self.RETRYABLE_STATUS)
+            if retryable and attempt < max_retries - 1:
+                delay = sleep_backoff(attempt, retry_after=parse_retry_after(resp.headers.get('Retry-After')))
+                logger.warning(f"WP {resp.status_code} 응답, {delay:.1f}초 후 재시도")
+                continue
+
+            resp.raise_for_status()
+            return resp
+
+    def _post(self, path: str, find, max_retries: int = 3, **kwargs) -> dict:
+        """POST 요청 - 응답 없이 실패하면 find()로 원격에 이미 만들어졌는지 확인한 뒤에만 다시 보냄
+
+        Args:
+            find: () -> 이미 만들어진 리소스 dict 또는 None
+        """
+        for attempt in range(max_retries):
+            try:
+                return self._request('POST', path, **kwargs).json()
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                response = getattr(e, 'response', None)
+                if attempt == max_retries - 1 or (response is not None and response.status_code < 500):
+                    raise
+                existing = find()
+                if existing:
+                    logger.info(f"WP {path} 요청은 실패했지만 원격에 이미 생성됨 - 재전송 생략")
+                    return existing
+                delay = sleep_backoff(attempt)
+                logger.warning(f"WP {path} 생성 실패, {delay:.1f}초 후 재시도: {e}")
+
+    # ===== 분류(카테고리/태그) =====
+
+    def _resolve_term(self, taxonomy: str, value) -> int:
+        """카테고리/태그 이름을 ID로 변환 (없으면 생성, 결과는 캐시)"""
+        if value is None or value == '':
+            return None
+        if isinstance(value, int) or str(value).isdigit():
+            return int(value)
+
+        key = (taxonomy, value)
+        with self._term_lock:
+            record_cache('wp_terms', key in self._term_cache)
+            if key in self._term_cache:
+                return self._term_cache[key]
+
+            def find():
+                resp = self._request('GET', taxonomy, params={'search': value, 'per_page': 100})
+                return next((t for t in resp.json() if t.get('name') == value), None)
+
+            term = find() or self._post(taxonomy, find, json={'name': value})
+            term_id = term['id']
+
+            self._term_cache[key] = term_id
+            return term_id
+
+    # ===== 미디어 =====
+
+    def upload_media(self, source_url: str) -> dict:
+        """원격 이미지를 WebP로 최적화해 /wp/v2/media에 업로드
+
+        Returns:
+            {'id': 미디어 ID, 'url': 업로드된 URL} 또는 실패 시 None
+        """
+        record_cache('wp_media', source_url in self._media_cache)
+        if source_url in self._media_cache:
+            return self._media_cache[source_url]
+
+        data = self.optimizer.optimize(source_url)
+        if not data:
+            return None
 
-    def create_post(self, title, content, status='draft'):
+        stem = hashlib.md5(source_url.encode('utf-8')).hexdigest()
+        filename = stem + '.webp'
+        try:
+            media = self._post(
+                'media', lambda: self._find_remote_media(stem),
+                data=data,
+                headers={
+                    'Content-Type': 'image/webp',
+                    'Content-Disposition': f'attachment; filename="{filename}"'
+                },
+                timeout=60
+            )
+        except requests.RequestException as e:
+            logger.warning(f"미디어 업로드 실패 ({source_url}): {e}")
+            return None
+
+        result = {'id': media.get('id'), 'url': media.get('source_url')}
+        self._media_cache[source_url] = result
+        return result
+
+    def upload_images(self, content: str) -> tuple:
+        """본문의 외부 이미지를 병렬 업로드하고 src를 업로드 URL로 교체
+
+        Returns:
+            (치환된 본문, 업로드된 미디어 ID 리스트)
+        """
+        sources = []
+        for match in IMG_SRC_PATTERN.finditer(content):
+            src = match.group(2)
+            if src.startswith('http') and not src.startswith(self.site_url) and src not in sources:
+                sources.append(src)
+
+        if not sources:
+            return content, []
+
+        with ThreadPoolExecutor(max_workers=self.MEDIA_WORKERS) as pool:
+            uploaded = dict(zip(sources, pool.map(self.upload_media, sources)))
+
+        def replace(match):
+            media = uploaded.get(match.group(2))
+            if media and media.get('url'):
+                return f"{match.group(1)}{media['url']}{match.group(3)}"
+            return match.group(0)
+
+        media_ids = [m['id'] for m in uploaded.values() if m]
+        logger.info(f"WP 미디어 업로드: {len(media_ids)}/{len(sources)}")
+        return IMG_SRC_PATTERN.sub(replace, content), media_ids
+
+    def _find_remote_media(self, stem: str) -> dict:
+        """이전 시도에서 응답 없이 업로드된 미디어 찾기 (파일 이름이 원본 URL 해시)"""
+        resp = self._request('GET', 'media', params={'search': stem, 'per_page': 10})
+        for media in resp.json():
+            if stem in (media.get('source_url') or ''):
+                return media
+        return None
+
+    # ===== 포스트 =====
+
+    def _make_idempotency_key(self, title: str, content: str) -> str:
+        return hashlib.sha256(f"{title}\n{content}".encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _marker(key: str) -> str:
+        """본문 끝에 붙이는 숨은 표식 - 원격 글이 이 멱등 키로 만든 글인지 확인용"""
+        return f"<!-- tap:{key} -->"
+
+    def _find_remote_post(self, title: str, key: str) -> dict:
+        """이전 시도에서 응답 없이 생성된 글 찾기
+
+        제목이 같아도 본문에 이 멱등 키의 표식이 없으면 (제목이 겹치는 예전 글) 무시합니다.
+        """
+        resp = self._request('GET', 'posts', params={
+            'search': title, 'status': 'draft,publish,future,pending,private', 'context': 'edit'
+        })
+        marker = self._marker(key)
+        for post in resp.json():
+            if post.get('title', {}).get('raw') == title and marker in post.get('content', {}).get('raw', ''):
+                return post
+        return None
+
+    def create_post(self, title, content, labels=None, is_draft=None, status=None,
+                    idempotency_key=None):
+        """포스트 생성
+
+        status를 직접 주지 않으면 is_draft(True: draft / False: publish),
+        둘 다 없으면 설정의 default_status를 사용합니다.
+        같은 idempotency_key(기본: 제목+본문 해시)로 다시 호출하면
+        새 글을 만들지 않고 기존 결과를 돌려줍니다.
+        """
+        if status is None and is_draft is not None:
+            status = 'draft' if is_draft else 'publish'
         if not all([self.site_url, self.username, self.password]):
             raise ValueError("WP 설정 환경 변수가 부족합니다.")
-        
-        url = f"{self.site_url}/wp-json/wp/v2/posts"
-        data = {'title': title, 'content': content, 'status': status}
-        resp = requests.post(url, auth=self.auth, json=data)
-        resp.raise_for_status()
-        return resp.json()
+
+        key = idempotency_key or self._make_idempotency_key(title, content)
+        with Session() as session:
+            log = session.query(PublishLog).filter_by(target=self.name, idempotency_key=key).first()
+            if log and log.status == 'done':
+                logger.info(f"WP 이미 발행됨 (멱등 키 일치): {log.url}")
+                return {'id': log.remote_id, 'link': log.url, 'url': log.url, 'duplicate': True}
+
+            if log:
+                # 이전 시도가 응답 전에 끊긴 경우 원격에 이미 생성됐는지 확인
+                post = self._find_remote_post(title, key)
+                if post:
+                    log.remote_id, log.url, log.status = str(post['id']), post.get('link'), 'done'
+                    session.commit()
+                    return {'id': log.remote_id, 'link': log.url, 'url': log.url, 'duplicate': True}
+            else:
+                log = PublishLog(target=self.name, idempotency_key=key, status='pending')
+                session.add(log)
+                session.commit()
+
+            content, media_ids = self.upload_images(content)
+
+            data = {'title': title, 'content': f"{content}\n{self._marker(key)}",
+                    'status': status or self.default_status}
+            category_id = self._resolve_term('categories', self.default_category)
+            if category_id:
+                data['categories'] = [category_id]
+            if labels:
+                data['tags'] = [t for t in (self._resolve_term('tags', label) for label in labels) if t]
+            if media_ids:
+                data['featured_media'] = media_ids[0]
+
+            post = self._post('posts', lambda: self._find_remote_post(title, key), json=data)
+
+            log.remote_id, log.url, log.status = str(post.get('id')), post.get('link'), 'done'
+            session.commit()
+
+        logger.info(f"WP 발행 완료: {post.get('link')}")
+        post['url'] = post.get('link')
+        return post
+
 
 def load_publisher():
-    return WordPressPublisher()
+    config_path = Path(__file__).parent.parent / "config" / "settings.yaml"
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+
+    wp = config.get('wordpress', {})
+    return WordPressPublisher(
+        default_category=wp.get('default_category'),
+        default_status=wp.get('default_status', 'draft')
+    )
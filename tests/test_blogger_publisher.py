@@ -0,0 +1,252 @@
+"""BloggerPublisher 배치 요청 - 로컬 가짜 Blogger 엔드포인트로 검증
+
+google-api-python-client에 포함된 Blogger v3 discovery 문서의 rootUrl만 로컬 서버로 바꿔
+실제 클라이언트 코드(단건 요청, multipart/mixed 배치 요청)를 그대로 사용합니다.
+"""
+
+import json
+import email.parser
+import threading
+import unittest
+from unittest import mock
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httplib2
+import googleapiclient
+from googleapiclient.discovery import build_from_document
+
+from core import blogger_publisher
+from core.blogger_publisher import BloggerPublisher
+
+DISCOVERY = Path(googleapiclient.__file__).parent / 'discovery_cache' / 'documents' / 'blogger.v3.json'
+BOUNDARY = 'fake_blogger_boundary'
+
+
+def _error(status: int, reason: str) -> tuple:
+    return status, {'error': {'code': status, 'message': reason, 'errors': [{'reason': reason}]}}
+
+
+class FakeBlogger:
+    """Blogger posts.insert / posts.publish / posts.list를 흉내 내는 로컬 서버
+
+    scripted: 요청 순서대로 꺼내 쓸 (상태, 본문[, 반영 여부]) 목록 - 비면 성공 응답.
+              세 번째 값이 True면 글은 실제로 만들고 응답만 오류로 보냄 (응답 유실)
+    drop: True면 배치 요청에 응답하지 않고 연결을 끊음 (전송 오류)
+    """
+
+    def __init__(self):
+        self.scripted = []
+        self.drop = False
+        self.batches = 0
+        self.requests = []
+        self.posts = {}
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests.append(('GET', self.path))
+                    items = list(fake.posts.values())
+                fake._write(self, 200, 'application/json', json.dumps({'items': items}).encode('utf-8'))
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if self.path.startswith('/batch'):
+                    fake._batch(self, body)
+                else:
+                    status, data = fake._handle('POST', self.path, body)
+                    fake._write(self, status, 'application/json', json.dumps(data).encode('utf-8'))
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def service(self):
+        document = json.loads(DISCOVERY.read_text(encoding='utf-8'))
+        document['rootUrl'] = self.url
+        return build_from_document(document, http=httplib2.Http())
+
+    def _handle(self, method: str, path: str, body: bytes) -> tuple:
+        with self._lock:
+            self.requests.append((method, path))
+            if not self.scripted:
+                return 200, self._apply(path, body)
+            status, data, *commit = self.scripted.pop(0)
+            if commit and commit[0]:
+                self._apply(path, body)
+            return status, data
+
+    def _apply(self, path: str, body: bytes) -> dict:
+        if path.split('?')[0].endswith('/publish'):
+            post_id = path.split('/posts/')[1].split('/')[0]
+            post = dict(self.posts.get(post_id, {'id': post_id, 'title': ''}), status='LIVE')
+        else:
+            post_id = str(len(self.posts) + 1)
+            post = dict(json.loads(body or b'{}'), id=post_id, status='DRAFT')
+        post['url'] = f"https://fake.blogspot.com/{post_id}.html"
+        self.posts[post_id] = post
+        return post
+
+    def _batch(self, handler, body: bytes):
+        with self._lock:
+            self.batches += 1
+        if self.drop:
+            handler.close_connection = True
+            return
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {handler.headers['Content-Type']}\r\n\r\n".encode('utf-8') + body)
+        parts = []
+        for part in message.get_payload():
+            content_id = part['Content-ID'].strip('<>')
+            request = part.get_payload()
+            head, _, payload = request.partition('\r\n\r\n') if '\r\n\r\n' in request else request.partition('\n\n')
+            method, path, _ = head.splitlines()[0].split(' ', 2)
+            status, data = self._handle(method, path, payload.encode('utf-8'))
+            parts.append(
+                f"--{BOUNDARY}\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n{json.dumps(data)}\r\n"
+            )
+        content = (''.join(parts) + f"--{BOUNDARY}--\r\n").encode('utf-8')
+        self._write(handler, 200, f'multipart/mixed; boundary={BOUNDARY}', content)
+
+    @staticmethod
+    def _write(handler, status: int, content_type: str, content: bytes):
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+
+class BloggerBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeBlogger()
+        self.addCleanup(self.fake.close)
+        patches = [
+            mock.patch.dict('os.environ', {'BLOGGER_BLOG_ID': '123'}),
+            mock.patch.object(blogger_publisher, 'sleep_backoff', return_value=0.0),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.publisher = BloggerPublisher(service=self.fake.service())
+
+    def _sent(self, method: str) -> int:
+        return sum(1 for m, _ in self.fake.requests if m == method)
+
+    def _posts(self, n: int) -> list:
+        return [{'title': f"글 {i}", 'content': f"<p>{i}</p>", 'labels': ['캠핑']} for i in range(n)]
+
+    def test_create_posts_in_one_round_trip(self):
+        results = self.publisher.create_posts(self._posts(3))
+
+        self.assertEqual(self.fake.batches, 1)
+        self.assertEqual([r['title'] for r in results], ['글 0', '글 1', '글 2'])
+        self.assertTrue(all(r['status'] == 'draft' and r['url'] for r in results))
+
+    def test_batch_size_splits_requests(self):
+        results = self.publisher.create_posts(self._posts(5), batch_size=2)
+
+        self.assertEqual(self.fake.batches, 3)
+        self.assertEqual(len(self.fake.posts), 5)
+        self.assertEqual(len(results), 5)
+
+    def test_retries_only_transient_failures(self):
+        self.fake.scripted = [_error(503, 'backendError'), (200, {'id': '90', 'title': '글 1', 'url': 'u'})]
+
+        results = self.publisher.create_posts(self._posts(2))
+
+        self.assertEqual(self.fake.batches, 2)
+        self.assertEqual(self._sent('POST'), 3)
+        self.assertEqual([r['status'] for r in results], ['draft', 'draft'])
+
+    def test_quota_error_aborts_batch(self):
+        self.fake.scripted = [_error(403, 'dailyLimitExceeded'), _error(503, 'backendError')]
+
+        results = self.publisher.create_posts(self._posts(3), batch_size=2)
+
+        self.assertEqual(self.fake.batches, 1)
+        self.assertEqual([r['status'] for r in results], ['failed'] * 3)
+        self.assertTrue(all('dailyLimitExceeded' in r['error'] for r in results))
+
+    def test_gives_up_after_max_retries(self):
+        self.fake.scripted = [_error(429, 'rateLimitExceeded')] * 3
+
+        results = self.publisher.create_posts(self._posts(1), max_retries=3)
+
+        self.assertEqual(self.fake.batches, 3)
+        self.assertEqual(results[0]['status'], 'failed')
+
+    def test_transport_error_returns_per_post_failures(self):
+        self.fake.drop = True
+
+        results = self.publisher.create_posts(self._posts(2))
+
+        self.assertEqual([r['status'] for r in results], ['failed', 'failed'])
+        self.assertTrue(all(r['error'] for r in results))
+
+    def test_publish_drafts(self):
+        created = self.publisher.create_posts(self._posts(2))
+
+        results = self.publisher.publish_drafts([r['id'] for r in created])
+
+        self.assertEqual([r['status'] for r in results], ['published', 'published'])
+        self.assertEqual({p['status'] for p in self.fake.posts.values()}, {'LIVE'})
+
+    def test_create_post_retries_single_request(self):
+        self.fake.scripted = [_error(500, 'backendError')]
+
+        result = self.publisher.create_post('단건', '<p>본문</p>')
+
+        self.assertEqual(self._sent('POST'), 2)
+        self.assertEqual(self._sent('GET'), 1)
+        self.assertEqual(result['status'], 'draft')
+
+    def test_create_post_does_not_duplicate_after_lost_response(self):
+        self.fake.scripted = [_error(503, 'backendError') + (True,)]
+
+        result = self.publisher.create_post('단건', '<p>본문</p>')
+
+        self.assertEqual(self._sent('POST'), 1)
+        self.assertEqual(len(self.fake.posts), 1)
+        self.assertEqual(result['id'], '1')
+
+    def test_rate_limited_insert_is_resent_without_lookup(self):
+        self.fake.scripted = [_error(429, 'rateLimitExceeded')]
+
+        result = self.publisher.create_post('단건', '<p>본문</p>')
+
+        self.assertEqual(self._sent('POST'), 2)
+        self.assertEqual(self._sent('GET'), 0)
+        self.assertEqual(result['status'], 'draft')
+
+    def test_batch_does_not_duplicate_after_lost_response(self):
+        self.fake.scripted = [_error(503, 'backendError') + (True,)]
+
+        results = self.publisher.create_posts(self._posts(2))
+
+        self.assertEqual(self.fake.batches, 1)
+        self.assertEqual(len(self.fake.posts), 2)
+        self.assertEqual([r['status'] for r in results], ['draft', 'draft'])
+
+    def test_same_title_without_marker_is_not_adopted(self):
+        self.fake.posts['1'] = {'id': '1', 'title': '단건', 'content': '<p>예전 글</p>', 'url': 'u'}
+        self.fake.scripted = [_error(503, 'backendError')]
+
+        result = self.publisher.create_post('단건', '<p>본문</p>')
+
+        self.assertEqual(self._sent('POST'), 2)
+        self.assertNotEqual(result['id'], '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
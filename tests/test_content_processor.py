@@ -0,0 +1,67 @@
+"""단일 패스 후처리 - bench/legacy.py의 이전 구현과 출력 비교
+
+섹션마다 제목이 h3에 들어 있는 문서는 이전 구현과 출력이 같아야 합니다.
+이전 DOTALL '.*?' 패턴은 h3 밖의 본문까지 걸쳐 매칭했지만, 새 구현은 하나의 h3 안에서만
+찾으므로 그런 문서는 의도적으로 출력이 다릅니다 (엉뚱한 섹션에 이미지를 넣지 않음).
+"""
+
+import random
+import unittest
+
+from bench import legacy
+from bench.standins import FakeAIWriter
+from core.content_processor import insert_images_and_links, clean_content
+from core.content_generator import ContentGenerator
+
+
+class _StaticImageHandler:
+    def get_image(self, item, region='', theme=''):
+        return item.get('image', '')
+
+
+def _items(rng: random.Random, count: int) -> list:
+    items = []
+    for i in range(count):
+        items.append({
+            'title': f"{rng.choice(['솔숲', '별빛', '계곡', '호수'])}{i:02d} {rng.choice(['캠핑장', '글램핑', '오토캠핑장'])}",
+            'addr': rng.choice([f'경기 가평군 {i}', '', 'nan', '주소 정보 없음']),
+            'map_url': rng.choice(['https://map.invalid', '']),
+            'image': rng.choice([f'https://img.invalid/{i}.jpg', '', 'ftp://img.invalid/x.jpg']),
+        })
+    return items
+
+
+class SinglePassTest(unittest.TestCase):
+    def setUp(self):
+        self.generator = ContentGenerator()
+        self.generator._image_handler = _StaticImageHandler()
+
+    def test_matches_legacy_when_titles_are_in_headings(self):
+        rng = random.Random(32)
+        for _ in range(30):
+            items = _items(rng, rng.randint(1, 8))
+            raw = FakeAIWriter(paragraphs=rng.randint(1, 3)).generate_full_content(
+                rng.sample(items, len(items)), '글램핑', '경기 가평군', '럭셔리 캠핑')
+
+            self.assertEqual(
+                clean_content(insert_images_and_links(raw, items, '경기', '글램핑')),
+                legacy.clean_content(legacy.insert_images_and_links(raw, items, '경기', '글램핑')))
+            self.assertEqual(
+                self.generator.process_html(raw, items, '글램핑', '경기'),
+                legacy.process_html(_StaticImageHandler(), raw, items, '글램핑', '경기'))
+
+    def test_match_no_longer_spans_sections(self):
+        items = [{'title': '솔숲 캠핑장', 'addr': '경기 가평군 1', 'map_url': 'https://map.invalid',
+                  'image': 'https://img.invalid/1.jpg'}]
+        raw = ('<h3>첫 번째 추천</h3>\n<p>솔숲 캠핑장은 조용합니다.</p>\n'
+               '<h3>두 번째 추천</h3>\n<p>본문</p>')
+
+        # 이전 구현은 본문의 언급부터 다음 </h3>까지 걸쳐 매칭해 엉뚱한 섹션에 이미지를 넣음
+        old = legacy.insert_images_and_links(raw, items, '경기', '글램핑')
+        self.assertIn('<h3>두 번째 추천</h3>\n<figure>', old)
+
+        self.assertEqual(insert_images_and_links(raw, items, '경기', '글램핑'), raw)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""WordPressPublisher - 로컬 가짜 WP REST 엔드포인트로 검증
+
+requests 세션과 http_client를 그대로 거쳐 /wp-json/wp/v2의 media, categories, tags, posts
+엔드포인트를 흉내 내는 로컬 서버에 요청합니다. 발행 기록(PublishLog)은 임시 DB에 씁니다.
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core import http_client, wordpress_publisher
+from core.circuit_breaker import BreakerRegistry
+from core.database import Base, PublishLog
+from core.wordpress_publisher import WordPressPublisher
+
+API = '/wp-json/wp/v2/'
+
+
+class FakeWordPress:
+    """WP REST API (media / categories / tags / posts)를 흉내 내는 로컬 서버
+
+    lose: {경로: 횟수} - 해당 경로의 POST는 처리(생성)한 뒤 응답 없이 연결을 끊음 (응답 유실)
+    """
+
+    def __init__(self):
+        self.lose = {}
+        self.requests = []
+        self.terms = {'categories': [], 'tags': []}
+        self.media = []
+        self.posts = []
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fake._serve(self, 'GET', b'')
+
+            def do_POST(self):
+                fake._serve(self, 'POST', self.rfile.read(int(self.headers.get('Content-Length') or 0)))
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def sent(self, method: str, path: str) -> int:
+        return sum(1 for r in self.requests if r == (method, path))
+
+    def _serve(self, handler, method: str, body: bytes):
+        parsed = urlparse(handler.path)
+        path = parsed.path[len(API):]
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        with self._lock:
+            self.requests.append((method, path))
+            if method == 'GET':
+                data = self._list(path, query.get('search', ''))
+            elif path == 'media':
+                data = self._upload(handler.headers['Content-Disposition'].split('filename="')[1].rstrip('"'))
+            else:
+                data = self._create(path, json.loads(body or b'{}'))
+            if method == 'POST' and self.lose.get(path):
+                self.lose[path] -= 1
+                handler.close_connection = True
+                return
+        content = json.dumps(data).encode('utf-8')
+        handler.send_response(201 if method == 'POST' else 200)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(content)))
+        handler.end_headers()
+        handler.wfile.write(content)
+
+    def _list(self, path: str, search: str) -> list:
+        if path in self.terms:
+            return [t for t in self.terms[path] if search in t['name']]
+        if path == 'media':
+            return [m for m in self.media if search in m['source_url']]
+        return [p for p in self.posts if search in p['title']['raw']]
+
+    def _upload(self, filename: str) -> dict:
+        media = {'id': 100 + len(self.media), 'source_url': f"{self.url}/wp-content/uploads/{filename}"}
+        self.media.append(media)
+        return media
+
+    def _create(self, path: str, data: dict) -> dict:
+        if path in self.terms:
+            term = {'id': len(self.terms['categories']) + len(self.terms['tags']) + 1, 'name': data['name']}
+            self.terms[path].append(term)
+            return term
+        post_id = 200 + len(self.posts)
+        post = dict(data, id=post_id, link=f"{self.url}/?p={post_id}",
+                    title={'raw': data['title']}, content={'raw': data['content']})
+        self.posts.append(post)
+        return post
+
+
+class WordPressPublisherTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeWordPress()
+        self.addCleanup(self.fake.close)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        engine = create_engine(f"sqlite:///{tmp.name}/tap.db")
+        self.addCleanup(engine.dispose)
+        Base.metadata.create_all(engine)
+        self.Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+        patches = [
+            mock.patch.dict('os.environ', {'WP_USERNAME': 'editor', 'WP_APP_PASSWORD': 'secret'}),
+            mock.patch.object(wordpress_publisher, 'Session', self.Session),
+            mock.patch.object(wordpress_publisher, 'sleep_backoff', return_value=0.0),
+            mock.patch.object(http_client, 'breakers', BreakerRegistry(persist=False)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.publisher = WordPressPublisher(site_url=self.fake.url, default_category='캠핑')
+        self.publisher.optimizer = mock.Mock()
+        self.publisher.optimizer.optimize.return_value = b'RIFF....WEBP'
+
+    def test_uploads_images_and_rewrites_src(self):
+        content = ('<p><img src="https://img.example.com/a.jpg"></p>'
+                   '<p><img src="https://img.example.com/b.jpg"><img src="https://img.example.com/a.jpg"></p>')
+
+        post = self.publisher.create_post('캠핑장 소개', content)
+
+        self.assertEqual(self.fake.sent('POST', 'media'), 2)
+        body = self.fake.posts[0]['content']['raw']
+        self.assertNotIn('img.example.com', body)
+        self.assertEqual(body.count(f"{self.fake.url}/wp-content/uploads/"), 3)
+        self.assertEqual(self.fake.posts[0]['featured_media'], self.fake.media[0]['id'])
+        self.assertEqual(post['url'], self.fake.posts[0]['link'])
+
+    def test_terms_are_resolved_once(self):
+        self.publisher.create_post('첫 글', '<p>1</p>', labels=['차박', '계곡'])
+        self.publisher.create_post('둘째 글', '<p>2</p>', labels=['계곡', '차박'])
+
+        self.assertEqual(self.fake.sent('GET', 'categories'), 1)
+        self.assertEqual(self.fake.sent('POST', 'tags'), 2)
+        self.assertEqual(self.fake.sent('GET', 'tags'), 2)
+        self.assertEqual(self.fake.posts[0]['tags'], self.fake.posts[1]['tags'][::-1])
+
+    def test_rerun_with_same_key_does_not_post_again(self):
+        first = self.publisher.create_post('같은 글', '<p>본문</p>', idempotency_key='job-1')
+        second = self.publisher.create_post('같은 글', '<p>본문</p>', idempotency_key='job-1')
+
+        self.assertEqual(self.fake.sent('POST', 'posts'), 1)
+        self.assertTrue(second['duplicate'])
+        self.assertEqual(second['id'], str(first['id']))
+
+    def test_lost_post_response_is_reconciled(self):
+        self.fake.lose['posts'] = 1
+
+        post = self.publisher.create_post('끊긴 글', '<p>본문</p>')
+
+        self.assertEqual(self.fake.sent('POST', 'posts'), 1)
+        self.assertEqual(len(self.fake.posts), 1)
+        self.assertEqual(post['id'], self.fake.posts[0]['id'])
+        with self.Session() as session:
+            self.assertEqual(session.query(PublishLog).one().status, 'done')
+
+    def test_same_title_from_older_post_is_not_adopted(self):
+        self.fake.posts.append({'id': 1, 'link': 'old', 'title': {'raw': '겹치는 제목'},
+                                'content': {'raw': '<p>예전 글</p>'}})
+        self.fake.lose['posts'] = 1
+
+        post = self.publisher.create_post('겹치는 제목', '<p>새 글</p>')
+
+        self.assertEqual(self.fake.sent('POST', 'posts'), 1)
+        self.assertEqual(len(self.fake.posts), 2)
+        self.assertNotEqual(post['id'], 1)
+        self.assertIn('새 글', post['content']['raw'])
+
+
+if __name__ == '__main__':
+    unittest.main()